@@ -1,7 +1,7 @@
 # Useful property variants for Python programming.
 #
 # Author: Peter Odding <peter@peterodding.com>
-# Last Change: March 2, 2020
+# Last Change: October 18, 2026
 # URL: https://property-manager.readthedocs.io
 
 """
@@ -67,13 +67,35 @@ related enhancements:
   :func:`repr()` output by setting the :attr:`~custom_property.repr` option to
   :data:`False`.
 
+- Metadata about the properties of a class is available without creating an
+  instance, using :func:`PropertyManager.property_schema()`.
+
+- Pickled and copied objects don't include cached values that can be
+  recomputed (refer to the :attr:`~custom_property.persistent` option).
+
+- Callbacks can be notified when property values are assigned or reset using
+  :func:`PropertyManager.observe()`, optionally batched using
+  :func:`PropertyManager.batch_updates()`.
+
+- Assignments and resets can be tracked so that only changed properties need
+  to be saved (refer to :attr:`PropertyManager.track_changes`).
+
+- Cached values can be cleared automatically when the properties they were
+  computed from change, even when those properties belong to other objects
+  (refer to the :attr:`~custom_property.track_dependencies` option).
+
 Logging
 =======
 
-The :mod:`property_manager` module emits log messages at the custom log level
+Operations on properties are reported as structured :class:`PropertyEvent`
+objects to the callables registered using :func:`subscribe()`. When no one
+subscribes no events are created, so this doesn't slow down your code.
+
+The :func:`log_event()` subscriber emits log messages at the custom log level
 :data:`~verboselogs.SPAM` which is considered *more* verbose than :mod:`DEBUG
-<logging>`, so if you want these messages to be logged make sure they're not
-being ignored based on their level.
+<logging>`. These log messages are not enabled by default (because of
+performance), if you want them to be logged call ``subscribe(log_event)`` and
+make sure they're not being ignored based on their level.
 
 Classes
 =======
@@ -82,9 +104,16 @@ Classes
 """
 
 # Standard library modules.
+import collections
+import contextlib
+import copy
 import os
 import sys
 import textwrap
+import threading
+import timeit
+import types
+import weakref
 
 try:
     # Python 3.3 and newer.
@@ -93,10 +122,17 @@ except ImportError:
     # Python 2.7.
     from collections import Hashable
 
+try:
+    # Python 3.4 and newer.
+    from dis import get_instructions
+except ImportError:
+    # Python 2.7.
+    get_instructions = None
+
 # External dependencies.
 from humanfriendly import coerce_boolean
 from humanfriendly.text import compact, concatenate, format, pluralize
-from verboselogs import VerboseLogger
+from verboselogs import SPAM, VerboseLogger
 
 try:
     # Check if `basestring' is defined (Python 2).
@@ -138,6 +174,167 @@ docstrings that no one is going to look at seems rather pointless :-).
 NOTHING = object()
 """A unique object instance used to detect missing attributes."""
 
+REPR_MODE = 'computed'
+"""
+The default way in which :func:`PropertyManager.render_properties()` gets values (a string).
+
+With the default value ``'computed'`` properties are evaluated, which means
+lazy computations may be triggered by a :func:`repr()` call. When this is
+``'cached'`` only values that are already present in the
+:attr:`~object.__dict__` of the object (i.e. assigned or cached values) are
+rendered and other properties are marked as ``<not computed>``. This can be
+overridden per class using :attr:`PropertyManager.repr_mode`.
+"""
+
+REPR_LIMIT = None
+"""
+The maximum length of the :func:`repr()` of individual values (an integer or :data:`None`).
+
+Values whose :func:`repr()` is longer are truncated by
+:func:`PropertyManager.render_properties()`. The default (:data:`None`)
+disables truncation. This can be overridden per class using
+:attr:`PropertyManager.repr_limit`.
+"""
+
+HOOKS = ()
+"""
+A tuple with the callables that receive :class:`PropertyEvent` objects.
+
+Use :func:`subscribe()` and :func:`unsubscribe()` to change the subscribers.
+Because :class:`custom_property` only checks whether this tuple is nonempty
+before creating events, hooks are practically free when no one subscribes.
+"""
+
+STATISTICS = None
+"""
+The active :class:`PropertyStatistics` object (or :data:`None`).
+
+This is :data:`None` until :func:`enable_statistics()` is called, which
+subscribes the :class:`PropertyStatistics` object to :data:`HOOKS`.
+"""
+
+CACHE_EPOCH = 0
+"""
+The number of times :func:`invalidate_all()` has been called (an integer).
+
+Objects remember the value of this counter in their :attr:`~object.__dict__`
+(see :data:`CACHE_EPOCH_ATTRIBUTE`) when their cached values are validated.
+When the remembered value is lower than the current value an invalidation
+happened since then, which means cached values may be stale.
+"""
+
+CACHE_EPOCH_ATTRIBUTE = '__property_manager_epoch__'
+"""The name of the instance attribute that stores the validated :data:`CACHE_EPOCH` (a string)."""
+
+FROZEN_ATTRIBUTE = '__property_manager_frozen__'
+"""
+The name of the instance attribute that marks frozen objects (a string).
+
+The value of this attribute is a tuple with the precomputed
+:attr:`~PropertyManager.key_values` and :func:`hash()` of the object (see
+:func:`PropertyManager.freeze()`).
+"""
+
+INTERNED_ATTRIBUTE = '__property_manager_interned__'
+"""The name of the instance attribute that marks interned objects (a string, see :attr:`PropertyManager.interned`)."""
+
+INTERNED_INSTANCES = weakref.WeakKeyDictionary()
+"""
+A mapping of classes to :class:`weakref.WeakValueDictionary` objects.
+
+The keys of the weak value dictionaries are :attr:`~PropertyManager.key_values`
+and the values are the live instances with those key values (see
+:attr:`PropertyManager.interned`).
+"""
+
+REPR_ATTRIBUTE = '__property_manager_repr__'
+"""The name of the instance attribute that stores the rendered :func:`repr()` of key property objects (a string)."""
+
+OBSERVERS_ATTRIBUTE = '__property_manager_observers__'
+"""
+The name of the instance attribute that stores the observers of an object (a string).
+
+The value of this attribute is a tuple of tuples with a callback and a
+:class:`frozenset` of property names (or :data:`None` to observe all
+properties). It only exists while the object has observers, so that
+:func:`custom_property.__set__()` can skip change notifications for objects
+without observers using a single dictionary lookup (see
+:func:`PropertyManager.observe()`).
+"""
+
+BATCH_ATTRIBUTE = '__property_manager_batch__'
+"""
+The name of the instance attribute that stores pending change notifications (a string).
+
+The value of this attribute is a list with the nesting depth of
+:func:`PropertyManager.batch_updates()` and a :class:`~collections.OrderedDict`
+that maps property names to pending :class:`PropertyChange` objects.
+"""
+
+DIRTY_ATTRIBUTE = '__property_manager_dirty__'
+"""
+The name of the instance attribute that stores changed properties (a string).
+
+The value of this attribute is a dictionary that maps the names of properties
+that were assigned or reset since the last checkpoint to their values at the
+checkpoint (:data:`NOTHING` when no value was assigned, see
+:attr:`PropertyManager.track_changes`).
+"""
+
+DEPENDENTS_ATTRIBUTE = '__property_manager_dependents__'
+"""
+The name of the instance attribute that stores dependent cached values (a string).
+
+The value of this attribute is a dictionary that maps the names of properties
+to dictionaries whose values are tuples with a weak reference to an object and
+the name of a cached property of that object whose value was computed from the
+property (see :attr:`custom_property.track_dependencies`).
+"""
+
+DEPENDENCY_TRACKING = 0
+"""
+The number of computations that are currently recording dependencies (an integer).
+
+While this is zero :func:`custom_property.__get__()` doesn't need to call
+:func:`record_dependency()`, so properties that don't use the
+:attr:`~custom_property.track_dependencies` option don't slow down reads.
+"""
+
+DEPENDENCY_FRAMES = threading.local()
+"""
+Thread local storage for the dependencies recorded by :func:`compute_with_dependencies()`.
+
+The ``stack`` attribute of this object is a list with a dictionary for each
+computation in the current thread that's recording dependencies.
+"""
+
+GLOBAL_INVALIDATION = 0
+"""The value of :data:`CACHE_EPOCH` after the most recent global invalidation (an integer)."""
+
+CLASS_INVALIDATIONS = weakref.WeakKeyDictionary()
+"""A mapping of classes to the value of :data:`CACHE_EPOCH` after their most recent invalidation."""
+
+INVALIDATION_LOCK = threading.Lock()
+"""Serializes updates of :data:`CACHE_EPOCH` by :func:`invalidate_all()`."""
+
+TRIVIAL_INSTRUCTIONS = (
+    [('LOAD_CONST', None), ('RETURN_VALUE', None)],
+    [('RETURN_CONST', None)],
+)
+"""
+The instructions of getters that don't do anything (a tuple of lists).
+
+Getters like the one below (common for :class:`required_property` and
+:class:`key_property`) compile to one of these sequences of (opcode, argument)
+pairs and can't provide a default value (see :func:`provides_default()`):
+
+.. code-block:: python
+
+   @required_property
+   def name(self):
+       "The name of the object."
+"""
+
 CUSTOM_PROPERTY_NOTE = compact("""
     The :attr:`{name}` property is a :class:`~{type}`.
 """)
@@ -220,15 +417,812 @@ def clear_property(obj, name):
     obj.__dict__.pop(name, None)
 
 
+def clear_state(obj):
+    """
+    Clear all assigned and cached values of an object.
+
+    :param obj: The object that owns the properties.
+
+    This function empties the :attr:`~object.__dict__` of the given object.
+    When :data:`HOOKS` are subscribed a ``'reset'`` event is dispatched for
+    each cached value that's cleared. Cached values of other objects that
+    were computed from the values of this object are cleared as well (see
+    :func:`invalidate_dependents()`) and values that hold on to external
+    resources are released (see :func:`custom_property.release()`).
+    """
+    storage = obj.__dict__
+    schema = inspect_properties(type(obj))
+    if HOOKS:
+        for name in schema.resettable_cached_properties:
+            if name in storage:
+                dispatch_event(obj, getattr(type(obj), name), 'reset')
+    if DEPENDENTS_ATTRIBUTE in storage:
+        for name in list(storage[DEPENDENTS_ATTRIBUTE]):
+            invalidate_dependents(obj, name)
+    for name in schema.releasable_properties:
+        if name in storage:
+            getattr(type(obj), name).discard_value(obj)
+    storage.clear()
+
+
 def format_property(obj, name):
     """
     Format an object property's dotted name.
 
-    :param obj: The object that owns the property.
+    :param obj: The object (or class) that owns the property.
     :param name: The name of the property (a string).
     :returns: The dotted path (a string).
     """
-    return "%s.%s" % (obj.__class__.__name__, name)
+    return "%s.%s" % ((obj if isinstance(obj, type) else obj.__class__).__name__, name)
+
+
+def format_type(value):
+    """
+    Format the name of a class or the names of a tuple of classes.
+
+    :param value: A class or a tuple of classes.
+    :returns: A human friendly description (a string).
+    """
+    if isinstance(value, tuple):
+        return concatenate([format_type(v) for v in value], conjunction='or')
+    return value.__name__
+
+
+def subscribe(callback):
+    """
+    Subscribe to events about operations on properties.
+
+    :param callback: A callable that will be called with a single
+                     :class:`PropertyEvent` argument for every operation
+                     on a :class:`custom_property`.
+
+    Subscribing the same callback more than once has no effect. Subscribers
+    are called synchronously in the thread that performs the operation, so
+    they should be quick and they shouldn't raise exceptions.
+    """
+    global HOOKS
+    if callback not in HOOKS:
+        HOOKS = HOOKS + (callback,)
+
+
+def unsubscribe(callback):
+    """
+    Stop sending events to a subscriber.
+
+    :param callback: A callable previously given to :func:`subscribe()`.
+    """
+    global HOOKS
+    HOOKS = tuple(h for h in HOOKS if h != callback)
+
+
+def dispatch_event(obj, prop, operation, value=None, duration=None):
+    """
+    Send a :class:`PropertyEvent` to the subscribers in :data:`HOOKS`.
+
+    :param obj: The object that owns the property.
+    :param prop: The :class:`custom_property` object.
+    :param operation: The operation (a string, see :class:`PropertyEvent`).
+    :param value: The value of the property.
+    :param duration: The number of seconds it took to compute the value.
+    """
+    event = PropertyEvent(obj, prop, operation, value, duration)
+    for callback in HOOKS:
+        callback(event)
+
+
+def notify_observers(obj, name, operation, old_value, new_value):
+    """
+    Notify the observers of an object that a property value changed.
+
+    :param obj: The object that owns the property.
+    :param name: The name of the property (a string).
+    :param operation: The operation (the string ``'assigned'`` or ``'reset'``).
+    :param old_value: The value of the property before the operation.
+    :param new_value: The value of the property after the operation.
+
+    Inside :func:`PropertyManager.batch_updates()` the change is recorded
+    instead of delivered, and when the same property changes more than once
+    the changes are coalesced: The old value of the first change is combined
+    with the operation and new value of the last change.
+    """
+    batch = obj.__dict__.get(BATCH_ATTRIBUTE)
+    if batch is not None:
+        pending = batch[1].get(name)
+        if pending is not None:
+            old_value = pending.old_value
+        batch[1][name] = PropertyChange(obj, name, operation, old_value, new_value)
+    else:
+        deliver_changes(obj, [PropertyChange(obj, name, operation, old_value, new_value)])
+
+
+def deliver_changes(obj, changes):
+    """
+    Call the observers of an object with the changes they're interested in.
+
+    :param obj: The object that owns the properties.
+    :param changes: A list of :class:`PropertyChange` objects.
+
+    Changes whose old and new value are equal (for example because an
+    assignment was reverted inside a batch) are not delivered.
+    """
+    changes = [c for c in changes if c.operation == 'reset' or not values_equal(c.old_value, c.new_value)]
+    if changes:
+        for callback, names in obj.__dict__.get(OBSERVERS_ATTRIBUTE, ()):
+            selected = changes if names is None else [c for c in changes if c.name in names]
+            if selected:
+                callback(selected)
+
+
+def values_equal(a, b):
+    """
+    Check whether two property values are equal.
+
+    :param a: The first value.
+    :param b: The second value.
+    :returns: :data:`True` if the values are identical or compare equal,
+              :data:`False` otherwise (also when the comparison fails or
+              doesn't return a boolean, as is the case for arrays).
+    """
+    if a is b:
+        return True
+    try:
+        return (a == b) is True
+    except Exception:
+        return False
+
+
+def compute_with_dependencies(obj, prop, compute):
+    """
+    Compute the value of a property while recording the properties it reads.
+
+    :param obj: The object that owns the property.
+    :param prop: The :class:`custom_property` object.
+    :param compute: A callable that computes the value of the property.
+    :returns: The computed value.
+
+    Each :class:`custom_property` that's read by `compute` (on any object)
+    remembers a weak reference to `obj` (see :data:`DEPENDENTS_ATTRIBUTE`) so
+    that :func:`invalidate_dependents()` can clear the cached value of `prop`
+    when the property that was read changes.
+    """
+    global DEPENDENCY_TRACKING
+    stack = DEPENDENCY_FRAMES.__dict__.setdefault('stack', [])
+    frame = {}
+    stack.append(frame)
+    with INVALIDATION_LOCK:
+        DEPENDENCY_TRACKING += 1
+    try:
+        value = compute()
+    finally:
+        stack.pop()
+        with INVALIDATION_LOCK:
+            DEPENDENCY_TRACKING -= 1
+    edge = (weakref.ref(obj), prop.__name__)
+    for source, name in frame.values():
+        if not (source is obj and name == prop.__name__):
+            dependents = source.__dict__.setdefault(DEPENDENTS_ATTRIBUTE, {})
+            dependents.setdefault(name, {})[(id(obj), prop.__name__)] = edge
+    return value
+
+
+def record_dependency(obj, prop):
+    """
+    Record that a property was read by a computation that's tracking dependencies.
+
+    :param obj: The object that owns the property.
+    :param prop: The :class:`custom_property` object.
+
+    This is called by :func:`custom_property.__get__()` while
+    :data:`DEPENDENCY_TRACKING` is nonzero. Reads in threads that aren't
+    tracking dependencies are ignored.
+    """
+    stack = getattr(DEPENDENCY_FRAMES, 'stack', None)
+    if stack:
+        stack[-1][(id(obj), prop.__name__)] = (obj, prop.__name__)
+
+
+def invalidate_dependents(obj, name):
+    """
+    Clear the cached values that were computed from a property.
+
+    :param obj: The object that owns the property.
+    :param name: The name of the property that changed (a string).
+
+    Cached values are cleared (not recomputed) so the work of recomputing
+    them is deferred until they're used again. Clearing a cached value also
+    clears the values that were computed from it, and so on. The recorded
+    dependencies are forgotten, because they're recorded again when the
+    cached values are recomputed.
+    """
+    pending = [(obj, name)]
+    while pending:
+        source, source_name = pending.pop()
+        dependents = source.__dict__.get(DEPENDENTS_ATTRIBUTE)
+        if dependents:
+            edges = dependents.pop(source_name, None)
+            if not dependents:
+                source.__dict__.pop(DEPENDENTS_ATTRIBUTE, None)
+            for reference, dependent_name in (edges.values() if edges else ()):
+                dependent = reference()
+                if dependent is not None:
+                    prop = getattr(type(dependent), dependent_name)
+                    if prop.discard_value(dependent) is not NOTHING:
+                        backend, key = prop.get_backend(dependent)
+                        if backend is not None:
+                            backend.delete(key)
+                        if HOOKS:
+                            dispatch_event(dependent, prop, 'reset')
+                    pending.append((dependent, dependent_name))
+
+
+def collect_changes(objects, mark_clean=False):
+    """
+    Collect the changed properties of multiple objects.
+
+    :param objects: An iterable of :class:`PropertyManager` objects that track
+                    changes (see :attr:`PropertyManager.track_changes`).
+    :param mark_clean: :data:`True` to call :func:`PropertyManager.mark_clean()`
+                       on each object, :data:`False` otherwise.
+    :returns: A list of tuples with two values each: An object and the
+              dictionary returned by :func:`PropertyManager.get_changes()`.
+              Objects without changes are omitted.
+    """
+    results = []
+    for obj in objects:
+        changes = obj.get_changes()
+        if changes:
+            results.append((obj, changes))
+        if mark_clean:
+            obj.mark_clean()
+    return results
+
+
+def log_event(event):
+    """
+    Log a :class:`PropertyEvent` at the custom log level :data:`~verboselogs.SPAM`.
+
+    :param event: A :class:`PropertyEvent` object.
+
+    To enable logging of property operations use ``subscribe(log_event)``.
+    """
+    if logger.isEnabledFor(SPAM):
+        dotted_name = format_property(event.instance, event.name)
+        if event.operation == 'computed':
+            logger.spam("%s reporting computed value (%r) ..", dotted_name, event.value)
+        elif event.operation == 'cached':
+            logger.spam("%s reporting assigned or cached value (%r) ..", dotted_name, event.value)
+        elif event.operation == 'environment':
+            logger.spam("%s reporting value from environment variable (%r) ..", dotted_name, event.value)
+        elif event.operation == 'assigned':
+            logger.spam("%s assigned value %r ..", dotted_name, event.value)
+        elif event.operation == 'reset':
+            logger.spam("%s cleared assigned or computed value ..", dotted_name)
+
+
+class PropertyEvent(collections.namedtuple('PropertyEvent', 'instance property operation value duration')):
+
+    """
+    Structured information about an operation on a :class:`custom_property`.
+
+    The ``instance`` field is the object that owns the property, ``property``
+    is the :class:`custom_property` object, ``value`` is the value that was
+    read or assigned (:data:`None` for resets) and ``duration`` is the number
+    of seconds it took to compute the value (only available for computed
+    values). The ``operation`` field is one of the following strings:
+
+    ``'computed'``
+     The value of the property was computed by calling the decorated function.
+
+    ``'cached'``
+     An assigned or cached value was returned.
+
+    ``'environment'``
+     The value was taken from an environment variable (see
+     :attr:`~custom_property.environment_variable`).
+
+    ``'assigned'``
+     A new value was assigned to the property.
+
+    ``'reset'``
+     The assigned or cached value of the property was cleared.
+    """
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        """The name of the property (a string)."""
+        return self.property.__name__
+
+
+class PropertyChange(collections.namedtuple('PropertyChange', 'instance name operation old_value new_value')):
+
+    """
+    A change of a property value, as reported to observers (see :func:`PropertyManager.observe()`).
+
+    The ``instance`` field is the object that owns the property, ``name`` is
+    the name of the property and ``operation`` is one of the strings
+    ``'assigned'`` or ``'reset'`` (see :class:`PropertyEvent`). The
+    ``old_value`` field is the assigned or cached value before the change, or
+    :data:`None` when no value was stored (getters aren't called just to
+    report old values). The ``new_value`` field is the assigned
+    value, or :data:`None` for resets (because computing the new value would
+    defeat the purpose of lazy evaluation).
+    """
+
+    __slots__ = ()
+
+
+def invalidate_all(cls=None):
+    """
+    Invalidate the values of resettable cached properties.
+
+    :param cls: The class whose instances should be invalidated (including
+                instances of subclasses) or :data:`None` to invalidate the
+                cached values of all objects.
+
+    This function takes constant time because it doesn't visit any objects, it
+    only increments :data:`CACHE_EPOCH`. Stale values are detected and cleared
+    the next time a resettable cached property of an affected object is
+    accessed. Just like :func:`PropertyManager.clear_cached_properties()` this
+    only affects properties whose :attr:`~custom_property.cached` and
+    :attr:`~custom_property.resettable` options are enabled.
+    """
+    global CACHE_EPOCH, GLOBAL_INVALIDATION
+    with INVALIDATION_LOCK:
+        CACHE_EPOCH += 1
+        if cls is None:
+            GLOBAL_INVALIDATION = CACHE_EPOCH
+        else:
+            CLASS_INVALIDATIONS[cls] = CACHE_EPOCH
+
+
+def refresh_cache_epoch(obj):
+    """
+    Clear cached values that were invalidated by :func:`invalidate_all()`.
+
+    :param obj: The object that owns the cached values.
+    :returns: :data:`True` if cached values were cleared, :data:`False` otherwise.
+
+    This function is called by :class:`custom_property` when the epoch stored
+    in an object is older than :data:`CACHE_EPOCH`.
+    """
+    epoch = CACHE_EPOCH
+    stamp = obj.__dict__.get(CACHE_EPOCH_ATTRIBUTE, 0)
+    cleared = False
+    if invalidated_since(type(obj), stamp):
+        for name in inspect_properties(type(obj)).resettable_cached_properties:
+            prop = getattr(type(obj), name)
+            if prop.discard_value(obj) is not NOTHING:
+                cleared = True
+                # We don't delete the value from the shared table (if any)
+                # because the key of the property has changed: The stale
+                # value can no longer be found and the entry under the new
+                # key may have been computed by another object already.
+                if HOOKS:
+                    dispatch_event(obj, prop, 'reset')
+    obj.__dict__[CACHE_EPOCH_ATTRIBUTE] = epoch
+    return cleared
+
+
+def invalidated_since(cls, epoch):
+    """
+    Check whether :func:`invalidate_all()` affected a class since a given epoch.
+
+    :param cls: The class to check.
+    :param epoch: A value of :data:`CACHE_EPOCH` (an integer).
+    :returns: :data:`True` if the cached values of `cls` were invalidated
+              after `epoch`, :data:`False` otherwise.
+    """
+    return invalidation_epoch(cls) > epoch
+
+
+def invalidation_epoch(cls):
+    """
+    Find the most recent call to :func:`invalidate_all()` that affected a class.
+
+    :param cls: The class to check.
+    :returns: The value of :data:`CACHE_EPOCH` after the most recent
+              invalidation that affected `cls` (an integer, zero when the
+              class was never invalidated).
+    """
+    return max([GLOBAL_INVALIDATION] + [CLASS_INVALIDATIONS.get(c, 0) for c in cls.__mro__])
+
+
+def enable_statistics():
+    """
+    Start counting operations on properties.
+
+    :returns: The active :class:`PropertyStatistics` object.
+
+    After this function has been called :class:`custom_property` records
+    cache hits, cache misses, environment variable overrides, assignments,
+    resets and the time spent computing values. Use :func:`stats()` to get the
+    results. Calling this function when statistics are already enabled doesn't
+    reset the counters.
+    """
+    global STATISTICS
+    if STATISTICS is None:
+        STATISTICS = PropertyStatistics()
+        subscribe(STATISTICS)
+    return STATISTICS
+
+
+def disable_statistics():
+    """Stop counting operations on properties and discard the collected statistics."""
+    global STATISTICS
+    if STATISTICS is not None:
+        unsubscribe(STATISTICS)
+        STATISTICS = None
+
+
+def stats():
+    """
+    Get statistics about operations on properties.
+
+    :returns: A dictionary that maps dotted class names (strings) to
+              dictionaries that map property names (strings) to dictionaries
+              with counters (refer to :func:`PropertyCounters.to_dict()`).
+              When statistics aren't enabled an empty dictionary is returned.
+    """
+    return STATISTICS.snapshot() if STATISTICS is not None else {}
+
+
+class PropertyCounters(object):
+
+    """Counters for a single property of a single class (used by :class:`PropertyStatistics`)."""
+
+    __slots__ = ('hits', 'misses', 'environment', 'assignments', 'resets', 'total_time', 'max_time')
+
+    def __init__(self):
+        """Initialize a :class:`PropertyCounters` object."""
+        self.hits = 0
+        self.misses = 0
+        self.environment = 0
+        self.assignments = 0
+        self.resets = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def to_dict(self):
+        """
+        Get the values of the counters.
+
+        :returns: A dictionary with the keys ``hits`` (the number of times an
+                  assigned or cached value was returned), ``misses`` (the
+                  number of times the value was computed), ``environment``
+                  (the number of times the value was taken from an environment
+                  variable), ``assignments``, ``resets``, ``total_time`` and
+                  ``max_time`` (the total and maximum number of seconds spent
+                  computing values).
+        """
+        return dict((n, getattr(self, n)) for n in self.__slots__)
+
+
+class PropertyStatistics(object):
+
+    """
+    Statistics about operations on properties, grouped by class and property.
+
+    Don't create instances of this class yourself, use
+    :func:`enable_statistics()` instead.
+    """
+
+    def __init__(self):
+        """Initialize a :class:`PropertyStatistics` object."""
+        self.counters = {}
+
+    def get_counters(self, obj, name):
+        """
+        Get the :class:`PropertyCounters` for a property of an object.
+
+        :param obj: The object that owns the property.
+        :param name: The name of the property (a string).
+        :returns: A :class:`PropertyCounters` object.
+        """
+        key = (obj.__class__, name)
+        counters = self.counters.get(key)
+        if counters is None:
+            counters = self.counters.setdefault(key, PropertyCounters())
+        return counters
+
+    def __call__(self, event):
+        """
+        Update the counters based on an event (see :func:`subscribe()`).
+
+        :param event: A :class:`PropertyEvent` object.
+        """
+        counters = self.get_counters(event.instance, event.property.__name__)
+        if event.operation == 'cached':
+            counters.hits += 1
+        elif event.operation == 'computed':
+            counters.misses += 1
+            counters.total_time += event.duration
+            if event.duration > counters.max_time:
+                counters.max_time = event.duration
+        elif event.operation == 'environment':
+            counters.environment += 1
+        elif event.operation == 'assigned':
+            counters.assignments += 1
+        elif event.operation == 'reset':
+            counters.resets += 1
+
+    def snapshot(self):
+        """Get the current statistics (see :func:`stats()`)."""
+        result = {}
+        for (cls, name), counters in list(self.counters.items()):
+            class_name = "%s.%s" % (cls.__module__, cls.__name__)
+            result.setdefault(class_name, {})[name] = counters.to_dict()
+        return result
+
+
+class KeyedCache(object):
+
+    """
+    A bounded, thread safe table of values shared between objects.
+
+    This is the default implementation of the :attr:`~custom_property.backend`
+    option of :class:`custom_property`. When the table is full the least
+    recently used value is discarded. Values can also expire after a given
+    number of seconds. Other backends need to implement the :func:`get()`,
+    :func:`set()` and :func:`delete()` methods.
+
+    Note that values that were already copied to the :attr:`~object.__dict__`
+    of an object remain available to that object after they have been
+    discarded from the table, until the property is reset.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        """
+        Initialize a :class:`KeyedCache` object.
+
+        :param maxsize: The maximum number of values in the table (an integer).
+        :param ttl: The number of seconds after which values expire (a number)
+                    or :data:`None` if values never expire.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        """The number of values in the table (an integer)."""
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """
+        Get a value from the table.
+
+        :param key: The key of the value (a hashable object).
+        :param default: The value to return when the key isn't available.
+        :returns: The value or `default`.
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return default
+            value, expires = entry
+            if expires is not None and expires < timeit.default_timer():
+                return default
+            # Mark the value as the most recently used value.
+            self.entries[key] = entry
+            return value
+
+    def set(self, key, value):
+        """
+        Store a value in the table.
+
+        :param key: The key of the value (a hashable object).
+        :param value: The value to store.
+        """
+        expires = timeit.default_timer() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (value, expires)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Remove a value from the table.
+
+        :param key: The key of the value (a hashable object).
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """Remove all values from the table."""
+        with self.lock:
+            self.entries.clear()
+
+
+SHARED_CACHE = KeyedCache()
+"""
+The :class:`KeyedCache` used by properties whose :attr:`~custom_property.scope` is ``'key'``.
+
+You can change the size of this table by changing its ``maxsize``
+attribute (see :class:`KeyedCache`).
+"""
+
+
+def inspect_properties(cls):
+    """
+    Get the :class:`PropertySchema` of a class.
+
+    :param cls: The class that owns the properties.
+    :returns: A :class:`PropertySchema` object.
+
+    The schema is computed once and then cached in the
+    :attr:`~object.__dict__` of the class. This means it's not updated when
+    properties are added to or removed from a class after the schema has been
+    created (which would be rather unusual).
+    """
+    schema = cls.__dict__.get('_property_schema')
+    if schema is None:
+        schema = PropertySchema.compile(cls)
+        try:
+            setattr(cls, '_property_schema', schema)
+        except TypeError:
+            # Built-in and extension types don't allow new attributes.
+            pass
+    return schema
+
+
+def provides_default(prop):
+    """
+    Check whether a property may provide a value that wasn't assigned.
+
+    :param prop: A :class:`property` object.
+    :returns: :data:`False` if the property can only return assigned values
+              (because its getter doesn't do anything and it doesn't have an
+              :attr:`~custom_property.environment_variable` or a custom
+              setter), :data:`True` otherwise.
+
+    This is used by :attr:`PropertyManager.missing_properties` to avoid
+    evaluating getters during initialization.
+    """
+    if not isinstance(prop, custom_property) or prop.environment_variable or prop.fset is not None:
+        return True
+    code = getattr(prop.fget, '__code__', None)
+    if code is None or get_instructions is None:
+        return True
+    instructions = [(i.opname, i.argval) for i in get_instructions(code) if i.opname not in ('CACHE', 'NOP', 'RESUME')]
+    return instructions not in TRIVIAL_INSTRUCTIONS
+
+
+class PropertyInfo(collections.namedtuple('PropertyInfo', (
+        'name', 'variant', 'owner', 'descriptor', 'cached', 'environment_variable',
+        'key', 'repr', 'required', 'resettable', 'writable'))):
+
+    """
+    Immutable metadata about a single property of a class.
+
+    The ``name`` field gives the name of the property, ``variant``
+    gives the name of the property's class (e.g. ``'mutable_property'``),
+    ``owner`` is the class that defines the property and
+    ``descriptor`` is the :class:`property` object. The remaining fields
+    mirror the options of :class:`custom_property`. For properties that aren't
+    :class:`custom_property` objects these fields are :data:`None`.
+    """
+
+    __slots__ = ()
+
+    def matches(self, **options):
+        """
+        Check whether the property has certain options enabled or disabled.
+
+        :param options: The same keyword arguments as accepted by
+                        :func:`PropertyManager.have_property()`.
+        :returns: :data:`True` if the options match, :data:`False` otherwise.
+        """
+        values = dict((n, getattr(self, n) if n in self._fields else getattr(self.descriptor, n, None))
+                      for n in options)
+        return all(values[n] == v or n == 'repr' and v is True and values[n] is not False
+                   for n, v in options.items())
+
+
+class PropertySchema(collections.namedtuple('PropertySchema', (
+        'owner', 'properties', 'names', 'key_properties', 'required_properties',
+        'validated_properties', 'repr_properties', 'resettable_cached_properties',
+        'transient_properties', 'data_properties', 'visible_data_properties',
+        'assignable_properties', 'defaulted_properties', 'releasable_properties',
+        'cacheable_repr'))):
+
+    """
+    Immutable metadata about all of the properties of a class.
+
+    Schemas are created by :func:`inspect_properties()` (which is used by
+    :func:`PropertyManager.property_schema()`). The ``properties`` field
+    is a tuple of :class:`PropertyInfo` objects sorted by name and
+    ``names``, ``assignable_properties`` and
+    ``defaulted_properties`` are :class:`frozenset` objects with property
+    names. ``cacheable_repr`` is :data:`True` when
+    :func:`PropertyManager.__repr__()` can cache its result. The other fields
+    are tuples with (sorted) names of properties of a certain type,
+    precomputed for use by :class:`PropertyManager`.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def compile(cls, owner):
+        """
+        Create a :class:`PropertySchema` by inspecting a class.
+
+        :param owner: The class that owns the properties.
+        :returns: A :class:`PropertySchema` object.
+        """
+        properties = []
+        # The dir() function is documented to sort its results alphabetically.
+        for name in dir(owner):
+            value = getattr(owner, name, None)
+            if isinstance(value, property):
+                defined_by = next((c for c in owner.__mro__ if name in c.__dict__), owner)
+                properties.append(PropertyInfo(
+                    name=name,
+                    variant=value.__class__.__name__,
+                    owner=defined_by,
+                    descriptor=value,
+                    **dict((n, getattr(value, n, None)) for n in (
+                        'cached', 'environment_variable', 'key',
+                        'repr', 'required', 'resettable', 'writable',
+                    ))
+                ))
+        key_properties = tuple(p.name for p in properties if p.key is True)
+        data_properties = [p for p in properties if not hasattr(PropertyManager, p.name)]
+        required_properties = tuple(p.name for p in properties if p.required is True)
+        return cls(
+            owner=owner,
+            properties=tuple(properties),
+            names=frozenset(p.name for p in properties),
+            key_properties=key_properties,
+            required_properties=required_properties,
+            validated_properties=tuple(sorted(set(key_properties) | set(required_properties))),
+            repr_properties=key_properties or tuple(
+                p.name for p in properties
+                if p.matches(repr=True) and not hasattr(PropertyManager, p.name)
+            ),
+            resettable_cached_properties=tuple(
+                p.name for p in properties
+                if p.cached is True and p.resettable is True
+            ),
+            transient_properties=tuple(
+                p.name for p in properties
+                if p.cached is True and not (p.writable or p.key or getattr(p.descriptor, 'persistent', False))
+            ),
+            data_properties=tuple(p.name for p in data_properties),
+            visible_data_properties=tuple(p.name for p in data_properties if p.repr is not False),
+            assignable_properties=frozenset(
+                p.name for p in properties
+                if p.key or p.writable or p.descriptor.fset is not None
+            ),
+            defaulted_properties=frozenset(
+                p.name for p in properties
+                if p.key or p.required
+                if provides_default(p.descriptor)
+            ),
+            releasable_properties=tuple(
+                p.name for p in properties
+                if p.cached is True and p.resettable is True
+                if getattr(type(p.descriptor).release, '__func__', type(p.descriptor).release)
+                is not getattr(custom_property.release, '__func__', custom_property.release)
+            ),
+            cacheable_repr=bool(key_properties) and all(
+                getattr(owner, n, None) == getattr(PropertyManager, n, None)
+                for n in ('__repr__', 'render_properties', 'repr_properties')
+            ),
+        )
+
+    def find(self, **options):
+        """
+        Find properties with certain options enabled or disabled.
+
+        :param options: The same keyword arguments as accepted by
+                        :func:`PropertyManager.have_property()`.
+        :returns: A list of :class:`PropertyInfo` objects.
+        """
+        return [p for p in self.properties if p.matches(**options)]
 
 
 class PropertyManager(object):
@@ -241,17 +1235,130 @@ class PropertyManager(object):
     properties.
     """
 
+    interned = False
+    """
+    :data:`True` to reuse live objects with the same :attr:`key_values`,
+    :data:`False` otherwise (the default).
+
+    When this is enabled for a class that has key properties, creating an
+    object whose key properties are given as keyword arguments returns the
+    existing live object with the same :attr:`key_values` (if any), at the
+    cost of a single dictionary lookup. Objects are tracked using weak
+    references (see :data:`INTERNED_INSTANCES`) so interning doesn't keep
+    objects alive. Because the returned object is shared, other keyword
+    arguments (e.g. values for :class:`writable_property` objects) must
+    match the values that were assigned when the object was created,
+    otherwise :exc:`~exceptions.ValueError` is raised. Assigning new values
+    to an interned object affects everyone who uses the object, so
+    consider combining this option with :attr:`frozen`.
+    """
+
+    track_changes = False
+    """
+    :data:`True` to track which properties change, :data:`False` otherwise (the default).
+
+    When this is enabled the properties that support assignment (see
+    :func:`property_schema()`) and are assigned or reset
+    after initialization are recorded, together with their previously
+    assigned values (getters aren't called), so that for example only
+    changed columns need to be written to a database. Use
+    :attr:`dirty_properties`, :func:`get_changes()` and :func:`mark_clean()`
+    to inspect and reset the recorded changes (and :func:`collect_changes()`
+    to do so for many objects). Values passed to the initializer don't count
+    as changes. Objects of classes that don't enable this option pay for
+    tracking with a single dictionary lookup per assignment.
+    """
+
+    frozen = False
+    """
+    :data:`True` to :func:`freeze()` instances at the end of initialization,
+    :data:`False` otherwise (the default).
+    """
+
+    repr_mode = None
+    """
+    Overrides :data:`REPR_MODE` for a class (a string or :data:`None`).
+
+    Set this to ``'cached'`` in a subclass to make sure that :func:`repr()`
+    never evaluates properties (for example because logging objects shouldn't
+    trigger expensive computations).
+    """
+
+    repr_limit = None
+    """Overrides :data:`REPR_LIMIT` for a class (an integer or :data:`None`)."""
+
+    def __new__(cls, *args, **kw):
+        """
+        Create a :class:`PropertyManager` object or return an interned object.
+
+        :param kw: The keyword arguments that will be passed to :func:`__init__()`.
+        :returns: A new object or, when :attr:`interned` is :data:`True` and a
+                  live object with the same :attr:`key_values` exists, that
+                  object.
+        """
+        if cls.interned:
+            table = INTERNED_INSTANCES.get(cls)
+            if table is not None:
+                key_properties = cls.property_schema().key_properties
+                if all(n in kw for n in key_properties):
+                    try:
+                        # Stored key values have been converted, so the same
+                        # conversion is applied before looking them up.
+                        key_values = tuple((n, getattr(cls, n).coerce_value(cls, kw[n])) for n in key_properties)
+                        instance = table.get(key_values)
+                    except (TypeError, ValueError):
+                        # Invalid and unhashable values are reported by __init__().
+                        instance = None
+                    if instance is not None:
+                        return instance
+        return super(PropertyManager, cls).__new__(cls)
+
     def __init__(self, **kw):
         """
         Initialize a :class:`PropertyManager` object.
 
         :param kw: Any keyword arguments are passed on to :func:`set_properties()`.
+        :raises: :exc:`~exceptions.TypeError` when required properties are
+                 missing and :exc:`~exceptions.ValueError` when an interned
+                 object is returned and the keyword arguments conflict with
+                 its values (see :attr:`interned`).
         """
+        if self.interned and INTERNED_ATTRIBUTE in self.__dict__:
+            self.check_interned_values(kw)
+            return
         self.set_properties(**kw)
         missing_properties = self.missing_properties
         if missing_properties:
             msg = "missing %s" % pluralize(len(missing_properties), "required argument")
             raise TypeError("%s (%s)" % (msg, concatenate(missing_properties)))
+        if self.track_changes:
+            self.__dict__[DIRTY_ATTRIBUTE] = {}
+        if self.frozen:
+            self.freeze()
+        if self.interned and self.property_schema().key_properties:
+            table = INTERNED_INSTANCES.get(type(self))
+            if table is None:
+                table = INTERNED_INSTANCES.setdefault(type(self), weakref.WeakValueDictionary())
+            if table.setdefault(self.key_values, self) is self:
+                self.__dict__[INTERNED_ATTRIBUTE] = True
+
+    def check_interned_values(self, kw):
+        """
+        Check that keyword arguments match the values of an interned object.
+
+        :param kw: The keyword arguments given to :func:`__init__()`.
+        :raises: :exc:`~exceptions.ValueError` when a keyword argument
+                 doesn't match the assigned value of a property (after
+                 conversion, see :func:`custom_property.coerce_value()`).
+        """
+        storage = self.__dict__
+        for name, value in kw.items():
+            prop = getattr(type(self), name, None)
+            if isinstance(prop, custom_property):
+                value = prop.coerce_value(self, value)
+            if storage.get(name, NOTHING) != value:
+                msg = "Conflicting value for property %r of interned %s object! (%r != %r)"
+                raise ValueError(msg % (name, self.__class__.__name__, value, storage.get(name)))
 
     def set_properties(self, **kw):
         """
@@ -262,22 +1369,120 @@ class PropertyManager(object):
         :raises: :exc:`~exceptions.TypeError` when a keyword argument doesn't
                  match a :class:`property` on the given object.
         """
+        names = self.property_schema().names
         for name, value in kw.items():
-            if self.have_property(name):
+            if name in names:
                 setattr(self, name, value)
             else:
                 msg = "got an unexpected keyword argument %r"
                 raise TypeError(msg % name)
 
+    def to_dict(self, computed=True, hidden=True):
+        """
+        Convert the object to a dictionary with the values of its properties.
+
+        :param computed: If this is :data:`True` (the default) the values of
+                         all properties are included, evaluating them when
+                         necessary. If this is :data:`False` only assigned
+                         and cached values are included (nothing is computed).
+        :param hidden: If this is :data:`False` properties whose
+                       :attr:`~custom_property.repr` option is :data:`False`
+                       are excluded.
+        :returns: A dictionary that maps property names to values.
+
+        The properties defined by :class:`PropertyManager` itself (like
+        :attr:`key_values`) are never included. Refer to :func:`from_dict()`
+        for the reverse operation and to :mod:`property_manager.serialization`
+        for bulk encoders.
+        """
+        schema = self.property_schema()
+        names = schema.data_properties if hidden else schema.visible_data_properties
+        if computed:
+            return dict((name, getattr(self, name)) for name in names)
+        storage = self.__dict__
+        return dict((name, storage[name]) for name in names if name in storage)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create an object from a dictionary created by :func:`to_dict()`.
+
+        :param data: A dictionary that maps property names to values.
+        :returns: An instance of the class.
+        :raises: :exc:`~exceptions.TypeError` when a key of the dictionary
+                 doesn't match a property of the class or when a required
+                 property is missing.
+
+        Values of properties that support assignment are passed to the
+        initializer, values of other :attr:`~custom_property.cached`
+        properties are stored as cached values (their getters aren't called)
+        and values of other properties (which are computed on every access)
+        are ignored.
+        """
+        schema = cls.property_schema()
+        assignable = schema.assignable_properties
+        kw = {}
+        cached = []
+        for name, value in data.items():
+            if name in assignable:
+                kw[name] = value
+            elif name in schema.names:
+                prop = getattr(cls, name)
+                if getattr(prop, 'cached', False):
+                    cached.append((prop, value))
+            else:
+                msg = "got an unexpected key %r"
+                raise TypeError(msg % name)
+        obj = cls(**kw)
+        for prop, value in cached:
+            prop.store_value(obj, value)
+        return obj
+
+    @classmethod
+    def property_schema(cls):
+        """
+        Get metadata about the properties of the class.
+
+        :returns: A :class:`PropertySchema` object.
+
+        The schema is computed only once per class (refer to
+        :func:`inspect_properties()` for details) and doesn't require an
+        instance of the class, so it's cheap to call this method repeatedly.
+        """
+        return inspect_properties(cls)
+
     @property
     def key_properties(self):
         """A sorted list of strings with the names of any :attr:`~custom_property.key` properties."""
-        return self.find_properties(key=True)
+        return list(self.property_schema().key_properties)
 
     @property
     def key_values(self):
         """A tuple of tuples with (name, value) pairs for each name in :attr:`key_properties`."""
-        return tuple((name, getattr(self, name)) for name in self.key_properties)
+        frozen = self.__dict__.get(FROZEN_ATTRIBUTE)
+        if frozen is not None:
+            return frozen[0]
+        return tuple((name, getattr(self, name)) for name in self.property_schema().key_properties)
+
+    @property
+    def dirty_properties(self):
+        """
+        The names of the properties that changed since the last checkpoint (a sorted list of strings).
+
+        :raises: :exc:`~exceptions.TypeError` when :attr:`track_changes` is
+                 :data:`False`.
+
+        A property is considered changed when its current value differs from
+        its value at the last checkpoint, so a property that was assigned and
+        then restored to its previous value isn't included. The checkpoint is
+        the end of initialization or the last call to :func:`mark_clean()`.
+        """
+        return sorted(self.get_changes())
+
+    @property
+    def is_frozen(self):
+        """:data:`True` if the object has been frozen using :func:`freeze()`, :data:`False` otherwise."""
+        return FROZEN_ATTRIBUTE in self.__dict__
 
     @property
     def missing_properties(self):
@@ -286,9 +1491,18 @@ class PropertyManager(object):
 
         This is a list of strings with the names of key and/or required
         properties that either haven't been set or are set to :data:`None`.
+
+        Assigned values are looked up in the :attr:`~object.__dict__` of the
+        object, so getters aren't evaluated for properties that have been
+        assigned a value. Only properties that weren't assigned a value and
+        could provide a default value (see :func:`provides_default()`) are
+        evaluated.
         """
-        names = sorted(set(self.required_properties) | set(self.key_properties))
-        return [n for n in names if getattr(self, n, None) is None]
+        storage = self.__dict__
+        schema = self.property_schema()
+        return [n for n in schema.validated_properties if storage.get(n) is None and (
+            n not in schema.defaulted_properties or getattr(self, n, None) is None
+        )]
 
     @property
     def repr_properties(self):
@@ -300,15 +1514,12 @@ class PropertyManager(object):
         defined by subclasses of :class:`PropertyManager` whose
         :attr:`~custom_property.repr` is :data:`True`).
         """
-        return self.key_properties or [
-            name for name in self.find_properties(repr=True)
-            if not hasattr(PropertyManager, name)
-        ]
+        return list(self.property_schema().repr_properties)
 
     @property
     def required_properties(self):
         """A sorted list of strings with the names of any :attr:`~custom_property.required` properties."""
-        return self.find_properties(required=True)
+        return list(self.property_schema().required_properties)
 
     def find_properties(self, **options):
         """
@@ -317,10 +1528,11 @@ class PropertyManager(object):
         :param options: Passed on to :func:`have_property()` to enable
                         filtering properties by the operations they support.
         :returns: A sorted list of strings with the names of properties.
+
+        This method uses :func:`property_schema()` so it doesn't have to
+        reflect over the members of the object.
         """
-        # We don't explicitly sort our results here because the dir() function
-        # is documented to sort its results alphabetically.
-        return [n for n in dir(self) if self.have_property(n, **options)]
+        return [p.name for p in self.property_schema().find(**options)]
 
     def have_property(self, name, **options):
         """
@@ -350,9 +1562,163 @@ class PropertyManager(object):
         else:
             return False
 
+    def reset(self, **kw):
+        """
+        Clear all assigned and cached values and initialize the object again.
+
+        :param kw: Any keyword arguments are passed on to :func:`__init__()`.
+        :raises: :exc:`~exceptions.AttributeError` when the object is frozen
+                 or interned (because those objects may be shared) and the
+                 same exceptions as :func:`__init__()`.
+
+        This makes it possible to reuse objects instead of creating new ones
+        (see :class:`property_manager.pooling.ObjectPool`), which avoids the
+        cost of allocating and garbage collecting objects. Validation is the
+        same as for new objects because :func:`__init__()` is used.
+        """
+        for attribute, adjective in ((FROZEN_ATTRIBUTE, "frozen"), (INTERNED_ATTRIBUTE, "interned")):
+            if attribute in self.__dict__:
+                msg = "%r object can't be reset because it's %s"
+                raise AttributeError(msg % (self.__class__.__name__, adjective))
+        clear_state(self)
+        self.__init__(**kw)
+
+    def observe(self, callback, *names):
+        """
+        Call a function when the values of properties are assigned or reset.
+
+        :param callback: A callable that will be called with a single argument:
+                         A list of :class:`PropertyChange` objects.
+        :param names: The names of the properties to observe (strings). When
+                      no names are given all properties are observed.
+        :raises: :exc:`~exceptions.TypeError` when a name doesn't refer to a
+                 property of the object.
+
+        Callbacks are called synchronously in the thread that performs the
+        operation. Outside of :func:`batch_updates()` every assignment results
+        in a separate call. Observers are stored in the object (see
+        :data:`OBSERVERS_ATTRIBUTE`) and they're not included when the object
+        is pickled or copied. Objects without observers don't pay for change
+        notifications (apart from a single dictionary lookup).
+        """
+        unknown = set(names) - self.property_schema().names
+        if unknown:
+            msg = "Invalid property name(s) for %s object! (%s)"
+            raise TypeError(msg % (self.__class__.__name__, concatenate(sorted(unknown))))
+        observers = self.__dict__.get(OBSERVERS_ATTRIBUTE, ())
+        self.__dict__[OBSERVERS_ATTRIBUTE] = observers + ((callback, frozenset(names) if names else None),)
+
+    def unobserve(self, callback):
+        """
+        Stop calling a function when the values of properties change.
+
+        :param callback: A callable previously given to :func:`observe()`.
+        """
+        observers = tuple(o for o in self.__dict__.get(OBSERVERS_ATTRIBUTE, ()) if o[0] != callback)
+        if observers:
+            self.__dict__[OBSERVERS_ATTRIBUTE] = observers
+        else:
+            self.__dict__.pop(OBSERVERS_ATTRIBUTE, None)
+
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """
+        Deliver the changes made inside a :keyword:`with` block as a single notification.
+
+        :returns: A context manager.
+
+        Changes made inside the :keyword:`with` block are coalesced per
+        property (see :func:`notify_observers()`) and delivered to the
+        observers in a single call per observer when the (outermost)
+        :keyword:`with` block ends, even when it ends because of an exception
+        (because the assignments have already taken effect).
+
+        .. code-block:: python
+
+           with server.batch_updates():
+               server.host = 'example.com'
+               server.port = 8080
+        """
+        batch = self.__dict__.get(BATCH_ATTRIBUTE)
+        if batch is None:
+            batch = [0, collections.OrderedDict()]
+            self.__dict__[BATCH_ATTRIBUTE] = batch
+        batch[0] += 1
+        try:
+            yield self
+        finally:
+            batch[0] -= 1
+            if batch[0] == 0:
+                del self.__dict__[BATCH_ATTRIBUTE]
+                deliver_changes(self, list(batch[1].values()))
+
+    def get_changes(self):
+        """
+        Get the properties that changed since the last checkpoint.
+
+        :returns: A dictionary that maps the names of changed properties (see
+                  :attr:`dirty_properties`) to tuples with two values each:
+                  The value at the last checkpoint and the current value.
+        :raises: :exc:`~exceptions.TypeError` when :attr:`track_changes` is
+                 :data:`False`.
+
+        Only assigned values are compared, getters aren't called. When a
+        property didn't have an assigned value (at the last checkpoint or
+        currently) :data:`None` is reported instead.
+        """
+        dirty = self.__dict__.get(DIRTY_ATTRIBUTE)
+        if dirty is None:
+            msg = "%s objects don't track changes! (set track_changes=True to enable this)"
+            raise TypeError(msg % self.__class__.__name__)
+        changes = {}
+        for name, old_value in dirty.items():
+            new_value = self.__dict__.get(name, NOTHING)
+            if not values_equal(old_value, new_value):
+                changes[name] = tuple(None if v is NOTHING else v for v in (old_value, new_value))
+        return changes
+
+    def mark_clean(self):
+        """
+        Forget the changed properties (start a new checkpoint).
+
+        :raises: :exc:`~exceptions.TypeError` when :attr:`track_changes` is
+                 :data:`False`.
+
+        Call this after the changes returned by :func:`get_changes()` have been
+        saved.
+        """
+        if DIRTY_ATTRIBUTE not in self.__dict__:
+            msg = "%s objects don't track changes! (set track_changes=True to enable this)"
+            raise TypeError(msg % self.__class__.__name__)
+        self.__dict__[DIRTY_ATTRIBUTE] = {}
+
+    def freeze(self, render=False):
+        """
+        Make the properties of the object immutable.
+
+        :param render: :data:`True` to also render and cache the :func:`repr()`
+                       of the object (only for objects with key properties),
+                       :data:`False` otherwise.
+
+        After an object has been frozen, assigning or deleting the value of a
+        :class:`custom_property` raises :exc:`~exceptions.AttributeError`. The
+        :attr:`key_values` and :func:`hash()` of the object are computed once
+        and stored. Because the inputs of computed properties can no longer
+        change, frozen objects can be shared between threads without locks:
+        Cached values are published using :meth:`dict.setdefault()`, so when
+        two threads compute the same value concurrently both of them return
+        the value that was stored first. Freezing an object that was already
+        frozen has no effect.
+        """
+        if FROZEN_ATTRIBUTE not in self.__dict__:
+            key_values = self.key_values
+            self.__dict__[FROZEN_ATTRIBUTE] = (key_values, hash(PropertyManager) ^ hash(key_values))
+        if render and self.key_properties:
+            repr(self)
+
     def clear_cached_properties(self):
         """Clear cached properties so that their values are recomputed."""
-        for name in self.find_properties(cached=True, resettable=True):
+        for name in self.property_schema().resettable_cached_properties:
             delattr(self, name)
 
     def render_properties(self, *names):
@@ -365,15 +1731,81 @@ class PropertyManager(object):
 
         This method generates a user friendly textual representation for
         objects that use computed properties created using the
-        :mod:`property_manager` module.
+        :mod:`property_manager` module. Refer to :attr:`repr_mode` and
+        :attr:`repr_limit` to avoid evaluating properties and rendering
+        huge values.
         """
         fields = []
+        key_properties = self.property_schema().key_properties
+        evaluate = (self.repr_mode or REPR_MODE) != 'cached'
+        limit = self.repr_limit if self.repr_limit is not None else REPR_LIMIT
+        storage = self.__dict__
         for name in names:
-            value = getattr(self, name, None)
-            if value is not None or name in self.key_properties:
-                fields.append("%s=%r" % (name, value))
+            if evaluate:
+                value = getattr(self, name, None)
+            else:
+                value = storage.get(name, NOTHING)
+                if value is NOTHING:
+                    fields.append("%s=<not computed>" % name)
+                    continue
+            if value is not None or name in key_properties:
+                text = repr(value)
+                if limit is not None and len(text) > limit:
+                    text = text[:limit] + "..."
+                fields.append("%s=%s" % (name, text))
         return "%s(%s)" % (self.__class__.__name__, ", ".join(fields))
 
+    def __getstate__(self):
+        """
+        Get the state of the object for :mod:`pickle` and :mod:`copy`.
+
+        :returns: A copy of the :attr:`~object.__dict__` of the object without
+                  the values of cached properties that can be recomputed
+                  (refer to the :attr:`~custom_property.persistent` option).
+        """
+        state = self.__dict__.copy()
+        state.pop(CACHE_EPOCH_ATTRIBUTE, None)
+        state.pop(REPR_ATTRIBUTE, None)
+        state.pop(INTERNED_ATTRIBUTE, None)
+        state.pop(OBSERVERS_ATTRIBUTE, None)
+        state.pop(BATCH_ATTRIBUTE, None)
+        state.pop(DEPENDENTS_ATTRIBUTE, None)
+        if DIRTY_ATTRIBUTE in state:
+            state[DIRTY_ATTRIBUTE] = dict(state[DIRTY_ATTRIBUTE])
+        # Hashes aren't stable between processes so only a marker is stored.
+        if state.pop(FROZEN_ATTRIBUTE, None) is not None:
+            state[FROZEN_ATTRIBUTE] = True
+        for name in self.property_schema().transient_properties:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the state of the object created by :func:`__getstate__()`.
+
+        :param state: A dictionary with the state of the object.
+        """
+        state = dict(state)
+        frozen = state.pop(FROZEN_ATTRIBUTE, None)
+        self.__dict__.update(state)
+        if frozen:
+            self.freeze()
+
+    def __copy__(self):
+        """Create a shallow copy of the object (see :func:`__getstate__()`)."""
+        cls = self.__class__
+        clone = cls.__new__(cls)
+        clone.__setstate__(self.__getstate__())
+        return clone
+
+    def __deepcopy__(self, memo):
+        """Create a deep copy of the object (see :func:`__getstate__()`)."""
+        cls = self.__class__
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        clone.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return clone
+
     def __eq__(self, other):
         """Enable equality comparison and hashing for :class:`PropertyManager` subclasses."""
         our_key = self.key_values
@@ -424,6 +1856,9 @@ class PropertyManager(object):
         to sets and use them as dictionary keys. The hashes computed by this
         method are based on the values in :attr:`key_values`.
         """
+        frozen = self.__dict__.get(FROZEN_ATTRIBUTE)
+        if frozen is not None:
+            return frozen[1]
         return hash(PropertyManager) ^ hash(self.key_values)
 
     def __repr__(self):
@@ -438,8 +1873,26 @@ class PropertyManager(object):
         all of the object's properties are idempotent and may be evaluated
         at any given time without worrying too much about performance (refer
         to the :attr:`~custom_property.repr` option for an escape hatch).
+
+        When the object has key properties the representation only depends on
+        their values, which can't change once assigned, so the result is
+        cached in the :attr:`~object.__dict__` of the object (see
+        :data:`REPR_ATTRIBUTE`). This is skipped when a subclass overrides
+        :func:`__repr__()`, :func:`render_properties()` or
+        :attr:`repr_properties`.
         """
-        return self.render_properties(*self.repr_properties)
+        schema = self.property_schema()
+        if not schema.cacheable_repr:
+            return self.render_properties(*self.repr_properties)
+        storage = self.__dict__
+        limit = self.repr_limit if self.repr_limit is not None else REPR_LIMIT
+        cached = storage.get(REPR_ATTRIBUTE)
+        if cached is not None and cached[0] == limit:
+            return cached[1]
+        text = self.render_properties(*schema.key_properties)
+        if all(storage.get(n) is not None for n in schema.key_properties):
+            storage[REPR_ATTRIBUTE] = (limit, text)
+        return text
 
 
 class custom_property(property):
@@ -459,6 +1912,15 @@ class custom_property(property):
     classes that inherit from :class:`custom_property`.
     """
 
+    backend = None
+    """
+    An object that stores computed values so they can be shared between
+    objects with the same :attr:`~PropertyManager.key_values` (defaults to
+    :data:`None`). Setting this option implies ``scope='key'``, refer to the
+    documentation of the :attr:`scope` option for details. The object needs to
+    implement the same methods as :class:`KeyedCache`.
+    """
+
     cached = False
     """
     If this attribute is set to :data:`True` the property's value is computed
@@ -472,6 +1934,29 @@ class custom_property(property):
     :see also: :class:`cached_property` and :class:`lazy_property`.
     """
 
+    converter = None
+    """
+    A callable that converts assigned values (defaults to :data:`None`).
+
+    The callable is given the assigned value and should return the converted
+    value. :exc:`~exceptions.TypeError` and :exc:`~exceptions.ValueError`
+    exceptions raised by the callable are reported as a
+    :exc:`~exceptions.ValueError` that includes the name of the property.
+    Conversion happens before the :attr:`type` and :attr:`validator` checks.
+    Assigned :data:`None` values are never converted or validated (so that
+    optional properties can be cleared).
+
+    .. code-block:: python
+
+       from property_manager import PropertyManager, required_property
+
+       class Server(PropertyManager):
+
+           @required_property(converter=int, validator=lambda port: 0 < port < 65536)
+           def port(self):
+               "The port number of the server."
+    """
+
     dynamic = False
     """
     :data:`True` when the :class:`custom_property` subclass was dynamically
@@ -507,6 +1992,16 @@ class custom_property(property):
     :see also: :class:`key_property`.
     """
 
+    persistent = False
+    """
+    If this attribute is :data:`True` the cached value of the property is
+    included when the object that owns the property is pickled or copied.
+    By default :func:`PropertyManager.__getstate__()` excludes the values of
+    :attr:`cached` properties that aren't :attr:`writable` or :attr:`key`
+    properties, because those values can be recomputed. Enable this option for
+    cached values that are expensive to compute and cheap to transfer.
+    """
+
     repr = True
     """
     By default :func:`PropertyManager.__repr__()` includes the names and values
@@ -576,6 +2071,89 @@ class custom_property(property):
     :see also: :class:`mutable_property` and :class:`cached_property`.
     """
 
+    scope = 'instance'
+    """
+    The scope of cached values (a string, defaults to ``'instance'``).
+
+    By default the computed values of :attr:`cached` properties are stored in
+    the :attr:`~object.__dict__` of the object that owns the property. When
+    :attr:`scope` is set to ``'key'`` computed values are also stored in a
+    shared table keyed by the class, the name of the property and the
+    :attr:`~PropertyManager.key_values` of the object. Objects with equal
+    :attr:`~PropertyManager.key_values` that are created independently then
+    share one computation and one copy of the value:
+
+    .. code-block:: python
+
+       from property_manager import PropertyManager, cached_property, key_property
+
+       class Dataset(PropertyManager):
+
+           @key_property
+           def filename(self):
+               "The filename of the dataset."
+
+           @cached_property(scope='key')
+           def contents(self):
+               "The parsed contents of the dataset."
+               with open(self.filename) as handle:
+                   return parse(handle)
+
+    The shared table is :data:`SHARED_CACHE` unless the :attr:`backend` option
+    is used to select another :class:`KeyedCache` (or compatible) object.
+    Resetting the property (for example using :keyword:`del`) also removes the
+    value from the shared table, so the next access recomputes the value.
+    Objects without :attr:`~PropertyManager.key_values` don't use the shared
+    table.
+    """
+
+    track_dependencies = False
+    """
+    :data:`True` to clear the cached value when its inputs change, :data:`False` otherwise (the default).
+
+    When this option is enabled for a :attr:`cached` property, the properties
+    that are read (on any object) while the value is computed are recorded as
+    the inputs of the value. When one of those properties is assigned or
+    reset later on, the cached value is cleared so that it's recomputed on
+    next access:
+
+    .. code-block:: python
+
+       from property_manager import PropertyManager, cached_property, mutable_property, required_property
+
+       class Config(PropertyManager):
+
+           @mutable_property
+           def timeout(self):
+               return 10
+
+       class Client(PropertyManager):
+
+           @required_property
+           def config(self):
+               "The :class:`Config` object."
+
+           @cached_property(track_dependencies=True)
+           def session(self):
+               return create_session(timeout=self.config.timeout)
+
+    Changing ``config.timeout`` clears the cached ``session`` of every client
+    that used that config, without visiting any other objects. The inputs
+    hold weak references to the objects that depend on them, so tracking
+    doesn't keep objects alive. Only reads of :class:`custom_property`
+    objects are recorded (not reads of plain attributes) and cached values
+    cleared by :func:`invalidate_all()` don't clear the values computed from
+    them. Refer to :func:`invalidate_dependents()` for details.
+    """
+
+    type = None
+    """
+    A class or a tuple of classes that assigned values must be instances of
+    (defaults to :data:`None` which disables this check). Values of the wrong
+    type cause :exc:`~exceptions.TypeError` to be raised. Refer to
+    :attr:`converter` for details.
+    """
+
     usage_notes = True
     """
     If this attribute is :data:`True` :func:`inject_usage_notes()` is used to
@@ -583,6 +2161,25 @@ class custom_property(property):
     attribute to :data:`False` to disable :func:`inject_usage_notes()`.
     """
 
+    validator = None
+    """
+    A callable that validates assigned values (defaults to :data:`None`).
+
+    The callable is given the (converted) value and should return
+    :data:`True` when the value is valid. When it returns :data:`False`
+    :exc:`~exceptions.ValueError` is raised. Refer to :attr:`converter` for
+    details.
+    """
+
+    version = None
+    """
+    A tag that's included in the keys of values stored in a :attr:`backend`
+    (defaults to :data:`None`). Change this tag when the code that computes the
+    value of the property changes, to make sure that values computed by the old
+    code are no longer used (this is especially relevant for persistent
+    backends like :class:`property_manager.backends.FileCache`).
+    """
+
     writable = False
     """
     If this attribute is set to :data:`True` the property supports assignment.
@@ -609,8 +2206,12 @@ class custom_property(property):
         :param options: Each keyword argument gives the name of an option
                         (:attr:`writable`, :attr:`resettable`, :attr:`cached`,
                         :attr:`required`, :attr:`environment_variable`,
-                        :attr:`repr`) and the value to use for that option
-                        (:data:`True`, :data:`False` or a string).
+                        :attr:`repr`, :attr:`scope`, :attr:`backend`,
+                        :attr:`version`, :attr:`persistent`, :attr:`type`,
+                        :attr:`converter`, :attr:`validator`,
+                        :attr:`track_dependencies`) and the value to use for
+                        that option (:data:`True`, :data:`False`, a string or
+                        an object).
         :returns: A dynamically constructed subclass of
                   :class:`custom_property` with the given options.
 
@@ -656,6 +2257,10 @@ class custom_property(property):
             # Keyword arguments construct subclasses.
             name = args[0] if args else 'customized_property'
             options['dynamic'] = True
+            for option in 'converter', 'validator':
+                # Make sure functions don't become methods.
+                if isinstance(options.get(option), types.FunctionType):
+                    options[option] = staticmethod(options[option])
             return type(name, (cls,), options)
         else:
             # Positional arguments construct instances.
@@ -691,10 +2296,56 @@ class custom_property(property):
             value = getattr(self.fget, name, None)
             if value is not None:
                 setattr(self, name, value)
+        # Compile the converter, type and validator options.
+        self.coercion = self.compile_coercion()
         # Inject usage notes when running under Sphinx.
         if USAGE_NOTES_ENABLED:
             self.inject_usage_notes()
 
+    def coerce_value(self, obj, value):
+        """
+        Apply the :attr:`converter`, :attr:`type` and :attr:`validator` options to a value.
+
+        :param obj: The object (or class) that owns the property.
+        :param value: The value to convert and validate.
+        :returns: The converted value (`value` itself when none of the options are set).
+        :raises: Refer to :func:`__set__()`.
+        """
+        return value if self.coercion is None else self.coercion(obj, value)
+
+    def compile_coercion(self):
+        """
+        Combine the :attr:`converter`, :attr:`type` and :attr:`validator` options into a function.
+
+        :returns: A function that takes the object that owns the property and
+                  an assigned value and returns the converted value, or
+                  :data:`None` when none of these options are set (so that
+                  :func:`__set__()` doesn't have to check each option).
+        """
+        cls = self.__class__
+        converter, expected_type, validator = cls.converter, cls.type, cls.validator
+        if converter is None and expected_type is None and validator is None:
+            return None
+        name = self.__name__
+
+        def coerce(obj, value):
+            if value is None:
+                return value
+            if converter is not None:
+                try:
+                    value = converter(value)
+                except (TypeError, ValueError) as e:
+                    msg = "Invalid value for %s property! (%s)"
+                    raise ValueError(msg % (format_property(obj, name), e))
+            if expected_type is not None and not isinstance(value, expected_type):
+                msg = "Invalid value for %s property! (expected %s, got %r instead)"
+                raise TypeError(msg % (format_property(obj, name), format_type(expected_type), value))
+            if validator is not None and not validator(value):
+                msg = "Invalid value for %s property! (%r was rejected by the validator)"
+                raise ValueError(msg % (format_property(obj, name), value))
+            return value
+        return coerce
+
     def ensure_callable(self, role):
         """
         Ensure that a decorated value is in fact callable.
@@ -755,6 +2406,35 @@ class custom_property(property):
                 notes.append(RESETTABLE_WRITABLE_PROPERTY_NOTE)
         return notes
 
+    def get_backend(self, obj):
+        """
+        Get the shared table for the values of this property on a given object.
+
+        :param obj: The object that owns the property.
+        :returns: A tuple with two values: A :class:`KeyedCache` (or
+                  compatible) object and the key of the value in the table,
+                  or a tuple with two :data:`None` values when the shared
+                  table isn't used (see :attr:`scope`).
+
+        After :func:`invalidate_all()` affected the class of `obj` the key of
+        a resettable property changes, so values stored in the table before
+        the invalidation are no longer found.
+        """
+        if self.cached and (self.backend is not None or self.scope == 'key'):
+            key_values = getattr(obj, 'key_values', None)
+            if key_values:
+                cls = obj.__class__
+                key = ("%s.%s" % (cls.__module__, cls.__name__), self.__name__, self.version, key_values)
+                if CACHE_EPOCH and self.resettable:
+                    # Values stored before invalidate_all() affected the class
+                    # are stale, so we include the epoch of the most recent
+                    # invalidation in the key to make sure they're not found.
+                    epoch = invalidation_epoch(cls)
+                    if epoch:
+                        key += (epoch,)
+                return (self.backend if self.backend is not None else SHARED_CACHE), key
+        return None, None
+
     def __get__(self, obj, type=None):
         """
         Get the assigned, cached or computed value of the property.
@@ -767,14 +2447,20 @@ class custom_property(property):
             # Called to get the attribute of the class.
             return self
         else:
-            # Called to get the attribute of an instance. We calculate the
-            # property's dotted name here once to minimize string creation.
-            dotted_name = format_property(obj, self.__name__)
+            # Called to get the attribute of an instance.
+            if DEPENDENCY_TRACKING:
+                record_dependency(obj, self)
             if self.key or self.writable or self.cached:
                 # Check if a value has been assigned or cached.
                 value = obj.__dict__.get(self.__name__, NOTHING)
+                if (value is not NOTHING and CACHE_EPOCH and self.cached and self.resettable
+                        and obj.__dict__.get(CACHE_EPOCH_ATTRIBUTE, 0) < CACHE_EPOCH
+                        and refresh_cache_epoch(obj)):
+                    # The cached value was invalidated by invalidate_all().
+                    value = NOTHING
                 if value is not NOTHING:
-                    logger.spam("%s reporting assigned or cached value (%r) ..", dotted_name, value)
+                    if HOOKS:
+                        dispatch_event(obj, self, 'cached', value)
                     return value
             # Check if the property has an environment variable. We do this
             # after checking for an assigned value so that the `writable' and
@@ -782,17 +2468,91 @@ class custom_property(property):
             if self.environment_variable:
                 value = os.environ.get(self.environment_variable, NOTHING)
                 if value is not NOTHING:
-                    logger.spam("%s reporting value from environment variable (%r) ..", dotted_name, value)
+                    if HOOKS:
+                        dispatch_event(obj, self, 'environment', value)
+                    return value
+            # Check if the value is available in a shared table.
+            if self.cached and (self.backend is not None or self.scope == 'key'):
+                backend, key = self.get_backend(obj)
+            else:
+                backend = key = None
+            if backend is not None:
+                value = backend.get(key, NOTHING)
+                if value is not NOTHING:
+                    value = self.store_value(obj, value)
+                    if HOOKS:
+                        dispatch_event(obj, self, 'cached', value)
                     return value
-            # Compute the property's value.
-            value = super(custom_property, self).__get__(obj, type)
-            logger.spam("%s reporting computed value (%r) ..", dotted_name, value)
+            # Compute the property's value (only timing the computation
+            # when someone is interested in the result).
+            started = timeit.default_timer() if HOOKS else None
+            epoch = CACHE_EPOCH
+            if self.track_dependencies and self.cached:
+                value = compute_with_dependencies(obj, self, lambda: super(custom_property, self).__get__(obj, type))
+            else:
+                value = super(custom_property, self).__get__(obj, type)
             if self.cached:
-                # Cache the computed value.
-                logger.spam("%s caching computed value ..", dotted_name)
-                set_property(obj, self.__name__, value)
+                if backend is not None and not (self.resettable and invalidated_since(obj.__class__, epoch)):
+                    backend.set(key, value)
+                value = self.store_value(obj, value, epoch)
+            if started is not None:
+                dispatch_event(obj, self, 'computed', value, timeit.default_timer() - started)
             return value
 
+    def store_value(self, obj, value, epoch=None):
+        """
+        Cache the value of the property in the :attr:`~object.__dict__` of an object.
+
+        :param obj: The object that owns the property.
+        :param value: The value to cache.
+        :param epoch: The value of :data:`CACHE_EPOCH` before `value` was
+                      computed (an integer) or :data:`None` when `value`
+                      wasn't computed by the caller.
+        :returns: The cached value. When another thread stored a value first,
+                  that value is returned instead of `value` (so all threads
+                  use the same value).
+
+        Before the value is stored, values invalidated by :func:`invalidate_all()`
+        are cleared so that the epoch stored in the object is up to date. When
+        :func:`invalidate_all()` affected the object while the value was being
+        computed (e.g. because a configuration reload happened) the value may
+        be stale, so it's returned without being cached.
+        """
+        if CACHE_EPOCH and self.resettable:
+            if epoch is not None and invalidated_since(obj.__class__, epoch):
+                return value
+            if obj.__dict__.get(CACHE_EPOCH_ATTRIBUTE, 0) < CACHE_EPOCH:
+                refresh_cache_epoch(obj)
+        return obj.__dict__.setdefault(self.__name__, value)
+
+    def discard_value(self, obj):
+        """
+        Remove the value of the property from the :attr:`~object.__dict__` of an object.
+
+        :param obj: The object that owns the property.
+        :returns: The removed value or :data:`NOTHING` when no value was stored.
+
+        This is used whenever a value is reset, invalidated or evicted, so that
+        :func:`release()` is called for every value that's removed.
+        """
+        value = obj.__dict__.pop(self.__name__, NOTHING)
+        if value is not NOTHING:
+            self.release(obj, value)
+        return value
+
+    def release(self, obj, value):
+        """
+        Release a value that was removed from an object.
+
+        :param obj: The object that owned the value.
+        :param value: The value that was removed.
+
+        The default implementation does nothing. Subclasses whose values hold
+        on to external resources (like memory mappings) can override this
+        method to release those resources as soon as the value is reset,
+        without waiting for the garbage collector.
+        """
+
     def __set__(self, obj, value):
         """
         Override the computed value of the property.
@@ -800,20 +2560,31 @@ class custom_property(property):
         :param obj: The instance that owns the property.
         :param value: The new value for the property.
         :raises: :exc:`~exceptions.AttributeError` if :attr:`writable` is
-                 :data:`False`.
+                 :data:`False` or the object is frozen (see
+                 :func:`PropertyManager.freeze()`), :exc:`~exceptions.TypeError`
+                 or :exc:`~exceptions.ValueError` when the value is rejected
+                 by the :attr:`type`, :attr:`converter` or :attr:`validator`
+                 options.
         """
-        # Calculate the property's dotted name only once.
-        dotted_name = format_property(obj, self.__name__)
+        if FROZEN_ATTRIBUTE in obj.__dict__:
+            msg = "%r object is frozen (attribute %r is read-only)"
+            raise AttributeError(msg % (obj.__class__.__name__, self.__name__))
+        if self.coercion is not None:
+            value = self.coercion(obj, value)
+        # Clear invalidated values before storing the new value, otherwise the
+        # next read would consider the assigned value stale (see store_value()).
+        if CACHE_EPOCH and self.cached and self.resettable and obj.__dict__.get(CACHE_EPOCH_ATTRIBUTE, 0) < CACHE_EPOCH:
+            refresh_cache_epoch(obj)
+        observed = OBSERVERS_ATTRIBUTE in obj.__dict__
+        dirty = self.get_dirty_record(obj)
+        old_value = obj.__dict__.get(self.__name__, NOTHING) if observed or dirty is not None else NOTHING
         # Evaluate the property's setter (if any).
         try:
-            logger.spam("%s calling setter with value %r ..", dotted_name, value)
             super(custom_property, self).__set__(obj, value)
         except AttributeError:
-            logger.spam("%s setter raised attribute error, falling back.", dotted_name)
             if self.writable:
                 # Override a computed or previously assigned value.
-                logger.spam("%s overriding computed value to %r ..", dotted_name, value)
-                set_property(obj, self.__name__, value)
+                obj.__dict__[self.__name__] = value
             else:
                 # Check if we're setting a key property during initialization.
                 if self.key and obj.__dict__.get(self.__name__, None) is None:
@@ -822,12 +2593,34 @@ class custom_property(property):
                         msg = "Invalid value for key property '%s'! (expected hashable object, got %r instead)"
                         raise ValueError(msg % (self.__name__, value))
                     # Set the key property's value.
-                    logger.spam("%s setting initial value to %r ..", dotted_name, value)
-                    set_property(obj, self.__name__, value)
+                    obj.__dict__[self.__name__] = value
                 else:
                     # Refuse to override the computed value.
                     msg = "%r object attribute %r is read-only"
                     raise AttributeError(msg % (obj.__class__.__name__, self.__name__))
+        if HOOKS:
+            dispatch_event(obj, self, 'assigned', value)
+        if DEPENDENTS_ATTRIBUTE in obj.__dict__:
+            invalidate_dependents(obj, self.__name__)
+        if dirty is not None:
+            dirty[self.__name__] = old_value
+        if observed:
+            notify_observers(obj, self.__name__, 'assigned', None if old_value is NOTHING else old_value, value)
+
+    def get_dirty_record(self, obj):
+        """
+        Get the record of changed properties that an assignment or reset should update.
+
+        :param obj: The instance that owns the property.
+        :returns: The dictionary stored in :data:`DIRTY_ATTRIBUTE` when the
+                  object tracks changes, the property supports assignment
+                  and it hasn't changed since the last checkpoint,
+                  :data:`None` otherwise.
+        """
+        dirty = obj.__dict__.get(DIRTY_ATTRIBUTE)
+        if (dirty is not None and self.__name__ not in dirty
+                and self.__name__ in inspect_properties(type(obj)).assignable_properties):
+            return dirty
 
     def __delete__(self, obj):
         """
@@ -835,26 +2628,41 @@ class custom_property(property):
 
         :param obj: The instance that owns the property.
         :raises: :exc:`~exceptions.AttributeError` if :attr:`resettable` is
-                 :data:`False`.
+                 :data:`False` or the object is frozen (see
+                 :func:`PropertyManager.freeze()`).
 
         Once the property has been deleted the next read will evaluate the
         decorated function to compute the value.
         """
-        # Calculate the property's dotted name only once.
-        dotted_name = format_property(obj, self.__name__)
+        if FROZEN_ATTRIBUTE in obj.__dict__:
+            msg = "%r object is frozen (attribute %r can't be reset)"
+            raise AttributeError(msg % (obj.__class__.__name__, self.__name__))
+        stored = self.__name__ in obj.__dict__
+        observed = stored and OBSERVERS_ATTRIBUTE in obj.__dict__
+        dirty = self.get_dirty_record(obj) if stored else None
+        if observed or dirty is not None:
+            old_value = obj.__dict__[self.__name__]
         # Evaluate the property's deleter (if any).
         try:
-            logger.spam("%s calling deleter ..", dotted_name)
             super(custom_property, self).__delete__(obj)
         except AttributeError:
-            logger.spam("%s deleter raised attribute error, falling back.", dotted_name)
             if self.resettable:
                 # Reset the computed or overridden value.
-                logger.spam("%s clearing assigned or computed value ..", dotted_name)
-                clear_property(obj, self.__name__)
+                self.discard_value(obj)
+                backend, key = self.get_backend(obj)
+                if backend is not None:
+                    backend.delete(key)
             else:
                 msg = "%r object attribute %r is read-only"
                 raise AttributeError(msg % (obj.__class__.__name__, self.__name__))
+        if HOOKS:
+            dispatch_event(obj, self, 'reset')
+        if DEPENDENTS_ATTRIBUTE in obj.__dict__:
+            invalidate_dependents(obj, self.__name__)
+        if dirty is not None:
+            dirty[self.__name__] = old_value
+        if observed:
+            notify_observers(obj, self.__name__, 'reset', old_value, None)
 
 
 class writable_property(custom_property):
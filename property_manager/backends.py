@@ -0,0 +1,355 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Persistent backends for cached property values.
+
+The :attr:`~property_manager.custom_property.backend` option of
+:class:`.custom_property` makes it possible to store computed values outside
+of the object that owns the property, keyed by the class, the name of the
+property, the :attr:`~property_manager.custom_property.version` tag and the
+:attr:`~property_manager.PropertyManager.key_values` of the object. The
+backends defined in this module store those values on disk, so that
+expensive computations survive a restart of the process:
+
+.. code-block:: python
+
+   from property_manager import PropertyManager, cached_property, key_property
+   from property_manager.backends import FileCache
+
+   class RemoteConfig(PropertyManager):
+
+       @key_property
+       def url(self):
+           "The URL of the configuration."
+
+       @cached_property(backend=FileCache('/var/cache/my-service'), version='2')
+       def compiled(self):
+           "The compiled configuration (takes a few seconds to compute)."
+           return compile_config(download(self.url))
+
+Values are serialized using :mod:`pickle`, so they need to be picklable.
+Deleting the property (e.g. using :keyword:`del`) removes the value from the
+backend. Values that can't be stored are logged and otherwise ignored.
+"""
+
+# Standard library modules.
+import hashlib
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+
+# External dependencies.
+from verboselogs import VerboseLogger
+
+# Public identifiers that require documentation.
+__all__ = (
+    'FileCache',
+    'SQLiteCache',
+    'fingerprint_key',
+)
+
+# Initialize a logger for this module.
+logger = VerboseLogger(__name__)
+
+
+def fingerprint_key(key):
+    """
+    Convert the key of a cached value to a stable string.
+
+    :param key: The key of the value (a tuple, see :func:`~property_manager.custom_property.get_backend()`).
+    :returns: A hexadecimal SHA1 digest (a string).
+
+    The fingerprint is based on the :func:`repr()` of the key, which is stable
+    between processes for the types of values commonly used as
+    :attr:`~property_manager.custom_property.key` properties (strings,
+    numbers and tuples of those).
+    """
+    return hashlib.sha1(repr(key).encode('UTF-8')).hexdigest()
+
+
+class FileCache(object):
+
+    """
+    Store cached property values in a directory, using one file per value.
+
+    Files are written atomically (by writing a temporary file in the same
+    directory and renaming it into place) so concurrent processes never see
+    partially written values. When the total size of the directory exceeds
+    ``max_size`` the least recently used files are removed.
+    """
+
+    def __init__(self, directory, max_size=None):
+        """
+        Initialize a :class:`FileCache` object.
+
+        :param directory: The pathname of the directory where values are
+                          stored (a string). It's created when it doesn't
+                          exist yet.
+        :param max_size: The maximum total size of the stored values (an
+                         integer number of bytes) or :data:`None` for no limit.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    def get_filename(self, key):
+        """Get the pathname of the file that stores the value with the given key (a string)."""
+        return os.path.join(self.directory, fingerprint_key(key) + '.pickle')
+
+    def get(self, key, default=None):
+        """
+        Load a value from disk.
+
+        :param key: The key of the value.
+        :param default: The value to return when the key isn't available.
+        :returns: The value or `default`.
+        """
+        filename = self.get_filename(key)
+        try:
+            with open(filename, 'rb') as handle:
+                stored_key, value = pickle.load(handle)
+        except (IOError, OSError):
+            return default
+        except Exception:
+            logger.warning("Ignoring unreadable cache file %s!", filename, exc_info=True)
+            self.delete(key)
+            return default
+        if stored_key != key:
+            return default
+        # Mark the file as recently used (used by prune()).
+        try:
+            os.utime(filename, None)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value):
+        """
+        Store a value on disk.
+
+        :param key: The key of the value.
+        :param value: The value to store (must be picklable).
+        """
+        try:
+            data = pickle.dumps((key, value), pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logger.warning("Failed to serialize value for key %r!", key, exc_info=True)
+            return
+        try:
+            if not os.path.isdir(self.directory):
+                try:
+                    os.makedirs(self.directory)
+                except OSError:
+                    # Another process may have created the directory.
+                    if not os.path.isdir(self.directory):
+                        raise
+            handle, temporary_file = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(handle, 'wb') as stream:
+                    stream.write(data)
+                getattr(os, 'replace', os.rename)(temporary_file, self.get_filename(key))
+            except Exception:
+                if os.path.exists(temporary_file):
+                    os.unlink(temporary_file)
+                raise
+        except (IOError, OSError):
+            logger.warning("Failed to store value for key %r in %s!", key, self.directory, exc_info=True)
+            return
+        if self.max_size is not None:
+            self.prune()
+
+    def delete(self, key):
+        """
+        Remove a value from disk.
+
+        :param key: The key of the value.
+        """
+        try:
+            os.unlink(self.get_filename(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all values from disk."""
+        for filename, size, mtime in self.find_entries():
+            try:
+                os.unlink(filename)
+            except OSError:
+                pass
+
+    def find_entries(self):
+        """
+        Find the files that store values.
+
+        :returns: A list of tuples with the pathname, size and last
+                  modification time of each file.
+        """
+        entries = []
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    filename = os.path.join(self.directory, name)
+                    try:
+                        status = os.stat(filename)
+                        entries.append((filename, status.st_size, status.st_mtime))
+                    except OSError:
+                        pass
+        return entries
+
+    def prune(self):
+        """Remove the least recently used files until the total size is below ``max_size``."""
+        entries = sorted(self.find_entries(), key=lambda e: e[2])
+        total_size = sum(e[1] for e in entries)
+        while entries and total_size > self.max_size:
+            filename, size, mtime = entries.pop(0)
+            try:
+                os.unlink(filename)
+            except OSError:
+                pass
+            total_size -= size
+
+
+class SQLiteCache(object):
+
+    """
+    Store cached property values in an SQLite_ database.
+
+    This is useful when there are a lot of (small) values, because it avoids
+    the overhead of one file per value. SQLite handles concurrent access by
+    multiple processes. When the total size of the stored values exceeds
+    ``max_size`` the least recently used values are removed.
+
+    .. _SQLite: https://www.sqlite.org/
+    """
+
+    def __init__(self, filename, max_size=None, timeout=30):
+        """
+        Initialize a :class:`SQLiteCache` object.
+
+        :param filename: The pathname of the database (a string).
+        :param max_size: The maximum total size of the stored values (an
+                         integer number of bytes) or :data:`None` for no limit.
+        :param timeout: The number of seconds to wait for locks held by other
+                        processes (a number).
+        """
+        self.filename = filename
+        self.max_size = max_size
+        self.timeout = timeout
+        self.connection = None
+        self.connection_pid = None
+        self.inherited_connections = []
+        self.lock = threading.Lock()
+
+    def execute(self, query, *parameters):
+        """
+        Execute an SQL query and commit the transaction.
+
+        :param query: The SQL query (a string).
+        :param parameters: The parameters of the query.
+        :returns: A list with the rows returned by the query.
+
+        The database connection is opened on first use. SQLite connections
+        must not be shared between processes, so when the process forked
+        (e.g. to start workers) after the connection was opened, a new
+        connection is opened in the child process.
+        """
+        with self.lock:
+            if self.connection is None or self.connection_pid != os.getpid():
+                if self.connection is not None:
+                    # Keep a reference to the connection inherited from the parent
+                    # process so that it's never used or closed by this process.
+                    self.inherited_connections.append(self.connection)
+                self.connection_pid = os.getpid()
+                self.connection = sqlite3.connect(self.filename, timeout=self.timeout, check_same_thread=False)
+                self.connection.execute('''
+                    CREATE TABLE IF NOT EXISTS property_cache (
+                        key TEXT PRIMARY KEY,
+                        value BLOB NOT NULL,
+                        size INTEGER NOT NULL,
+                        accessed REAL NOT NULL
+                    )
+                ''')
+            with self.connection:
+                return self.connection.execute(query, parameters).fetchall()
+
+    def get(self, key, default=None):
+        """
+        Load a value from the database.
+
+        :param key: The key of the value.
+        :param default: The value to return when the key isn't available.
+        :returns: The value or `default`.
+        """
+        fingerprint = fingerprint_key(key)
+        try:
+            rows = self.execute('SELECT value FROM property_cache WHERE key = ?', fingerprint)
+        except (sqlite3.Error, IOError, OSError):
+            logger.warning("Failed to load value for key %r from %s!", key, self.filename, exc_info=True)
+            return default
+        if not rows:
+            return default
+        try:
+            stored_key, value = pickle.loads(bytes(rows[0][0]))
+        except Exception:
+            logger.warning("Ignoring unreadable cache entry for key %r!", key, exc_info=True)
+            self.delete(key)
+            return default
+        if stored_key != key:
+            return default
+        try:
+            self.execute('UPDATE property_cache SET accessed = ? WHERE key = ?', time.time(), fingerprint)
+        except (sqlite3.Error, IOError, OSError):
+            logger.warning("Failed to update access time of key %r in %s!", key, self.filename, exc_info=True)
+        return value
+
+    def set(self, key, value):
+        """
+        Store a value in the database.
+
+        :param key: The key of the value.
+        :param value: The value to store (must be picklable).
+        """
+        try:
+            data = pickle.dumps((key, value), pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logger.warning("Failed to serialize value for key %r!", key, exc_info=True)
+            return
+        try:
+            self.execute(
+                'INSERT OR REPLACE INTO property_cache (key, value, size, accessed) VALUES (?, ?, ?, ?)',
+                fingerprint_key(key), sqlite3.Binary(data), len(data), time.time(),
+            )
+            if self.max_size is not None:
+                self.prune()
+        except (sqlite3.Error, IOError, OSError):
+            logger.warning("Failed to store value for key %r in %s!", key, self.filename, exc_info=True)
+
+    def delete(self, key):
+        """
+        Remove a value from the database.
+
+        :param key: The key of the value.
+        """
+        try:
+            self.execute('DELETE FROM property_cache WHERE key = ?', fingerprint_key(key))
+        except (sqlite3.Error, IOError, OSError):
+            logger.warning("Failed to remove value for key %r from %s!", key, self.filename, exc_info=True)
+
+    def clear(self):
+        """Remove all values from the database."""
+        self.execute('DELETE FROM property_cache')
+
+    def prune(self):
+        """Remove the least recently used values until the total size is below ``max_size``."""
+        rows = self.execute('SELECT key, size FROM property_cache ORDER BY accessed DESC')
+        total_size = 0
+        for fingerprint, size in rows:
+            total_size += size
+            if total_size > self.max_size:
+                self.execute('DELETE FROM property_cache WHERE key = ?', fingerprint)
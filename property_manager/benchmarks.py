@@ -0,0 +1,581 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Performance benchmarks for the :mod:`property_manager` package.
+
+The :mod:`property_manager.benchmarks` module can be run as a script to
+measure the performance of the hot paths of :class:`.custom_property` and
+:class:`.PropertyManager`, the size of pickled objects, the memory used per
+instance, the time it takes to import the package and the performance of the
+:mod:`property_manager.sphinx` extension against a synthetic package with thousands of
+:class:`.PropertyManager` subclasses:
+
+.. code-block:: sh
+
+   $ python -m property_manager.benchmarks --output=baseline.json
+   $ python -m property_manager.benchmarks --baseline=baseline.json
+
+The results are reported in JSON format. When a baseline is given the
+results are compared against it and the exit code is nonzero when any
+benchmark became slower than the allowed tolerance. When Sphinx is
+installed and the ``--sphinx-build`` option is given the synthetic package
+is also documented using a real ``sphinx-build`` run (see
+:func:`benchmark_sphinx_build()`).
+"""
+
+# Standard library modules.
+import getopt
+import importlib
+import itertools
+import copy
+import json
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+import types
+
+# Modules included in our package.
+from property_manager import (
+    PropertyManager,
+    __version__,
+    cached_property,
+    custom_property,
+    key_property,
+    lazy_property,
+    mutable_property,
+    required_property,
+    writable_property,
+)
+from property_manager.pooling import ObjectPool
+
+# Public identifiers that require documentation.
+__all__ = (
+    'DEFAULT_CLASS_COUNT',
+    'DEFAULT_NUMBER',
+    'DEFAULT_TOLERANCE',
+    'benchmark_import_time',
+    'benchmark_memory',
+    'benchmark_operations',
+    'benchmark_pickle',
+    'benchmark_sphinx_build',
+    'benchmark_sphinx_extension',
+    'compare_results',
+    'generate_synthetic_package',
+    'main',
+    'run_benchmarks',
+)
+
+USAGE_TEXT = """
+Usage: python -m property_manager.benchmarks [OPTIONS]
+
+Run the property-manager benchmarks and report the results in JSON format.
+
+Supported options:
+
+  -n, --number=COUNT       Repeat each operation COUNT times per round.
+  -c, --classes=COUNT      Generate COUNT classes for the Sphinx benchmarks.
+  -s, --sphinx-build       Also document the synthetic classes using sphinx-build.
+  -j, --jobs=COUNT         Use COUNT processes for sphinx-build.
+  -o, --output=FILE        Save the results to FILE (for use as a baseline).
+  -b, --baseline=FILE      Compare the results to a previously saved baseline.
+  -t, --tolerance=FACTOR   Allow benchmarks to be FACTOR slower than the
+                           baseline (defaults to 0.25, i.e. 25%).
+  -h, --help               Show this message and exit.
+"""
+
+DEFAULT_CLASS_COUNT = 2000
+"""The default number of classes in the synthetic package (an integer)."""
+
+DEFAULT_NUMBER = 10000
+"""The default number of times each operation is repeated per round (an integer)."""
+
+DEFAULT_ROUNDS = 3
+"""The number of rounds per benchmark (the fastest round is reported)."""
+
+DEFAULT_TOLERANCE = 0.25
+"""The default fraction by which a benchmark may be slower than its baseline (a float)."""
+
+ENVIRONMENT_VARIABLE = 'PROPERTY_MANAGER_BENCHMARK'
+"""The name of the environment variable used by the environment variable benchmarks (a string)."""
+
+SYNTHETIC_CLASS_TEMPLATE = '''
+
+class SyntheticClass{index}({base}):
+
+    """Synthetic class number {index}."""
+
+    @key_property
+    def name(self):
+        """The name of the object."""
+
+    @required_property
+    def size(self):
+        """The size of the object."""
+
+    @mutable_property
+    def color(self):
+        """The color of the object."""
+        return 'blue'
+
+    @cached_property
+    def area(self):
+        """The area of the object."""
+        return self.size ** 2
+
+    @lazy_property
+    def label(self):
+        """The label of the object."""
+        return '%s-%s' % (self.name, self.size)
+
+    def resize(self, size):
+        """Change the size of the object."""
+        self.size = size
+'''
+
+
+def generate_synthetic_package(directory, count=DEFAULT_CLASS_COUNT, name='synthetic_properties'):
+    """
+    Generate a Python module with many :class:`.PropertyManager` subclasses.
+
+    :param directory: The pathname of the directory where the module should
+                      be created (a string).
+    :param count: The number of classes to generate (an integer).
+    :param name: The name of the module (a string).
+    :returns: The pathname of the generated module (a string).
+
+    Every tenth class inherits from the class before it, to make sure that
+    the generated documentation includes class hierarchies.
+    """
+    filename = os.path.join(directory, '%s.py' % name)
+    with open(filename, 'w') as handle:
+        handle.write('"""Synthetic module generated by property_manager.benchmarks."""\n\n')
+        handle.write('from property_manager import (PropertyManager, cached_property, key_property,\n')
+        handle.write('                              lazy_property, mutable_property, required_property)\n')
+        for index in range(count):
+            base = ('SyntheticClass%i' % (index - 1)) if index % 10 == 9 else 'PropertyManager'
+            handle.write(SYNTHETIC_CLASS_TEMPLATE.format(index=index, base=base))
+    return filename
+
+
+def import_synthetic_package(directory, name='synthetic_properties'):
+    """Import a module created by :func:`generate_synthetic_package()`."""
+    sys.path.insert(0, directory)
+    try:
+        sys.modules.pop(name, None)
+        return importlib.import_module(name)
+    finally:
+        sys.path.remove(directory)
+
+
+def find_synthetic_classes(module):
+    """Get the synthetic classes defined by a module (a list of classes)."""
+    return [v for k, v in sorted(vars(module).items()) if k.startswith('SyntheticClass')]
+
+
+def benchmark_sphinx_extension(classes, rounds=3):
+    """
+    Measure the performance of :func:`.append_property_docs()`.
+
+    :param classes: A list of :class:`.PropertyManager` subclasses.
+    :param rounds: The number of times each class is documented (an integer).
+                   The first round is reported as the cold result and
+                   the others are reported as warm results.
+    :returns: A dictionary with benchmark results.
+
+    The incremental result simulates a new Sphinx process that reuses the
+    documentation cached in the build environment of a previous build.
+    """
+    from property_manager.sphinx import RENDERED_DOCS, append_property_docs
+
+    class FakeEnvironment(object):
+        pass
+
+    class FakeApp(object):
+        env = FakeEnvironment()
+
+    app = FakeApp()
+    RENDERED_DOCS.clear()
+    timings = []
+    for i in range(rounds):
+        start = timeit.default_timer()
+        for cls in classes:
+            append_property_docs(app=app, what='class', name=cls.__name__, obj=cls, options=None, lines=[])
+        timings.append(timeit.default_timer() - start)
+    RENDERED_DOCS.clear()
+    start = timeit.default_timer()
+    for cls in classes:
+        append_property_docs(app=app, what='class', name=cls.__name__, obj=cls, options=None, lines=[])
+    return {
+        'classes': len(classes),
+        'cold_seconds': timings[0],
+        'warm_seconds': min(timings[1:]) if len(timings) > 1 else None,
+        'incremental_seconds': timeit.default_timer() - start,
+    }
+
+
+def benchmark_sphinx_build(directory, module, jobs=1):
+    """
+    Document a synthetic package using a real ``sphinx-build`` run.
+
+    :param directory: The directory that contains the synthetic module (a string).
+    :param module: The name of the synthetic module (a string).
+    :param jobs: The number of parallel processes to use (an integer).
+    :returns: A dictionary with benchmark results or :data:`None` when
+              Sphinx isn't installed.
+    """
+    try:
+        from sphinx.cmd.build import build_main
+    except ImportError:
+        return None
+    source_directory = os.path.join(directory, 'docs')
+    output_directory = os.path.join(source_directory, 'build')
+    if not os.path.isdir(source_directory):
+        os.makedirs(source_directory)
+    with open(os.path.join(source_directory, 'conf.py'), 'w') as handle:
+        handle.write('import sys\n')
+        handle.write('sys.path.insert(0, %r)\n' % directory)
+        handle.write('extensions = %r\n' % (['sphinx.ext.autodoc', 'property_manager.sphinx'],))
+        handle.write('master_doc = %r\n' % 'index')
+    with open(os.path.join(source_directory, 'index.rst'), 'w') as handle:
+        handle.write('Synthetic package\n=================\n\n')
+        handle.write('.. automodule:: %s\n   :members:\n' % module)
+    start = timeit.default_timer()
+    status = build_main(['-q', '-E', '-j', str(jobs), '-b', 'html', source_directory, output_directory])
+    return {'jobs': jobs, 'seconds': timeit.default_timer() - start, 'status': status}
+
+
+class BenchmarkObject(PropertyManager):
+
+    """A :class:`.PropertyManager` subclass that uses every property variant."""
+
+    @key_property
+    def key(self):
+        """A key property."""
+
+    @required_property
+    def required(self):
+        """A required property."""
+
+    @custom_property
+    def custom(self):
+        """A custom property."""
+        return 42
+
+    @writable_property
+    def writable(self):
+        """A writable property."""
+        return 42
+
+    @mutable_property
+    def mutable(self):
+        """A mutable property."""
+        return 42
+
+    @lazy_property
+    def lazy(self):
+        """A lazy property."""
+        return 42
+
+    @cached_property
+    def cached(self):
+        """A cached property."""
+        return 42
+
+    @mutable_property(environment_variable=ENVIRONMENT_VARIABLE)
+    def environment(self):
+        """A property whose value can be set using an environment variable."""
+        return 42
+
+
+def create_wide_class(count, variant=mutable_property, getter=lambda self: 42):
+    """
+    Create a :class:`.PropertyManager` subclass with many properties.
+
+    :param count: The number of properties to create (an integer).
+    :param variant: The type of properties to create (defaults to :class:`.mutable_property`).
+    :param getter: The getter of the properties (a function).
+    :returns: A class object.
+    """
+    members = {}
+    for index in range(count):
+        name = 'property_%i' % index
+        # Give each getter the name of its property (custom_property uses it
+        # to store assigned and cached values).
+        function = types.FunctionType(getter.__code__, getter.__globals__, name,
+                                      getter.__defaults__, getter.__closure__)
+        members[name] = variant(function)
+    return type('WideObject%i' % count, (PropertyManager,), members)
+
+
+def measure(function, number=DEFAULT_NUMBER, rounds=DEFAULT_ROUNDS):
+    """
+    Measure the time it takes to call a function.
+
+    :param function: The function to call (a callable without arguments).
+    :param number: The number of calls per round (an integer).
+    :param rounds: The number of rounds (an integer).
+    :returns: The number of seconds per call in the fastest round (a float).
+    """
+    return min(timeit.Timer(function).repeat(repeat=rounds, number=number)) / number
+
+
+def benchmark_operations(number=DEFAULT_NUMBER):
+    """
+    Measure the hot paths of :class:`.custom_property` and :class:`.PropertyManager`.
+
+    :param number: The number of times each operation is repeated per round (an integer).
+    :returns: A dictionary that maps benchmark names (strings) to the number
+              of seconds per operation (floats).
+
+    Cache misses of :class:`.lazy_property` and :class:`.cached_property` are
+    measured by removing the cached value from the instance's
+    :attr:`~object.__dict__` before each access, so they include the cost of
+    that removal.
+    """
+    results = {}
+    obj = BenchmarkObject(key=1, required=2, writable=3, mutable=4)
+    fresh = BenchmarkObject(key=1, required=2)
+    storage = obj.__dict__
+    # Reads of each property variant.
+    results['get_custom'] = measure(lambda: obj.custom, number)
+    results['get_key'] = measure(lambda: obj.key, number)
+    results['get_required'] = measure(lambda: obj.required, number)
+    results['get_writable_hit'] = measure(lambda: obj.writable, number)
+    results['get_writable_miss'] = measure(lambda: fresh.writable, number)
+    results['get_mutable_hit'] = measure(lambda: obj.mutable, number)
+    results['get_mutable_miss'] = measure(lambda: fresh.mutable, number)
+    results['get_lazy_hit'] = measure(lambda: obj.lazy, number)
+    results['get_lazy_miss'] = measure(lambda: (storage.pop('lazy', None), obj.lazy), number)
+    results['get_cached_hit'] = measure(lambda: obj.cached, number)
+    results['get_cached_miss'] = measure(lambda: (storage.pop('cached', None), obj.cached), number)
+    # Environment variable lookups.
+    os.environ[ENVIRONMENT_VARIABLE] = 'value'
+    try:
+        results['get_environment_set'] = measure(lambda: fresh.environment, number)
+    finally:
+        del os.environ[ENVIRONMENT_VARIABLE]
+    results['get_environment_unset'] = measure(lambda: fresh.environment, number)
+    # Assignment and deletion.
+    results['set_writable'] = measure(lambda: setattr(obj, 'writable', 5), number)
+    results['set_mutable'] = measure(lambda: setattr(obj, 'mutable', 5), number)
+    results['delete_mutable'] = measure(lambda: delattr(obj, 'mutable'), number)
+    results['delete_cached'] = measure(lambda: delattr(obj, 'cached'), number)
+    observed, counter = BenchmarkObject(key=1, required=2), itertools.count()
+    observed.observe(lambda changes: None)
+    results['set_mutable_observed'] = measure(lambda: setattr(observed, 'mutable', next(counter)), number)
+    # Initialization.
+    results['init_benchmark_object'] = measure(lambda: BenchmarkObject(key=1, required=2), number)
+    interned_class = type('InternedBenchmarkObject', (BenchmarkObject,), dict(interned=True))
+    interned_object = interned_class(key=1, required=2)
+    # The lambda refers to the existing object to keep it alive.
+    results['init_interned_duplicate'] = measure(lambda: interned_class(key=1, required=2) is interned_object, number)
+    pool = ObjectPool(BenchmarkObject)
+    results['init_pooled'] = measure(lambda: pool.release(pool.acquire(key=1, required=2)), number)
+    for count in 1, 10, 50:
+        cls = create_wide_class(count)
+        kw = dict(('property_%i' % i, i) for i in range(count))
+        results['init_%i_properties' % count] = measure(lambda: cls(**kw), max(1, number // count))
+    # The cost of initialization shouldn't depend on the cost of the getters
+    # of required properties that are given a value.
+    kw = dict(('property_%i' % i, i) for i in range(10))
+    for label, getter in ('cheap', lambda self: None), ('expensive', lambda self: sum(range(10000))):
+        cls = create_wide_class(10, required_property, getter)
+        results['init_10_required_%s_getters' % label] = measure(lambda: cls(**kw), max(1, number // 10))
+    # Methods of PropertyManager.
+    other = BenchmarkObject(key=2, required=2)
+    population = [BenchmarkObject(key=i, required=i) for i in range(100)][::-1]
+    results['find_properties'] = measure(lambda: obj.find_properties(writable=True), number)
+    results['key_values'] = measure(lambda: obj.key_values, number)
+    results['hash'] = measure(lambda: hash(obj), number)
+    results['eq'] = measure(lambda: obj == other, number)
+    results['sort_100_objects'] = measure(lambda: sorted(population), max(1, number // 100))
+    results['repr'] = measure(lambda: repr(obj), number)
+    keyless = create_wide_class(10)()
+    results['repr_without_key'] = measure(lambda: repr(keyless), number)
+    results['clear_cached_properties'] = measure(obj.clear_cached_properties, number)
+    data = obj.to_dict()
+    results['to_dict'] = measure(obj.to_dict, number)
+    results['to_dict_assigned'] = measure(lambda: obj.to_dict(computed=False), number)
+    results['from_dict'] = measure(lambda: BenchmarkObject.from_dict(data), number)
+    return results
+
+
+def benchmark_memory(count=10000):
+    """
+    Measure the memory used by :class:`.PropertyManager` objects.
+
+    :param count: The number of objects to create (an integer).
+    :returns: The number of bytes used per object (a float) or
+              :data:`None` when :mod:`tracemalloc` isn't available.
+    """
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [BenchmarkObject(key=i, required=i) for i in range(count)]
+        for obj in objects:
+            obj.lazy, obj.cached
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return float(after - before) / count
+
+
+def benchmark_pickle(number=DEFAULT_NUMBER, payload=1000):
+    """
+    Measure the size and speed of pickling and copying :class:`.PropertyManager` objects.
+
+    :param number: The number of times each operation is repeated per round (an integer).
+    :param payload: The number of items in the cached values (an integer).
+    :returns: A dictionary that maps benchmark names (strings) to the size of
+              a pickled object in bytes (an integer) or the number of seconds
+              per operation (floats).
+
+    The cached values of the object are lists with `payload` items, so the
+    results show the effect of excluding recomputable cached values (see
+    :func:`~property_manager.PropertyManager.__getstate__()`).
+    """
+    results = {}
+    obj = BenchmarkObject(key=1, required=2, writable=3, mutable=4)
+    obj.__dict__.update(lazy=list(range(payload)), cached=list(range(payload)))
+    data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+    results['pickle_bytes'] = len(data)
+    results['pickle_dumps'] = measure(lambda: pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), number)
+    results['pickle_loads'] = measure(lambda: pickle.loads(data), number)
+    results['copy'] = measure(lambda: copy.copy(obj), number)
+    results['deepcopy'] = measure(lambda: copy.deepcopy(obj), max(1, number // 10))
+    return results
+
+
+def benchmark_import_time(rounds=DEFAULT_ROUNDS):
+    """
+    Measure the time it takes to import the :mod:`property_manager` package.
+
+    :param rounds: The number of fresh Python processes to use (an integer).
+    :returns: The number of seconds in the fastest process (a float).
+    """
+    script = 'import timeit; s = timeit.default_timer(); import property_manager; print(timeit.default_timer() - s)'
+    directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    for i in range(rounds):
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=directory)
+        timings.append(float(output.decode('ascii').strip()))
+    return min(timings)
+
+
+def run_benchmarks(number=DEFAULT_NUMBER, classes=DEFAULT_CLASS_COUNT, sphinx_build=False, jobs=1):
+    """
+    Run all of the benchmarks.
+
+    :param number: The number of times each operation is repeated per round (an integer).
+    :param classes: The number of classes in the synthetic package used for
+                    the Sphinx benchmarks (an integer).
+    :param sphinx_build: :data:`True` to include :func:`benchmark_sphinx_build()`,
+                         :data:`False` otherwise.
+    :param jobs: The number of parallel processes for ``sphinx-build`` (an integer).
+    :returns: A dictionary with the keys ``version``, ``python`` and
+              ``results``. The value of ``results`` is a dictionary that maps
+              benchmark names to numbers where lower is better.
+    """
+    results = benchmark_operations(number)
+    results.update(benchmark_pickle(number))
+    results['memory_per_instance'] = benchmark_memory()
+    results['import_time'] = benchmark_import_time()
+    directory = tempfile.mkdtemp()
+    try:
+        generate_synthetic_package(directory, classes)
+        module = import_synthetic_package(directory)
+        for name, value in benchmark_sphinx_extension(find_synthetic_classes(module)).items():
+            if name.endswith('_seconds'):
+                results['sphinx_extension_%s' % name[:-len('_seconds')]] = value
+        if sphinx_build:
+            outcome = benchmark_sphinx_build(directory, module.__name__, jobs)
+            if outcome is not None:
+                results['sphinx_build'] = outcome['seconds']
+    finally:
+        shutil.rmtree(directory)
+    return {
+        'version': __version__,
+        'python': sys.version.split()[0],
+        'results': dict((k, v) for k, v in results.items() if v is not None),
+    }
+
+
+def compare_results(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare benchmark results against a baseline.
+
+    :param results: The results of the current run (a dictionary in the
+                    format returned by :func:`run_benchmarks()`).
+    :param baseline: The results of a previous run (same format).
+    :param tolerance: The fraction by which a benchmark may be slower than the
+                      baseline before it's considered a regression (a float).
+    :returns: A dictionary that maps the names of benchmarks that regressed to
+              the ratio of the current and baseline values (floats).
+
+    Benchmarks that only exist in one of the two results are ignored.
+    """
+    regressions = {}
+    for name, value in results['results'].items():
+        reference = baseline['results'].get(name)
+        if reference and value > reference * (1 + tolerance):
+            regressions[name] = value / reference
+    return regressions
+
+
+def main():
+    """Command line interface for the :mod:`property_manager.benchmarks` module."""
+    number = DEFAULT_NUMBER
+    count = DEFAULT_CLASS_COUNT
+    sphinx_build = False
+    jobs = 1
+    output_file = None
+    baseline_file = None
+    tolerance = DEFAULT_TOLERANCE
+    options, arguments = getopt.getopt(sys.argv[1:], 'n:c:sj:o:b:t:h', [
+        'number=', 'classes=', 'sphinx-build', 'jobs=', 'output=', 'baseline=', 'tolerance=', 'help',
+    ])
+    for option, value in options:
+        if option in ('-n', '--number'):
+            number = int(value)
+        elif option in ('-c', '--classes'):
+            count = int(value)
+        elif option in ('-s', '--sphinx-build'):
+            sphinx_build = True
+        elif option in ('-j', '--jobs'):
+            jobs = int(value)
+        elif option in ('-o', '--output'):
+            output_file = value
+        elif option in ('-b', '--baseline'):
+            baseline_file = value
+        elif option in ('-t', '--tolerance'):
+            tolerance = float(value)
+        elif option in ('-h', '--help'):
+            print(USAGE_TEXT.strip())
+            return
+    results = run_benchmarks(number=number, classes=count, sphinx_build=sphinx_build, jobs=jobs)
+    if baseline_file:
+        with open(baseline_file) as handle:
+            results['regressions'] = compare_results(results, json.load(handle), tolerance)
+    rendered = json.dumps(results, indent=2, sort_keys=True)
+    if output_file:
+        with open(output_file, 'w') as handle:
+            handle.write(rendered + '\n')
+    print(rendered)
+    if results.get('regressions'):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,489 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Memory mapped and shared memory properties for large binary payloads.
+
+The :class:`mapped_property` class defined in this module is a variant of
+:class:`.cached_property` whose value is a read only :class:`memoryview` of a
+memory mapped file. Because the contents of the file live in the page cache of
+the operating system, processes that map the same file share a single copy of
+the data instead of each keeping their own copy in an instance
+:attr:`~object.__dict__`:
+
+.. code-block:: python
+
+   from property_manager import PropertyManager, key_property
+   from property_manager.buffers import mapped_property
+
+   class Model(PropertyManager):
+
+       @key_property
+       def name(self):
+           "The name of the model."
+
+       @mapped_property(directory='/var/cache/models')
+       def weights(self):
+           "The weights of the model (generated on first access)."
+           return generate_weights(self.name)
+
+       @mapped_property
+       def lookup_table(self):
+           "A lookup table that's distributed as a file."
+           return '/usr/share/models/%s.table' % self.name
+
+The decorated function can return the pathname of an existing file (a string)
+which is mapped as is, or the contents of the file (a byte string or another
+object that supports the buffer protocol). In the latter case the contents are
+written to a file in :attr:`~mapped_property.directory` whose name is derived
+from the class, the name and :attr:`~property_manager.custom_property.version`
+of the property and the :attr:`~property_manager.PropertyManager.key_values`
+of the object, so other processes map the existing file without calling the
+decorated function. Resetting the value (e.g. by deleting the property, by
+:func:`~property_manager.invalidate_all()` or when the value is evicted by
+:mod:`property_manager.eviction`) closes the mapping.
+
+The :class:`shared_property` class is similar but doesn't need a file: The
+first process that computes the value publishes it in a shared memory segment
+and other processes (e.g. the workers of a :mod:`multiprocessing` pool) attach
+to that segment on first access of the same property.
+
+:class:`mapped_property` requires Python 3 because Python 2 can't create a
+:class:`memoryview` of a memory mapped file (and doesn't distinguish between
+pathnames and byte strings).
+"""
+
+# Standard library modules.
+import functools
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import weakref
+
+try:
+    # Shared memory segments are available in Python 3.8 and later.
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+# External dependencies.
+from verboselogs import VerboseLogger
+
+# Modules included in our package.
+from property_manager import cached_property
+from property_manager.backends import fingerprint_key
+
+# Public identifiers that require documentation.
+__all__ = (
+    'SEGMENTS',
+    'SEGMENT_TIMEOUT',
+    'buffer_property',
+    'close_buffer',
+    'get_segment_name',
+    'map_file',
+    'mapped_property',
+    'shared_property',
+    'wait_for_segment',
+)
+
+SEGMENTS = {}
+"""
+A dictionary with the shared memory segments used by this process.
+
+The keys are segment names (strings) and the values are
+:class:`~multiprocessing.shared_memory.SharedMemory` objects. Segments stay
+open as long as their values may be referenced.
+"""
+
+SEGMENT_OWNERS = {}
+"""A dictionary that maps segment names to :class:`weakref.finalize` objects of their owners."""
+
+SEGMENT_TIMEOUT = 10
+"""
+The number of seconds to wait for a shared memory segment to become ready (a number).
+
+A segment is visible to other processes as soon as it's created, before the
+value has been copied into it. Processes that attach to a segment that isn't
+ready yet wait for the publisher to finish (see :func:`wait_for_segment()`).
+When this times out (for example because the publisher crashed) the value is
+computed in the current process instead.
+"""
+
+# Shared memory segments start with a flag that is set once the value has
+# been copied into the segment, followed by the size of the value (because
+# the size of a segment may be rounded up to a multiple of the page size).
+SEGMENT_HEADER = struct.Struct('!B7xQ')
+
+# Initialize a logger for this module.
+logger = VerboseLogger(__name__)
+
+
+def map_file(handle):
+    """
+    Map the contents of an open file into memory.
+
+    :param handle: A file object opened in binary mode.
+    :returns: A read only :class:`memoryview` object.
+
+    The mapping stays valid after the file is closed.
+    """
+    if os.fstat(handle.fileno()).st_size == 0:
+        # Empty files can't be memory mapped.
+        return memoryview(b'')
+    return memoryview(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def close_buffer(value):
+    """
+    Release a :class:`memoryview` created by :func:`map_file()` and close the mapping.
+
+    :param value: The :class:`memoryview` object.
+
+    When other references to the mapped data exist (e.g. slices of the
+    :class:`memoryview`) the mapping can't be closed yet. In that case it's
+    closed by the garbage collector once the last reference disappears.
+    """
+    if isinstance(value, memoryview):
+        mapping = value.obj
+        value.release()
+        if isinstance(mapping, mmap.mmap):
+            try:
+                mapping.close()
+            except BufferError:
+                logger.debug("Not closing memory mapping yet because it's still referenced.")
+
+
+class buffer_property(cached_property):
+
+    """
+    Base class for cached properties whose value is a read only :class:`memoryview`.
+
+    Subclasses implement :func:`wrap_getter()` to convert the result of the
+    decorated function to a :class:`memoryview`.
+    """
+
+    def __init__(self, *args, **kw):
+        """
+        Initialize a :class:`buffer_property` object.
+
+        :param args: The first positional argument is the function that's
+                     called to compute the value of the property. Any other
+                     arguments are passed on to :class:`.custom_property`.
+        :param kw: Any keyword arguments are passed on to :class:`.custom_property`.
+        """
+        if args and callable(args[0]):
+            args = (self.wrap_getter(args[0]),) + args[1:]
+        super(buffer_property, self).__init__(*args, **kw)
+
+    def wrap_getter(self, function):
+        """
+        Wrap the decorated function so that it returns a :class:`memoryview`.
+
+        :param function: The decorated function.
+        :returns: The wrapped function.
+        """
+        raise NotImplementedError()
+
+    def get_key(self, obj):
+        """
+        Get the key that identifies the value of the property for a given object.
+
+        :param obj: The object that owns the property.
+        :returns: A tuple with the name of the class, the name and
+                  :attr:`~property_manager.custom_property.version` of the
+                  property and the
+                  :attr:`~property_manager.PropertyManager.key_values` of the
+                  object, or :data:`None` when the object doesn't have
+                  :attr:`~property_manager.custom_property.key` properties.
+        """
+        key_values = getattr(obj, 'key_values', None)
+        if key_values:
+            cls = obj.__class__
+            return ("%s.%s" % (cls.__module__, cls.__name__), self.__name__, self.version, key_values)
+
+    def release(self, obj, value):
+        """
+        Release a value that was reset, invalidated or evicted.
+
+        :param obj: The instance that owned the value.
+        :param value: The :class:`memoryview`.
+        """
+        close_buffer(value)
+
+
+class mapped_property(buffer_property):
+
+    """
+    A cached property whose value is a memory mapped file.
+
+    This is a variant of :class:`.cached_property`. Refer to the
+    documentation of the :mod:`property_manager.buffers` module for details.
+    """
+
+    def __init__(self, *args, **kw):
+        """
+        Initialize a :class:`mapped_property` object.
+
+        :param args: Refer to :class:`buffer_property`.
+        :param kw: Refer to :class:`buffer_property`.
+        :raises: :exc:`~exceptions.NotImplementedError` on Python 2.
+        """
+        if sys.version_info[0] < 3:
+            raise NotImplementedError("The mapped_property class requires Python 3!")
+        super(mapped_property, self).__init__(*args, **kw)
+
+    directory = None
+    """
+    The pathname of a directory where generated contents are stored (a string
+    or :data:`None`). When this is :data:`None` (the default) or the object
+    doesn't have :attr:`~property_manager.custom_property.key` properties the
+    generated contents are stored in an anonymous temporary file, so they
+    aren't shared between processes.
+    """
+
+    def wrap_getter(self, function):
+        """
+        Wrap the decorated function so that its result is memory mapped.
+
+        :param function: The decorated function.
+        :returns: A function that returns a :class:`memoryview`.
+        """
+        @functools.wraps(function)
+        def wrapper(obj):
+            filename = self.get_filename(obj)
+            if filename is not None:
+                try:
+                    with open(filename, 'rb') as handle:
+                        return map_file(handle)
+                except (IOError, OSError):
+                    pass
+            result = function(obj)
+            if isinstance(result, str):
+                with open(result, 'rb') as handle:
+                    return map_file(handle)
+            if filename is not None:
+                if not os.path.isdir(self.directory):
+                    os.makedirs(self.directory)
+                handle, temporary_file = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+                try:
+                    with os.fdopen(handle, 'wb') as stream:
+                        stream.write(result)
+                    getattr(os, 'replace', os.rename)(temporary_file, filename)
+                except Exception:
+                    if os.path.exists(temporary_file):
+                        os.unlink(temporary_file)
+                    raise
+                with open(filename, 'rb') as handle:
+                    return map_file(handle)
+            with tempfile.TemporaryFile() as handle:
+                handle.write(result)
+                handle.flush()
+                return map_file(handle)
+        return wrapper
+
+    def get_filename(self, obj):
+        """
+        Get the pathname of the file that stores generated contents.
+
+        :param obj: The object that owns the property.
+        :returns: A pathname (a string) or :data:`None` when the generated
+                  contents aren't stored in :attr:`directory`.
+        """
+        if self.directory:
+            key = self.get_key(obj)
+            if key is not None:
+                return os.path.join(self.directory, fingerprint_key(key) + '.bin')
+
+
+class shared_property(buffer_property):
+
+    """
+    A cached property whose value is published in a shared memory segment.
+
+    This is a variant of :class:`.cached_property` whose decorated function
+    returns an object that supports the buffer protocol (e.g. a byte string
+    or an :class:`array.array`). The first process that computes the value
+    copies it into a :class:`multiprocessing.shared_memory.SharedMemory`
+    segment. Other processes that access the same property of an object with
+    the same :attr:`~property_manager.PropertyManager.key_values` attach to
+    the existing segment instead of calling the decorated function. Either
+    way the value of the property is a read only :class:`memoryview` of the
+    segment.
+
+    The segment is owned by the object whose property created it: It's
+    removed when that object is garbage collected or when the value of that
+    object is reset (e.g. by deleting the property, by
+    :func:`~property_manager.invalidate_all()` or by
+    :func:`~property_manager.PropertyManager.reset()`). Processes that attached to the segment keep their
+    mapping, however before Python 3.13 an unrelated process (one that
+    doesn't share the resource tracker of the owner, unlike the workers of a
+    :mod:`multiprocessing` pool) removes segments it attached to when it
+    exits. When shared memory isn't available (Python < 3.8) or the object
+    doesn't have :attr:`~property_manager.custom_property.key` properties,
+    the value is cached in the process like a normal :class:`.cached_property`.
+    """
+
+    def wrap_getter(self, function):
+        """
+        Wrap the decorated function so that its result is published in shared memory.
+
+        :param function: The decorated function.
+        :returns: A function that returns a :class:`memoryview`.
+        """
+        @functools.wraps(function)
+        def wrapper(obj):
+            key = self.get_key(obj)
+            if key is None or shared_memory is None:
+                return make_readonly(memoryview(function(obj)))
+            name = get_segment_name(key)
+            segment = attach_segment(name)
+            if segment is None:
+                segment = publish_segment(name, memoryview(function(obj)), obj)
+            size = wait_for_segment(segment)
+            if size is None:
+                logger.warning("Shared memory segment %s didn't become ready, computing value locally.", name)
+                return make_readonly(memoryview(function(obj)))
+            return make_readonly(segment.buf[SEGMENT_HEADER.size:SEGMENT_HEADER.size + size])
+        return wrapper
+
+    def release(self, obj, value):
+        """
+        Release a value that was reset and remove the segment if `obj` owns it.
+
+        :param obj: The instance that owned the value.
+        :param value: The :class:`memoryview`.
+        """
+        if isinstance(value, memoryview):
+            value.release()
+        key = self.get_key(obj)
+        if key is not None:
+            finalizer = SEGMENT_OWNERS.get(get_segment_name(key))
+            if finalizer is not None and finalizer.peek() and finalizer.peek()[0] is obj:
+                finalizer()
+
+
+def get_segment_name(key):
+    """
+    Get the name of the shared memory segment for a value.
+
+    :param key: The key returned by :func:`buffer_property.get_key()`.
+    :returns: The name of the segment (a string, short enough for all
+              platforms that support shared memory).
+    """
+    return 'pm_' + fingerprint_key(key)[:24]
+
+
+def attach_segment(name):
+    """
+    Attach to an existing shared memory segment.
+
+    :param name: The name of the segment (a string).
+    :returns: A :class:`~multiprocessing.shared_memory.SharedMemory` object
+              or :data:`None` when the segment doesn't exist.
+    """
+    segment = SEGMENTS.get(name)
+    if segment is None:
+        try:
+            try:
+                # Python 3.13 and later make it possible to attach without
+                # registering the segment with the resource tracker.
+                segment = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                segment = shared_memory.SharedMemory(name=name)
+        except (IOError, OSError):
+            return None
+        SEGMENTS[name] = segment
+    return segment
+
+
+def publish_segment(name, data, owner):
+    """
+    Copy a value into a new shared memory segment.
+
+    :param name: The name of the segment (a string).
+    :param data: A :class:`memoryview` of the value.
+    :param owner: The object that owns the segment.
+    :returns: A :class:`~multiprocessing.shared_memory.SharedMemory` object.
+    """
+    data = data.cast('B') if data.ndim != 1 or data.format != 'B' else data
+    try:
+        segment = shared_memory.SharedMemory(name=name, create=True, size=SEGMENT_HEADER.size + max(1, data.nbytes))
+    except (IOError, OSError):
+        # Another process published the same value first.
+        segment = attach_segment(name)
+        if segment is None:
+            raise
+        return segment
+    segment.buf[SEGMENT_HEADER.size:SEGMENT_HEADER.size + data.nbytes] = data
+    SEGMENT_HEADER.pack_into(segment.buf, 0, 0, data.nbytes)
+    # Mark the segment as ready only after the value and its size are in place.
+    segment.buf[0] = 1
+    SEGMENTS[name] = segment
+    SEGMENT_OWNERS[name] = weakref.finalize(owner, remove_segment, name, os.getpid())
+    return segment
+
+
+def wait_for_segment(segment, timeout=None):
+    """
+    Wait for a shared memory segment to become ready.
+
+    :param segment: A :class:`~multiprocessing.shared_memory.SharedMemory` object.
+    :param timeout: The number of seconds to wait (a number, defaults to
+                    :data:`SEGMENT_TIMEOUT`).
+    :returns: The size of the value in the segment (an integer) or
+              :data:`None` when the segment didn't become ready in time.
+    """
+    deadline = time.time() + (SEGMENT_TIMEOUT if timeout is None else timeout)
+    while True:
+        ready, size = SEGMENT_HEADER.unpack_from(segment.buf)
+        if ready:
+            return size
+        if time.time() >= deadline:
+            return None
+        time.sleep(0.001)
+
+
+def remove_segment(name, pid):
+    """
+    Close and remove a shared memory segment published by this process.
+
+    :param name: The name of the segment (a string).
+    :param pid: The process id of the process that created the segment (an
+                integer). Child processes created using :func:`os.fork()`
+                inherit the objects of their parent, but they never remove
+                the segments of their parent.
+    """
+    SEGMENT_OWNERS.pop(name, None)
+    segment = SEGMENTS.pop(name, None)
+    if segment is not None and os.getpid() == pid:
+        try:
+            segment.close()
+        except BufferError:
+            logger.debug("Not closing shared memory segment %s yet because it's still referenced.", name)
+        try:
+            segment.unlink()
+        except (IOError, OSError):
+            pass
+
+
+def make_readonly(view):
+    """
+    Get a read only version of a :class:`memoryview` object.
+
+    :param view: A :class:`memoryview` object.
+    :returns: A read only :class:`memoryview` object. On Python < 3.8 (where
+              :func:`memoryview.toreadonly()` isn't available) writable views
+              are copied into a byte string.
+    """
+    if view.readonly:
+        return view
+    if hasattr(view, 'toreadonly'):
+        return view.toreadonly()
+    copy = memoryview(view.tobytes())
+    return copy if view.format == 'B' and view.ndim == 1 else copy.cast(view.format, view.shape)
@@ -0,0 +1,224 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Memory budgeted eviction of cached property values.
+
+Normally the values of cached properties live in the :attr:`~object.__dict__`
+of their owner until they are reset or the owner is garbage collected. In
+long running processes that hold on to many objects this can add up. The
+:mod:`property_manager.eviction` module implements an optional process wide
+:class:`CacheManager` that keeps track of the cached values of resettable
+cached properties (e.g. :class:`.cached_property`) and evicts the least
+recently used values when the total size exceeds a budget:
+
+.. code-block:: python
+
+   from property_manager.eviction import enable_memory_budget
+
+   # Allow cached values to use up to 256 MiB.
+   enable_memory_budget(256 * 1024 * 1024)
+
+Evicted values are simply recomputed the next time they're accessed. The
+cache manager is a subscriber of :data:`property_manager.HOOKS`, so when it's
+not enabled it doesn't cost anything. Owners of tracked values are referenced
+using weak references, so the cache manager never keeps objects alive.
+Values of :class:`.lazy_property` objects are never evicted because they are
+documented to be computed only once. Values that are cached without being
+computed (for example because they were loaded from a shared table or a
+snapshot) are tracked from the first time they're accessed.
+"""
+
+# Standard library modules.
+import collections
+import sys
+import threading
+import weakref
+
+# Modules included in our package.
+from property_manager import subscribe, unsubscribe
+
+# Public identifiers that require documentation.
+__all__ = (
+    'CACHE_MANAGER',
+    'CacheManager',
+    'disable_memory_budget',
+    'enable_memory_budget',
+    'estimate_size',
+)
+
+CACHE_MANAGER = None
+"""The active :class:`CacheManager` object (or :data:`None`)."""
+
+
+def enable_memory_budget(budget, sizeof=None):
+    """
+    Evict cached property values when their total size exceeds a budget.
+
+    :param budget: The maximum total size of cached values (an integer number of bytes).
+    :param sizeof: A callable that estimates the size of a value in bytes
+                   (defaults to :func:`estimate_size()`).
+    :returns: The active :class:`CacheManager` object.
+
+    If a cache manager was already enabled it's replaced.
+    """
+    global CACHE_MANAGER
+    disable_memory_budget()
+    CACHE_MANAGER = CacheManager(budget=budget, sizeof=sizeof)
+    subscribe(CACHE_MANAGER)
+    return CACHE_MANAGER
+
+
+def disable_memory_budget():
+    """Stop tracking and evicting cached property values."""
+    global CACHE_MANAGER
+    if CACHE_MANAGER is not None:
+        unsubscribe(CACHE_MANAGER)
+        CACHE_MANAGER = None
+
+
+def estimate_size(value, depth=2):
+    """
+    Estimate the memory used by a value.
+
+    :param value: The value whose size should be estimated.
+    :param depth: How deep to recurse into containers (an integer).
+    :returns: The estimated size in bytes (an integer).
+
+    This uses :func:`sys.getsizeof()` and includes the contents of lists,
+    tuples, sets, frozensets and dictionaries up to the given depth. Shared
+    objects are counted every time they're referenced, so this tends to
+    overestimate. Use the `sizeof` argument of :func:`enable_memory_budget()`
+    when you need something more accurate.
+    """
+    size = sys.getsizeof(value)
+    if depth > 0:
+        if isinstance(value, dict):
+            size += sum(estimate_size(k, depth - 1) + estimate_size(v, depth - 1) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(estimate_size(v, depth - 1) for v in value)
+    return size
+
+
+class CacheManager(object):
+
+    """
+    Process wide least recently used eviction of cached property values.
+
+    Don't create instances of this class yourself, use
+    :func:`enable_memory_budget()` instead.
+    """
+
+    def __init__(self, budget, sizeof=None):
+        """
+        Initialize a :class:`CacheManager` object.
+
+        :param budget: The maximum total size of cached values (an integer number of bytes).
+        :param sizeof: A callable that estimates the size of a value in bytes
+                       (defaults to :func:`estimate_size()`).
+        """
+        self.budget = budget
+        self.sizeof = sizeof or estimate_size
+        self.entries = collections.OrderedDict()
+        self.evictions = 0
+        self.lock = threading.RLock()
+        self.total_size = 0
+
+    def __call__(self, event):
+        """
+        Update the tracked values based on an event (see :func:`.subscribe()`).
+
+        :param event: A :class:`.PropertyEvent` object.
+        """
+        prop = event.property
+        if prop.cached and prop.resettable:
+            key = (id(event.instance), prop.__name__)
+            if event.operation == 'cached':
+                # Values that were cached without being computed (e.g. loaded
+                # from a shared table, a snapshot or PropertyManager.from_dict())
+                # are tracked the first time they're accessed.
+                if not self.touch(key) and event.instance.__dict__.get(prop.__name__) is event.value:
+                    self.track(event.instance, prop.__name__, event.value)
+            elif event.operation == 'computed':
+                self.track(event.instance, prop.__name__, event.value)
+            elif event.operation in ('assigned', 'reset'):
+                # Assigned values can't be recomputed so they're never evicted.
+                self.forget(key)
+
+    def __len__(self):
+        """The number of tracked values (an integer)."""
+        return len(self.entries)
+
+    def touch(self, key):
+        """
+        Mark a tracked value as the most recently used value.
+
+        :param key: A tuple with the :func:`id()` of the owner and the name of the property.
+        :returns: :data:`True` if the value is tracked, :data:`False` otherwise.
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.entries[key] = entry
+                return True
+            return False
+
+    def track(self, obj, name, value):
+        """
+        Start tracking a cached value and evict values when the budget is exceeded.
+
+        :param obj: The object that owns the property.
+        :param name: The name of the property (a string).
+        :param value: The cached value.
+        """
+        key = (id(obj), name)
+        try:
+            reference = weakref.ref(obj, lambda r: self.forget(key, r))
+        except TypeError:
+            # Objects that don't support weak references aren't tracked.
+            return
+        size = self.sizeof(value)
+        with self.lock:
+            self.forget(key)
+            self.entries[key] = (reference, size)
+            self.total_size += size
+            while self.total_size > self.budget and self.entries:
+                self.evict()
+
+    def forget(self, key, reference=None):
+        """
+        Stop tracking a value.
+
+        :param key: A tuple with the :func:`id()` of the owner and the name of the property.
+        :param reference: If this is given the value is only forgotten when
+                          its weak reference matches (used when owners are
+                          garbage collected).
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and (reference is None or entry[0] is reference):
+                del self.entries[key]
+                self.total_size -= entry[1]
+
+    def evict(self):
+        """
+        Evict the least recently used value.
+
+        Only the value in the :attr:`~object.__dict__` of the owner is
+        removed. When the property uses a shared table (see
+        :attr:`.custom_property.scope`) the value in the table is kept,
+        because it may still be used by other objects with equal keys (so
+        removing it wouldn't free any memory) and the table has its own
+        bound (see :class:`.KeyedCache`). The evicted value is then
+        loaded from the table instead of being recomputed.
+        """
+        with self.lock:
+            (owner_id, name), (reference, size) = self.entries.popitem(last=False)
+            self.total_size -= size
+            self.evictions += 1
+        owner = reference()
+        if owner is not None:
+            getattr(type(owner), name).discard_value(owner)
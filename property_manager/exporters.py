@@ -0,0 +1,99 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Exporters for the statistics collected by :mod:`property_manager`.
+
+The :func:`property_manager.stats()` function reports statistics about
+operations on properties (once :func:`property_manager.enable_statistics()`
+has been called). This module converts those statistics to formats
+understood by monitoring systems:
+
+- :func:`format_prometheus()` renders the `Prometheus text format`_.
+- :func:`export_statsd()` passes statsd_ style metrics to a callback.
+
+.. _Prometheus text format: https://prometheus.io/docs/instrumenting/exposition_formats/
+.. _statsd: https://github.com/statsd/statsd
+"""
+
+# Modules included in our package.
+from property_manager import stats
+
+# Public identifiers that require documentation.
+__all__ = (
+    'METRICS',
+    'export_statsd',
+    'format_prometheus',
+)
+
+METRICS = (
+    ('hits', 'counter', "Number of times an assigned or cached value was returned."),
+    ('misses', 'counter', "Number of times the value of a property was computed."),
+    ('environment', 'counter', "Number of times the value of a property came from an environment variable."),
+    ('assignments', 'counter', "Number of times a value was assigned to a property."),
+    ('resets', 'counter', "Number of times the value of a property was reset."),
+    ('total_time', 'counter', "Total number of seconds spent computing the value of a property."),
+    ('max_time', 'gauge', "Maximum number of seconds spent computing the value of a property."),
+)
+"""A tuple of tuples with the name, type and description of each metric."""
+
+
+def format_prometheus(statistics=None, prefix='property_manager'):
+    """
+    Render statistics in the Prometheus text format.
+
+    :param statistics: The statistics to render (a dictionary in the format
+                       returned by :func:`.stats()`, defaults to the result
+                       of :func:`.stats()`).
+    :param prefix: The prefix for metric names (a string).
+    :returns: The rendered metrics (a string).
+
+    The class and property names are reported using the labels ``class``
+    and ``property``.
+    """
+    if statistics is None:
+        statistics = stats()
+    lines = []
+    for name, kind, description in METRICS:
+        metric = '%s_%s%s' % (prefix, name, '_total' if kind == 'counter' else '')
+        lines.append('# HELP %s %s' % (metric, description))
+        lines.append('# TYPE %s %s' % (metric, kind))
+        for class_name, properties in sorted(statistics.items()):
+            for property_name, counters in sorted(properties.items()):
+                lines.append('%s{class="%s",property="%s"} %s' % (
+                    metric, escape_label(class_name), escape_label(property_name), counters[name],
+                ))
+    return '\n'.join(lines) + '\n'
+
+
+def export_statsd(callback, statistics=None, prefix='property_manager'):
+    """
+    Pass statistics to a statsd style callback.
+
+    :param callback: A callable that's called with three arguments for each
+                     metric: The dotted name of the metric (a string), the
+                     value of the metric (a number) and the statsd metric type
+                     (the string ``'c'`` for counters or ``'g'`` for gauges).
+    :param statistics: The statistics to export (a dictionary in the format
+                       returned by :func:`.stats()`, defaults to the result
+                       of :func:`.stats()`).
+    :param prefix: The prefix for metric names (a string).
+
+    Counters are reported as totals, so the callback is responsible for
+    computing deltas when the backend expects them.
+    """
+    if statistics is None:
+        statistics = stats()
+    for class_name, properties in sorted(statistics.items()):
+        for property_name, counters in sorted(properties.items()):
+            for name, kind, description in METRICS:
+                callback('.'.join((prefix, class_name, property_name, name)),
+                         counters[name], 'c' if kind == 'counter' else 'g')
+
+
+def escape_label(value):
+    """Escape a Prometheus label value (a string)."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,112 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Object pools for short lived :class:`.PropertyManager` objects.
+
+Loops that create and discard lots of short lived objects spend a significant
+amount of time allocating and garbage collecting them. The :class:`ObjectPool`
+class reuses objects using :func:`~property_manager.PropertyManager.reset()` instead:
+
+.. code-block:: python
+
+   from property_manager.pooling import ObjectPool
+
+   pool = ObjectPool(Record)
+   for line in lines:
+       with pool.borrow(text=line) as record:
+           process(record)
+
+Objects are validated in the same way as new objects, so pooled objects
+behave exactly like objects created by calling the class. Objects are cleared
+when they're returned to the pool, so the pool doesn't keep large assigned or
+cached values alive. Frozen and interned objects (see
+:attr:`.PropertyManager.frozen` and :attr:`.PropertyManager.interned`) are
+shared by design, so they're never added to a pool.
+"""
+
+# Standard library modules.
+import collections
+import contextlib
+
+# Modules included in our package.
+from property_manager import FROZEN_ATTRIBUTE, INTERNED_ATTRIBUTE, clear_state
+
+# Public identifiers that require documentation.
+__all__ = (
+    'ObjectPool',
+)
+
+
+class ObjectPool(object):
+
+    """A pool of reusable instances of a :class:`.PropertyManager` subclass."""
+
+    def __init__(self, cls, maxsize=1024):
+        """
+        Initialize an :class:`ObjectPool` object.
+
+        :param cls: A subclass of :class:`.PropertyManager`.
+        :param maxsize: The maximum number of idle objects kept in the pool (an integer).
+        """
+        self.cls = cls
+        self.maxsize = maxsize
+        self.idle = collections.deque()
+
+    def __len__(self):
+        """The number of idle objects in the pool (an integer)."""
+        return len(self.idle)
+
+    def acquire(self, **kw):
+        """
+        Get an initialized object from the pool.
+
+        :param kw: The keyword arguments used to initialize the object.
+        :returns: An instance of ``cls``.
+        :raises: The same exceptions as the initializer of ``cls``.
+
+        When the pool is empty a new object is created.
+        """
+        try:
+            obj = self.idle.pop()
+        except IndexError:
+            return self.cls(**kw)
+        obj.reset(**kw)
+        return obj
+
+    def release(self, obj):
+        """
+        Return an object to the pool.
+
+        :param obj: An object created by :func:`acquire()`.
+        :raises: :exc:`~exceptions.TypeError` when `obj` isn't an instance
+                 of ``cls``.
+
+        The assigned and cached values of the object are cleared. The object
+        must not be used after it has been returned to the pool.
+        """
+        if type(obj) is not self.cls:
+            msg = "Expected %s object, got %r instead!"
+            raise TypeError(msg % (self.cls.__name__, obj))
+        storage = obj.__dict__
+        if FROZEN_ATTRIBUTE not in storage and INTERNED_ATTRIBUTE not in storage and len(self.idle) < self.maxsize:
+            clear_state(obj)
+            self.idle.append(obj)
+
+    @contextlib.contextmanager
+    def borrow(self, **kw):
+        """
+        Use an object from the pool in a :keyword:`with` statement.
+
+        :param kw: The keyword arguments used to initialize the object.
+        :returns: A context manager that returns an instance of ``cls``
+                  and returns the object to the pool afterwards.
+        """
+        obj = self.acquire(**kw)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
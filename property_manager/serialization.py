@@ -0,0 +1,121 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Bulk conversion of :class:`.PropertyManager` objects to and from plain data.
+
+The :func:`~property_manager.PropertyManager.to_dict()` and
+:func:`~property_manager.PropertyManager.from_dict()` methods convert a single
+object to and from a dictionary, using the :class:`.PropertySchema` of the
+class so that no reflection is needed. This module builds on those methods to
+convert lists of objects:
+
+- :func:`to_dicts()` and :func:`from_dicts()` convert to and from lists of
+  dictionaries.
+- :func:`encode_json()` and :func:`decode_json()` convert to and from JSON.
+- :func:`encode_msgpack()` and :func:`decode_msgpack()` convert to and from
+  msgpack_ (this requires the optional ``msgpack`` package).
+
+.. _msgpack: https://msgpack.org/
+"""
+
+# Standard library modules.
+import json
+
+# External dependencies.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Public identifiers that require documentation.
+__all__ = (
+    'decode_json',
+    'decode_msgpack',
+    'encode_json',
+    'encode_msgpack',
+    'from_dicts',
+    'to_dicts',
+)
+
+
+def to_dicts(objects, computed=True, hidden=True):
+    """
+    Convert objects to dictionaries.
+
+    :param objects: An iterable of :class:`.PropertyManager` objects.
+    :param computed: Refer to :func:`~property_manager.PropertyManager.to_dict()`.
+    :param hidden: Refer to :func:`~property_manager.PropertyManager.to_dict()`.
+    :returns: A list of dictionaries.
+    """
+    return [obj.to_dict(computed=computed, hidden=hidden) for obj in objects]
+
+
+def from_dicts(cls, items):
+    """
+    Convert dictionaries to objects.
+
+    :param cls: A subclass of :class:`.PropertyManager`.
+    :param items: An iterable of dictionaries created by :func:`to_dicts()`.
+    :returns: A list of `cls` objects.
+    """
+    return [cls.from_dict(data) for data in items]
+
+
+def encode_json(objects, computed=True, hidden=True, **options):
+    """
+    Convert objects to JSON.
+
+    :param objects: An iterable of :class:`.PropertyManager` objects.
+    :param computed: Refer to :func:`~property_manager.PropertyManager.to_dict()`.
+    :param hidden: Refer to :func:`~property_manager.PropertyManager.to_dict()`.
+    :param options: Any keyword arguments are passed on to :func:`json.dumps()`.
+    :returns: A JSON encoded list of objects (a string).
+    """
+    return json.dumps(to_dicts(objects, computed=computed, hidden=hidden), **options)
+
+
+def decode_json(cls, text):
+    """
+    Convert JSON to objects.
+
+    :param cls: A subclass of :class:`.PropertyManager`.
+    :param text: A string created by :func:`encode_json()`.
+    :returns: A list of `cls` objects.
+    """
+    return from_dicts(cls, json.loads(text))
+
+
+def encode_msgpack(objects, computed=True, hidden=True):
+    """
+    Convert objects to msgpack.
+
+    :param objects: An iterable of :class:`.PropertyManager` objects.
+    :param computed: Refer to :func:`~property_manager.PropertyManager.to_dict()`.
+    :param hidden: Refer to :func:`~property_manager.PropertyManager.to_dict()`.
+    :returns: A msgpack encoded list of objects (a byte string).
+    :raises: :exc:`~exceptions.ImportError` when ``msgpack`` isn't installed.
+    """
+    return get_msgpack().packb(to_dicts(objects, computed=computed, hidden=hidden), use_bin_type=True)
+
+
+def decode_msgpack(cls, data):
+    """
+    Convert msgpack to objects.
+
+    :param cls: A subclass of :class:`.PropertyManager`.
+    :param data: A byte string created by :func:`encode_msgpack()`.
+    :returns: A list of `cls` objects.
+    :raises: :exc:`~exceptions.ImportError` when ``msgpack`` isn't installed.
+    """
+    return from_dicts(cls, get_msgpack().unpackb(data, raw=False))
+
+
+def get_msgpack():
+    """Get the ``msgpack`` module or raise :exc:`~exceptions.ImportError` when it's not installed."""
+    if msgpack is None:
+        raise ImportError("The msgpack package is required for msgpack support! (pip install msgpack)")
+    return msgpack
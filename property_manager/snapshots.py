@@ -0,0 +1,209 @@
+# Useful property variants for Python programming.
+#
+# Author: Peter Odding <peter@peterodding.com>
+# Last Change: October 18, 2026
+# URL: https://property-manager.readthedocs.io
+
+"""
+Warm-start snapshots of assigned and cached property values.
+
+Computing the values of :class:`.lazy_property` and :class:`.cached_property`
+objects can be expensive, and normally this work is redone in every process.
+This module makes it possible to save the assigned and cached values of a
+collection of :class:`.PropertyManager` objects to a compact binary file and
+to restore them later (for example before forking worker processes):
+
+.. code-block:: python
+
+   from property_manager.snapshots import load_snapshot, save_snapshot
+
+   # After warming up the caches (e.g. during deployment).
+   save_snapshot('/var/cache/my-service.snapshot', objects, version='2')
+
+   # On startup, with freshly constructed objects.
+   try:
+       load_snapshot('/var/cache/my-service.snapshot', objects, version='2')
+   except StaleSnapshotError:
+       pass
+
+Objects are matched by their class and
+:attr:`~property_manager.PropertyManager.key_values`, so only objects with
+:attr:`~property_manager.custom_property.key` properties can be included in a
+snapshot. Values are restored using :func:`.set_property()` so no getters are
+called. Values that were already set (e.g. passed to the initializer) are not
+overwritten, and values of properties whose
+:attr:`~property_manager.custom_property.version` tag changed are skipped.
+"""
+
+# Standard library modules.
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+
+# External dependencies.
+from verboselogs import VerboseLogger
+
+# Modules included in our package.
+from property_manager import (
+    custom_property,
+    inspect_properties,
+    refresh_cache_epoch,
+    set_property,
+)
+
+# Public identifiers that require documentation.
+__all__ = (
+    'SNAPSHOT_FORMAT',
+    'SNAPSHOT_MAGIC',
+    'StaleSnapshotError',
+    'export_state',
+    'load_snapshot',
+    'restore_state',
+    'save_snapshot',
+)
+
+SNAPSHOT_MAGIC = b'PMSNAP'
+"""The bytes at the start of every snapshot file (a byte string)."""
+
+SNAPSHOT_FORMAT = 1
+"""The version of the snapshot file format (an integer)."""
+
+# The header consists of the magic bytes followed by the format version.
+HEADER = struct.Struct('!%dsH' % len(SNAPSHOT_MAGIC))
+
+# Initialize a logger for this module.
+logger = VerboseLogger(__name__)
+
+
+class StaleSnapshotError(ValueError):
+
+    """Raised by :func:`load_snapshot()` when a snapshot is invalid or its version doesn't match."""
+
+
+def save_snapshot(filename, objects, version=None):
+    """
+    Save the assigned and cached values of a collection of objects to a file.
+
+    :param filename: The pathname of the snapshot (a string).
+    :param objects: An iterable of :class:`.PropertyManager` objects.
+    :param version: A version tag (any picklable value) that must be given
+                    to :func:`load_snapshot()` for the snapshot to be accepted.
+    :returns: The number of objects included in the snapshot (an integer).
+    :raises: :exc:`~exceptions.ValueError` when an object doesn't have any
+             :attr:`~property_manager.custom_property.key` properties.
+
+    The snapshot is written atomically (using a temporary file that's renamed
+    into place) so readers never see a partially written snapshot.
+    """
+    entries = []
+    for obj in objects:
+        if not obj.key_properties:
+            raise ValueError("Can't include %s object in snapshot because it has no key properties!"
+                             % type(obj).__name__)
+        state = export_state(obj)
+        if state:
+            entries.append((get_class_name(type(obj)), obj.key_values, state))
+    data = zlib.compress(pickle.dumps((version, entries), pickle.HIGHEST_PROTOCOL))
+    directory = os.path.dirname(os.path.abspath(filename))
+    handle, temporary_file = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as stream:
+            stream.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT))
+            stream.write(data)
+        getattr(os, 'replace', os.rename)(temporary_file, filename)
+    except Exception:
+        if os.path.exists(temporary_file):
+            os.unlink(temporary_file)
+        raise
+    logger.debug("Saved snapshot of %i objects to %s (%i bytes).", len(entries), filename, len(data))
+    return len(entries)
+
+
+def load_snapshot(filename, objects, version=None):
+    """
+    Restore the assigned and cached values of a collection of objects from a file.
+
+    :param filename: The pathname of the snapshot (a string).
+    :param objects: An iterable of :class:`.PropertyManager` objects.
+    :param version: The version tag that was given to :func:`save_snapshot()`.
+    :returns: The number of objects whose values were restored (an integer).
+    :raises: :exc:`StaleSnapshotError` when the file isn't a snapshot, was
+             created by an incompatible version of this module or when its
+             version tag doesn't match `version`.
+    """
+    with open(filename, 'rb') as handle:
+        header = handle.read(HEADER.size)
+        data = handle.read()
+    if len(header) != HEADER.size:
+        raise StaleSnapshotError("File %s is not a snapshot!" % filename)
+    magic, snapshot_format = HEADER.unpack(header)
+    if magic != SNAPSHOT_MAGIC:
+        raise StaleSnapshotError("File %s is not a snapshot!" % filename)
+    if snapshot_format != SNAPSHOT_FORMAT:
+        raise StaleSnapshotError("Snapshot %s uses unsupported format %i!" % (filename, snapshot_format))
+    try:
+        snapshot_version, entries = pickle.loads(zlib.decompress(data))
+    except Exception as e:
+        raise StaleSnapshotError("Failed to load snapshot %s! (%s)" % (filename, e))
+    if snapshot_version != version:
+        raise StaleSnapshotError("Snapshot %s has version %r, expected %r!" % (filename, snapshot_version, version))
+    index = dict(((get_class_name(type(obj)), obj.key_values), obj) for obj in objects)
+    restored = 0
+    for class_name, key_values, state in entries:
+        obj = index.get((class_name, key_values))
+        if obj is not None and restore_state(obj, state):
+            restored += 1
+    logger.debug("Restored values of %i objects from snapshot %s.", restored, filename)
+    return restored
+
+
+def export_state(obj):
+    """
+    Get the assigned and cached values of an object.
+
+    :param obj: A :class:`.PropertyManager` object.
+    :returns: A dictionary that maps property names to tuples with the
+              :attr:`~property_manager.custom_property.version` tag of the
+              property and its value.
+
+    The values of :attr:`~property_manager.custom_property.key` properties are
+    not included because they identify the object. Values that can't be
+    pickled are logged and skipped.
+    """
+    state = {}
+    for info in inspect_properties(type(obj)).properties:
+        if info.name in obj.__dict__ and not info.key and (info.cached or info.writable):
+            value = obj.__dict__[info.name]
+            try:
+                pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                logger.warning("Skipping value of %s.%s property because it can't be pickled!",
+                               type(obj).__name__, info.name, exc_info=True)
+            else:
+                state[info.name] = (info.descriptor.version, value)
+    return state
+
+
+def restore_state(obj, state):
+    """
+    Restore values exported by :func:`export_state()`.
+
+    :param obj: A :class:`.PropertyManager` object.
+    :param state: The dictionary returned by :func:`export_state()`.
+    :returns: :data:`True` if any values were restored, :data:`False` otherwise.
+    """
+    restored = False
+    refresh_cache_epoch(obj)
+    for name, (version, value) in state.items():
+        prop = getattr(type(obj), name, None)
+        if isinstance(prop, custom_property) and prop.version == version and name not in obj.__dict__:
+            set_property(obj, name, value)
+            restored = True
+    return restored
+
+
+def get_class_name(cls):
+    """Get the qualified name of a class (a string)."""
+    return '%s.%s' % (cls.__module__, cls.__name__)
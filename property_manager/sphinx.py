@@ -1,7 +1,7 @@
 # Useful property variants for Python programming.
 #
 # Author: Peter Odding <peter@peterodding.com>
-# Last Change: March 2, 2020
+# Last Change: October 18, 2026
 # URL: https://property-manager.readthedocs.io
 
 """
@@ -23,20 +23,53 @@ The entry point to this module is the :func:`setup()` function.
 """
 
 # Standard library modules.
+import hashlib
 import types
+import weakref
 
 # Modules included in our package.
-from property_manager import PropertyManager, custom_property, lazy_property, required_property
+from property_manager import (
+    PropertyManager,
+    __version__,
+    custom_property,
+    inspect_properties,
+    lazy_property,
+    required_property,
+)
 from humanfriendly.tables import format_rst_table
 from humanfriendly.text import compact, concatenate, format
 
 # Public identifiers that require documentation.
 __all__ = (
+    'CACHE_ATTRIBUTE',
+    'RENDERED_DOCS',
     'setup',
     'append_property_docs',
+    'merge_property_docs',
+    'render_property_docs',
+    'fingerprint_type',
     'TypeInspector',
 )
 
+CACHE_ATTRIBUTE = 'property_manager_docs'
+"""
+The name of the Sphinx build environment attribute used for caching (a string).
+
+The build environment is pickled by Sphinx between builds, so documentation
+stored in this attribute survives incremental builds. It's a dictionary that
+maps the fingerprints computed by :func:`fingerprint_type()` to tuples of
+strings (lines of reStructuredText).
+"""
+
+RENDERED_DOCS = weakref.WeakKeyDictionary()
+"""
+A mapping of :class:`.PropertyManager` subclasses to generated documentation.
+
+The keys of this mapping are classes and the values are tuples of strings
+(lines of reStructuredText). Used by :func:`render_property_docs()` to avoid
+inspecting the same class more than once.
+"""
+
 
 def setup(app):
     """
@@ -59,8 +92,18 @@ def setup(app):
     this module and call the :func:`setup()` function which will connect the
     :func:`append_property_docs()` function to ``autodoc-process-docstring``
     events.
+
+    The returned metadata tells Sphinx that this extension is safe to use
+    during parallel builds (``sphinx-build -j``). This is true because the
+    generated documentation only depends on the class being documented and
+    :data:`RENDERED_DOCS` is a per process cache. Generated documentation is
+    also stored in the Sphinx build environment (see :data:`CACHE_ATTRIBUTE`)
+    and :func:`merge_property_docs()` combines the caches of parallel
+    processes.
     """
     app.connect('autodoc-process-docstring', append_property_docs)
+    app.connect('env-merge-info', merge_property_docs)
+    return dict(parallel_read_safe=True, parallel_write_safe=True, version=__version__)
 
 
 def append_property_docs(app, what, name, obj, options, lines):
@@ -75,9 +118,99 @@ def append_property_docs(app, what, name, obj, options, lines):
     callback functions (i.e. I'm not going to document them here :-).
     """
     if is_suitable_type(obj):
+        generated = render_property_docs(obj, get_docs_cache(getattr(app, 'env', None)))
+        # Insert padding between the regular docstring and generated content.
+        if lines:
+            lines.append('')
+        lines.extend(generated)
+
+
+def merge_property_docs(app, env, docnames, other):
+    """
+    Merge the documentation cached by a parallel Sphinx process.
+
+    This function implements a callback for ``env-merge-info`` that copies the
+    documentation cached in the build environment of a parallel process (the
+    `other` argument) to the build environment of the main process.
+    """
+    cache = get_docs_cache(env)
+    if cache is not None:
+        cache.update(get_docs_cache(other) or {})
+
+
+def get_docs_cache(env):
+    """
+    Get the documentation cache stored in a Sphinx build environment.
+
+    :param env: A Sphinx build environment (or :data:`None`).
+    :returns: A dictionary (see :data:`CACHE_ATTRIBUTE`) or :data:`None`
+              when `env` is :data:`None`.
+    """
+    if env is not None:
+        cache = getattr(env, CACHE_ATTRIBUTE, None)
+        if cache is None:
+            cache = {}
+            setattr(env, CACHE_ATTRIBUTE, cache)
+        return cache
+
+
+def fingerprint_type(cls):
+    """
+    Compute a stable fingerprint of the inputs used to document a class.
+
+    :param cls: A subclass of :class:`.PropertyManager`.
+    :returns: A hexadecimal SHA1 digest (a string).
+
+    The fingerprint covers the name, module and superclasses of the class, the
+    names of the methods and properties defined by the class and the options of
+    those properties. It also includes the version of the `property-manager`
+    package so that a change in the generated markup invalidates the cache.
+    Docstrings are not included because they're not part of the generated
+    documentation.
+    """
+    state = [__version__, cls.__module__, cls.__name__]
+    state.extend("base:%s.%s" % (b.__module__, b.__name__) for b in cls.__bases__)
+    for name, value in sorted(cls.__dict__.items()):
+        if isinstance(value, types.FunctionType):
+            state.append("method:%s" % name)
+        elif isinstance(value, property):
+            options = [type(value).__name__]
+            if isinstance(value, custom_property):
+                options.extend("%s=%r" % (n, getattr(value, n)) for n in (
+                    'cached', 'environment_variable', 'key', 'repr',
+                    'required', 'resettable', 'writable',
+                ))
+            state.append("property:%s:%s" % (name, ",".join(options)))
+    return hashlib.sha1("\n".join(state).encode('UTF-8')).hexdigest()
+
+
+def render_property_docs(cls, cache=None):
+    """
+    Render an overview with properties and methods of a :class:`.PropertyManager` subclass.
+
+    :param cls: A subclass of :class:`.PropertyManager`.
+    :param cache: A dictionary with previously generated documentation
+                  (see :data:`CACHE_ATTRIBUTE`) or :data:`None`.
+    :returns: A tuple of strings (lines of reStructuredText).
+
+    The result is cached in :data:`RENDERED_DOCS` so that a class is only
+    inspected once, no matter how many times Sphinx asks about it. When a
+    `cache` is given, classes whose :func:`fingerprint_type()` didn't change
+    since a previous build aren't inspected at all.
+    """
+    try:
+        return RENDERED_DOCS[cls]
+    except KeyError:
+        fingerprint = None
+        if cache is not None:
+            fingerprint = fingerprint_type(cls)
+            generated = cache.get(fingerprint)
+            if generated is not None:
+                RENDERED_DOCS[cls] = generated
+                return generated
         paragraphs = []
-        details = TypeInspector(type=obj)
-        paragraphs.append(format("Here's an overview of the :class:`%s` class:", obj.__name__))
+        details = TypeInspector(type=cls)
+        paragraphs.append(format("Here's an overview of the :class:`%s` class:", cls.__name__))
         # Whitespace in labels is replaced with non breaking spaces to disable wrapping of the label text.
         data = [(format("%s:", label.replace(' ', u'\u00A0')), text) for label, text in details.overview if text]
         paragraphs.append(format_rst_table(data))
@@ -85,10 +218,11 @@ def append_property_docs(app, what, name, obj, options, lines):
         hints = (details.required_hint, details.initializer_hint)
         if any(hints):
             paragraphs.append(' '.join(h for h in hints if h))
-        # Insert padding between the regular docstring and generated content.
-        if lines:
-            lines.append('')
-        lines.extend('\n\n'.join(paragraphs).splitlines())
+        generated = tuple('\n\n'.join(paragraphs).splitlines())
+        RENDERED_DOCS[cls] = generated
+        if fingerprint is not None:
+            cache[fingerprint] = generated
+        return generated
 
 
 def is_suitable_type(obj):
@@ -150,7 +284,7 @@ class TypeInspector(PropertyManager):
     @lazy_property
     def properties(self):
         """An iterable of tuples with property names (strings) and values (:class:`property` objects)."""
-        return [(n, v) for n, v in self.members if isinstance(v, property)]
+        return [(p.name, p.descriptor) for p in inspect_properties(self.type).properties if p.owner is self.type]
 
     @lazy_property
     def public_methods(self):
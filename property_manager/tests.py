@@ -7,11 +7,18 @@
 """Automated tests for the :mod:`property_manager` module."""
 
 # Standard library modules.
+import copy
+import gc
 import logging
 import os
+import pickle
 import random
+import shutil
 import sys
+import tempfile
+import threading
 import unittest
+import weakref
 
 # External dependencies.
 import coloredlogs
@@ -29,16 +36,55 @@ from property_manager import (
     RESETTABLE_CACHED_PROPERTY_NOTE,
     RESETTABLE_WRITABLE_PROPERTY_NOTE,
     WRITABLE_PROPERTY_NOTE,
+    KeyedCache,
     PropertyManager,
     cached_property,
+    collect_changes,
     custom_property,
+    disable_statistics,
+    enable_statistics,
+    invalidate_all,
+    log_event,
     key_property,
     lazy_property,
     mutable_property,
     required_property,
+    stats,
+    subscribe,
+    unsubscribe,
     writable_property,
 )
-from property_manager.sphinx import TypeInspector, setup, append_property_docs
+from property_manager.backends import FileCache, SQLiteCache
+from property_manager.buffers import (
+    SEGMENTS,
+    get_segment_name,
+    mapped_property,
+    shared_property,
+    wait_for_segment,
+)
+from property_manager.benchmarks import benchmark_operations, benchmark_pickle, compare_results
+from property_manager.eviction import disable_memory_budget, enable_memory_budget
+from property_manager.exporters import export_statsd, format_prometheus
+from property_manager.pooling import ObjectPool
+from property_manager.serialization import (
+    decode_json,
+    decode_msgpack,
+    encode_json,
+    encode_msgpack,
+    from_dicts,
+    msgpack,
+    to_dicts,
+)
+from property_manager.snapshots import StaleSnapshotError, load_snapshot, save_snapshot
+from property_manager.sphinx import (
+    TypeInspector,
+    append_property_docs,
+    fingerprint_type,
+    get_docs_cache,
+    merge_property_docs,
+    render_property_docs,
+    setup,
+)
 
 # Initialize a logger for this module.
 logger = VerboseLogger(__name__)
@@ -203,6 +249,418 @@ class PropertyManagerTestCase(unittest.TestCase):
         assert "important=1" in repr(instance)
         assert "optional=42" in repr(instance)
 
+    def test_cheap_repr(self):
+        """Test that :attr:`.PropertyManager.repr_mode` and :attr:`.PropertyManager.repr_limit` work."""
+        evaluations = []
+
+        class CheapReprTest(PropertyManager):
+
+            repr_mode = 'cached'
+
+            @required_property
+            def important(self):
+                pass
+
+            @lazy_property
+            def expensive(self):
+                evaluations.append('expensive')
+                return 'x' * 100
+
+        instance = CheapReprTest(important=1)
+        assert repr(instance) == "CheapReprTest(expensive=<not computed>, important=1)"
+        assert evaluations == []
+        instance.expensive
+        assert repr(instance) == "CheapReprTest(expensive=%r, important=1)" % ('x' * 100)
+        # Large values can be truncated.
+        CheapReprTest.repr_limit = 10
+        assert repr(instance) == "CheapReprTest(expensive='xxxxxxxxx..., important=1)"
+        # The mode can also be selected globally.
+        CheapReprTest.repr_mode = None
+        saved_mode = property_manager.REPR_MODE
+        property_manager.REPR_MODE = 'cached'
+        try:
+            assert 'expensive=<not computed>' in repr(CheapReprTest(important=2))
+        finally:
+            property_manager.REPR_MODE = saved_mode
+        assert 'expensive=<not computed>' not in repr(CheapReprTest(important=2))
+        assert evaluations == ['expensive', 'expensive']
+
+    def test_cached_repr(self):
+        """Test that the :func:`repr()` of objects with key properties is cached."""
+        class CachedReprTest(PropertyManager):
+
+            @key_property
+            def name(self):
+                pass
+
+        class CustomReprTest(CachedReprTest):
+
+            @property
+            def repr_properties(self):
+                return ['name', 'extra']
+
+            @mutable_property
+            def extra(self):
+                return 1
+
+        instance = CachedReprTest(name='a')
+        assert repr(instance) == "CachedReprTest(name='a')"
+        assert instance.__dict__[property_manager.REPR_ATTRIBUTE] == (None, "CachedReprTest(name='a')")
+        assert repr(instance) is repr(instance)
+        # Changing the limit renders the representation again.
+        CachedReprTest.repr_limit = 2
+        assert repr(instance) == "CachedReprTest(name='a...)"
+        CachedReprTest.repr_limit = None
+        # The cache isn't used when a subclass changes the representation.
+        custom = CustomReprTest(name='b')
+        assert repr(custom) == "CustomReprTest(name='b', extra=1)"
+        custom.extra = 2
+        assert repr(custom) == "CustomReprTest(name='b', extra=2)"
+        assert property_manager.REPR_ATTRIBUTE not in custom.__dict__
+
+    def test_freeze(self):
+        """Test that :func:`.PropertyManager.freeze()` makes objects immutable."""
+        class FreezeTest(PropertyManager):
+
+            @key_property
+            def name(self):
+                pass
+
+            @mutable_property
+            def option(self):
+                return 1
+
+            @cached_property
+            def computed(self):
+                return [self.name, self.option]
+
+        instance = FreezeTest(name='a', option=2)
+        assert not instance.is_frozen
+        instance.freeze(render=True)
+        assert instance.is_frozen
+        assert property_manager.REPR_ATTRIBUTE in instance.__dict__
+        assert hash(instance) == hash(FreezeTest(name='a'))
+        assert instance.key_values == (('name', 'a'),)
+        # Assignment and deletion are blocked.
+        self.assertRaises(AttributeError, setattr, instance, 'option', 3)
+        self.assertRaises(AttributeError, delattr, instance, 'option')
+        self.assertRaises(AttributeError, delattr, instance, 'computed')
+        # Cached values are still computed on demand and shared between threads.
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(instance.computed)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(r is instance.computed for r in results)
+        # Copies remain frozen.
+        assert copy.copy(instance).is_frozen
+        pickled = PicklingTest(name='a')
+        pickled.freeze()
+        assert pickle.loads(pickle.dumps(pickled)).is_frozen
+        # Classes can freeze their instances automatically.
+        FreezeTest.frozen = True
+        assert FreezeTest(name='b').is_frozen
+
+        # Private attributes of subclasses don't collide with our bookkeeping.
+        class PrivateAttributeTest(PropertyManager):
+
+            def __init__(self, **kw):
+                self._frozen = False
+                self._dirty = set()
+                super(PrivateAttributeTest, self).__init__(**kw)
+
+            @mutable_property
+            def option(self):
+                return 1
+
+        instance = PrivateAttributeTest(option=2)
+        instance.option = 3
+        assert not instance.is_frozen
+        clone = copy.copy(instance)
+        assert (clone._frozen, clone._dirty, clone.option) == (False, set(), 3)
+
+    def test_interning(self):
+        """Test that :attr:`.PropertyManager.interned` reuses objects with the same key values."""
+        class InterningTest(PropertyManager):
+
+            interned = True
+
+            @key_property
+            def name(self):
+                pass
+
+            @writable_property
+            def option(self):
+                return 1
+
+        a1 = InterningTest(name='a', option=2)
+        a2 = InterningTest(name='a')
+        assert a1 is a2
+        assert InterningTest(name='a', option=2) is a1
+        assert InterningTest(name='b') is not a1
+        # Conflicting values for other properties are rejected.
+        self.assertRaises(ValueError, InterningTest, name='a', option=3)
+        # Objects aren't kept alive by the interning table.
+        key_values = a1.key_values
+        table = property_manager.INTERNED_INSTANCES[InterningTest]
+        del a1, a2
+        gc.collect()
+        assert key_values not in table
+        assert InterningTest(name='a', option=3).option == 3
+
+        # Values are converted before they're looked up and compared.
+        class ConvertedInterningTest(PropertyManager):
+
+            interned = True
+
+            @key_property(converter=int)
+            def port(self):
+                pass
+
+            @writable_property(converter=int)
+            def option(self):
+                return 1
+
+        instance = ConvertedInterningTest(port='80', option='2')
+        assert ConvertedInterningTest(port='80') is instance
+        assert ConvertedInterningTest(port=80, option='2') is instance
+        self.assertRaises(ValueError, ConvertedInterningTest, port='http')
+
+    def test_reset_and_pooling(self):
+        """Test that :func:`.PropertyManager.reset()` and :class:`.ObjectPool` reuse objects."""
+        class PoolingTest(PropertyManager):
+
+            @required_property
+            def name(self):
+                pass
+
+            @mutable_property
+            def option(self):
+                return 1
+
+            @lazy_property
+            def computed(self):
+                return [self.name]
+
+        instance = PoolingTest(name='a', option=2)
+        assert instance.computed == ['a']
+        instance.reset(name='b')
+        assert (instance.name, instance.option, instance.computed) == ('b', 1, ['b'])
+        # Validation is the same as for new objects.
+        self.assertRaises(TypeError, instance.reset)
+        self.assertRaises(TypeError, instance.reset, name='c', unknown=1)
+        # Frozen objects can't be reset.
+        instance = PoolingTest(name='a')
+        instance.freeze()
+        self.assertRaises(AttributeError, instance.reset, name='b')
+        # Objects are reused by the pool.
+        pool = ObjectPool(PoolingTest, maxsize=1)
+        with pool.borrow(name='a') as first:
+            assert first.name == 'a'
+        assert len(pool) == 1 and not first.__dict__
+        with pool.borrow(name='b') as second:
+            assert second is first
+            assert pool.acquire(name='c') is not second
+        self.assertRaises(TypeError, pool.release, object())
+        pool.release(instance)
+        assert len(pool) == 1
+
+    def test_type_validation(self):
+        """Test the type, converter and validator options of :class:`.custom_property`."""
+        class TypeValidationTest(PropertyManager):
+
+            @required_property(converter=int, validator=lambda port: 0 < port < 65536)
+            def port(self):
+                pass
+
+            @mutable_property(type=(str, bytes))
+            def host(self):
+                return 'localhost'
+
+        instance = TypeValidationTest(port='8080')
+        assert instance.port == 8080
+        instance.host = 'example.com'
+        assert instance.host == 'example.com'
+        # None can always be assigned.
+        instance.host = None
+        assert instance.host is None
+        with self.assertRaises(TypeError) as context:
+            instance.host = 42
+        assert 'TypeValidationTest.host' in str(context.exception)
+        assert 'expected str' in str(context.exception)
+        with self.assertRaises(ValueError) as context:
+            instance.port = 'http'
+        assert 'TypeValidationTest.port' in str(context.exception)
+        with self.assertRaises(ValueError) as context:
+            instance.port = 0
+        assert 'rejected' in str(context.exception)
+        assert instance.port == 8080
+        # The initializer validates values as well.
+        self.assertRaises(ValueError, TypeValidationTest, port=70000)
+
+    def test_observers(self):
+        """Test that :func:`.PropertyManager.observe()` and :func:`.PropertyManager.batch_updates()` report changes."""
+        class ObserverTest(PropertyManager):
+
+            @mutable_property
+            def host(self):
+                return 'localhost'
+
+            @mutable_property
+            def port(self):
+                return 80
+
+            @mutable_property
+            def broken(self):
+                raise RuntimeError('boom')
+
+        instance = ObserverTest()
+        changes, port_changes = [], []
+        instance.observe(changes.append)
+        instance.observe(port_changes.append, 'port')
+        self.assertRaises(TypeError, instance.observe, changes.append, 'unknown')
+        # Getters aren't called to report old values.
+        instance.host = 'example.com'
+        assert [(c.name, c.operation, c.old_value, c.new_value) for c in changes[0]] == [
+            ('host', 'assigned', None, 'example.com'),
+        ]
+        assert not port_changes
+        instance.broken = 'fixed'
+        assert changes[-1][0].new_value == 'fixed'
+        del changes[1:]
+        # Assigning the same value doesn't report a change.
+        instance.host = 'example.com'
+        assert len(changes) == 1
+        # Changes inside a batch are coalesced into one notification.
+        del changes[:]
+        with instance.batch_updates():
+            instance.port = 8080
+            instance.port = 8081
+            instance.host = 'other.example.com'
+            instance.host = 'example.com'
+            with instance.batch_updates():
+                instance.port = 8082
+            assert not changes
+        assert [(c.name, c.old_value, c.new_value) for c in changes[0]] == [('port', None, 8082)]
+        assert len(changes) == 1 and len(port_changes) == 1
+        # Resets are reported as well.
+        del instance.port
+        assert changes[-1][0].operation == 'reset'
+        assert changes[-1][0].old_value == 8082
+        # Observers aren't copied.
+        clone = copy.copy(instance)
+        clone.host = 'clone.example.com'
+        assert len(changes) == 2
+        instance.unobserve(changes.append)
+        instance.unobserve(port_changes.append)
+        instance.port = 1
+        assert len(changes) == 2 and len(port_changes) == 2
+
+    def test_change_tracking(self):
+        """Test that :attr:`.PropertyManager.track_changes` records changed properties."""
+        class ChangeTrackingTest(PropertyManager):
+
+            track_changes = True
+
+            @key_property
+            def id(self):
+                pass
+
+            @mutable_property
+            def name(self):
+                return 'unnamed'
+
+            @mutable_property
+            def size(self):
+                raise RuntimeError('boom')
+
+            @cached_property
+            def computed(self):
+                return [self.name]
+
+        instance = ChangeTrackingTest(id=1, name='a')
+        assert instance.dirty_properties == []
+        instance.name = 'b'
+        instance.size = 42
+        instance.size = 43
+        # Getters aren't called (values that weren't assigned are reported as None).
+        assert instance.get_changes() == {'name': ('a', 'b'), 'size': (None, 43)}
+        # Restoring the previous value means the property is clean again.
+        instance.name = 'a'
+        assert instance.dirty_properties == ['size']
+        instance.mark_clean()
+        assert instance.dirty_properties == []
+        # Resets count as changes, but only for properties that support assignment.
+        del instance.size
+        assert instance.computed == ['a']
+        instance.clear_cached_properties()
+        assert instance.get_changes() == {'size': (43, None)}
+        # Copies have their own record of changes.
+        clone = copy.copy(instance)
+        clone.name = 'c'
+        assert instance.dirty_properties == ['size']
+        assert clone.dirty_properties == ['name', 'size']
+        # Changes can be collected in bulk.
+        other = ChangeTrackingTest(id=2)
+        assert collect_changes([instance, clone, other], mark_clean=True) == [
+            (instance, {'size': (43, None)}),
+            (clone, {'name': ('a', 'c'), 'size': (43, None)}),
+        ]
+        assert collect_changes([instance, clone, other]) == []
+        # Classes have to opt in.
+        self.assertRaises(TypeError, lambda: PropertyManager().dirty_properties)
+        self.assertRaises(TypeError, PropertyManager().mark_clean)
+
+    def test_dependency_tracking(self):
+        """Test that :attr:`~.custom_property.track_dependencies` clears stale cached values."""
+        class DependencyParent(PropertyManager):
+
+            @mutable_property
+            def timeout(self):
+                return 10
+
+            @mutable_property
+            def unrelated(self):
+                return None
+
+        class DependencyChild(PropertyManager):
+
+            @required_property
+            def parent(self):
+                pass
+
+            @cached_property(track_dependencies=True)
+            def session(self):
+                return {'timeout': self.parent.timeout}
+
+            @cached_property(track_dependencies=True)
+            def summary(self):
+                return 'timeout=%i' % self.session['timeout']
+
+        parent = DependencyParent()
+        child = DependencyChild(parent=parent)
+        assert child.summary == 'timeout=10'
+        session = child.session
+        # Unrelated changes don't clear cached values.
+        parent.unrelated = 42
+        assert child.session is session
+        # Changing an input clears the values computed from it (transitively).
+        parent.timeout = 20
+        assert 'session' not in child.__dict__ and 'summary' not in child.__dict__
+        assert child.summary == 'timeout=20'
+        del parent.timeout
+        assert child.summary == 'timeout=10'
+        # Assigning a new parent clears the cached values as well.
+        child.parent = DependencyParent(timeout=30)
+        assert child.summary == 'timeout=30'
+        # Dependencies don't keep objects alive.
+        reference = weakref.ref(child)
+        del child
+        gc.collect()
+        assert reference() is None
+        parent.timeout = 40
+
     def test_property_injection(self):
         """Test that :class:`.PropertyManager` raises an error for unknown properties."""
         class PropertyInjectionTest(PropertyManager):
@@ -305,6 +763,476 @@ class PropertyManagerTestCase(unittest.TestCase):
         # Make sure the value of the cached property *was* cleared.
         assert instance.cached == (42 * 2 * 2)
 
+    def test_epoch_invalidation(self):
+        """Test that :func:`.invalidate_all()` lazily invalidates cached values."""
+        class EpochParent(PropertyManager):
+
+            @mutable_property
+            def counter(self):
+                return 1
+
+            @cached_property
+            def cached(self):
+                return self.counter * 2
+
+            @lazy_property
+            def lazy(self):
+                return self.counter * 2
+
+        class EpochChild(EpochParent):
+            pass
+
+        class EpochOther(EpochParent):
+            pass
+
+        parent, child, other = EpochParent(), EpochChild(), EpochOther()
+        for instance in parent, child, other:
+            assert instance.cached == 2
+            assert instance.lazy == 2
+            instance.counter = 2
+        # Invalidating a class affects its subclasses but not unrelated classes.
+        invalidate_all(EpochChild)
+        assert parent.cached == 2
+        assert child.cached == 4
+        assert other.cached == 2
+        invalidate_all(EpochParent)
+        assert parent.cached == 4
+        assert other.cached == 4
+        # Assigned values and lazy properties are never invalidated.
+        parent.counter = 3
+        invalidate_all()
+        assert parent.counter == 3
+        assert parent.lazy == 2
+        assert parent.cached == 6
+        # Values computed after an invalidation remain cached.
+        parent.counter = 4
+        assert parent.cached == 6
+
+        # Values assigned after an invalidation aren't thrown away.
+        class EpochWritable(PropertyManager):
+
+            @cached_property(writable=True)
+            def value(self):
+                return 'computed'
+
+        instance = EpochWritable()
+        instance.value = 'assigned'
+        assert instance.value == 'assigned'
+        assert EpochWritable(value='via init').value == 'via init'
+        # Values computed while an invalidation happens aren't cached.
+        config = dict(version=1, reload=True)
+
+        class EpochReload(PropertyManager):
+
+            @cached_property
+            def value(self):
+                version = config['version']
+                if config.pop('reload', False):
+                    config['version'] = 2
+                    invalidate_all()
+                return version
+
+        instance = EpochReload()
+        assert instance.value == 1
+        assert instance.value == 2
+        config['version'] = 3
+        assert instance.value == 2
+
+    def test_shared_scope(self):
+        """Test that ``scope='key'`` shares computed values between objects with equal keys."""
+        table = KeyedCache(maxsize=2)
+
+        class SharedScopeTest(PropertyManager):
+
+            computations = 0
+
+            @key_property
+            def name(self):
+                pass
+
+            @cached_property(backend=table)
+            def expensive(self):
+                SharedScopeTest.computations += 1
+                return [self.name]
+
+            @cached_property(scope='key')
+            def default_table(self):
+                return [self.name]
+
+        a1, a2, b = SharedScopeTest(name='a'), SharedScopeTest(name='a'), SharedScopeTest(name='b')
+        assert a1.expensive is a2.expensive
+        assert a1.default_table is a2.default_table
+        assert b.expensive == ['b']
+        assert SharedScopeTest.computations == 2
+        # Resetting the property removes the shared value.
+        del a1.expensive
+        assert a1.expensive is not a2.expensive
+        assert SharedScopeTest.computations == 3
+        # The table is bounded.
+        SharedScopeTest(name='c').expensive
+        assert len(table) == 2
+        # Shared values are invalidated by invalidate_all().
+        stale = a1.default_table
+        invalidate_all(SharedScopeTest)
+        a3 = SharedScopeTest(name='a')
+        assert a3.default_table is not stale
+        assert a3.default_table == ['a']
+        assert a1.default_table is a3.default_table
+        # Values can expire.
+        expiring = KeyedCache(ttl=-1)
+        expiring.set('key', 'value')
+        assert expiring.get('key') is None
+
+    def test_persistent_backends(self):
+        """Test that :class:`.FileCache` and :class:`.SQLiteCache` persist values between instances."""
+        directory = tempfile.mkdtemp()
+        try:
+            for backend in (FileCache(os.path.join(directory, 'files')),
+                            SQLiteCache(os.path.join(directory, 'cache.sqlite3'))):
+                computations = []
+
+                def create_class(version):
+                    class PersistentTest(PropertyManager):
+
+                        @key_property
+                        def name(self):
+                            pass
+
+                        @cached_property(backend=backend, version=version)
+                        def expensive(self):
+                            computations.append(self.name)
+                            return [self.name]
+
+                    return PersistentTest
+
+                assert create_class('1')(name='a').expensive == ['a']
+                # A new class (simulating a restart) reuses the stored value.
+                assert create_class('1')(name='a').expensive == ['a']
+                assert computations == ['a']
+                # A different version tag doesn't.
+                assert create_class('2')(name='a').expensive == ['a']
+                assert computations == ['a', 'a']
+                # Deleting the property removes the stored value.
+                instance = create_class('2')(name='a')
+                del instance.expensive
+                assert instance.expensive == ['a']
+                assert computations == ['a', 'a', 'a']
+                # Values that can't be pickled are silently not stored.
+                backend.set('unpicklable', lambda: None)
+                assert backend.get('unpicklable') is None
+                # Clearing the backend removes all stored values.
+                backend.clear()
+                assert create_class('2')(name='a').expensive == ['a']
+                assert len(computations) == 4
+            # The size of the cache is bounded.
+            bounded = FileCache(os.path.join(directory, 'bounded'), max_size=1024)
+            for i in range(10):
+                bounded.set(i, 'x' * 200)
+            assert sum(size for filename, size, mtime in bounded.find_entries()) <= 1024
+            bounded = SQLiteCache(os.path.join(directory, 'bounded.sqlite3'), max_size=1024)
+            for i in range(10):
+                bounded.set(i, 'x' * 200)
+            assert bounded.get(9) is not None
+            assert bounded.get(0) is None
+            # Child processes don't use the SQLite connection of their parent.
+            if hasattr(os, 'fork'):
+                shared = SQLiteCache(os.path.join(directory, 'forked.sqlite3'))
+                shared.set('parent', 1)
+                parent_connection = shared.connection
+                read_end, write_end = os.pipe()
+                pid = os.fork()
+                if pid == 0:
+                    try:
+                        shared.set('child', 2)
+                        ok = shared.get('parent') == 1 and shared.connection is not parent_connection
+                        os.write(write_end, b'1' if ok else b'0')
+                    finally:
+                        os._exit(0)
+                os.close(write_end)
+                assert os.read(read_end, 1) == b'1'
+                os.close(read_end)
+                os.waitpid(pid, 0)
+                assert shared.connection is parent_connection
+                assert shared.get('child') == 2
+            # Backends that can't store values don't break properties.
+            blocker = os.path.join(directory, 'blocker')
+            with open(blocker, 'w') as handle:
+                handle.write('not a directory')
+            for backend in (FileCache(blocker), SQLiteCache(os.path.join(blocker, 'cache.sqlite3'))):
+
+                class UnavailableBackendTest(PropertyManager):
+
+                    @key_property
+                    def name(self):
+                        pass
+
+                    @cached_property(backend=backend)
+                    def expensive(self):
+                        return [self.name]
+
+                instance = UnavailableBackendTest(name='a')
+                assert instance.expensive == ['a']
+                del instance.expensive
+                assert instance.expensive == ['a']
+        finally:
+            shutil.rmtree(directory)
+
+    def test_snapshots(self):
+        """Test that :func:`.save_snapshot()` and :func:`.load_snapshot()` restore cached values."""
+        computations = []
+
+        class SnapshotTest(PropertyManager):
+
+            @key_property
+            def name(self):
+                pass
+
+            @mutable_property
+            def assigned(self):
+                return None
+
+            @lazy_property
+            def expensive(self):
+                computations.append(self.name)
+                return self.name.upper()
+
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, 'snapshot')
+            objects = [SnapshotTest(name='a', assigned=1), SnapshotTest(name='b')]
+            assert [o.expensive for o in objects] == ['A', 'B']
+            assert save_snapshot(filename, objects, version=1) == 2
+            # Restoring fills in the values without calling the getters.
+            fresh = [SnapshotTest(name='a'), SnapshotTest(name='b'), SnapshotTest(name='c')]
+            assert load_snapshot(filename, fresh, version=1) == 2
+            assert [o.expensive for o in fresh] == ['A', 'B', 'C']
+            assert fresh[0].assigned == 1
+            assert computations == ['a', 'b', 'c']
+            # Values that were already set are not overwritten.
+            overridden = SnapshotTest(name='a', assigned=2)
+            load_snapshot(filename, [overridden], version=1)
+            assert overridden.assigned == 2
+            # Stale snapshots are rejected.
+            self.assertRaises(StaleSnapshotError, load_snapshot, filename, fresh, version=2)
+            with open(filename, 'wb') as handle:
+                handle.write(b'garbage')
+            self.assertRaises(StaleSnapshotError, load_snapshot, filename, fresh, version=1)
+            # Objects without key properties can't be included.
+            self.assertRaises(ValueError, save_snapshot, filename, [PropertyManager()])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_mapped_property(self):
+        """Test that :class:`.mapped_property` exposes memory mapped files."""
+        if sys.version_info[0] < 3:
+            self.assertRaises(NotImplementedError, mapped_property, lambda self: b'')
+            return self.skipTest("memory mapped properties require Python 3")
+        directory = tempfile.mkdtemp()
+        try:
+            computations = []
+            table = os.path.join(directory, 'table')
+            with open(table, 'wb') as handle:
+                handle.write(b'lookup table')
+
+            class MappedTest(PropertyManager):
+
+                @key_property
+                def name(self):
+                    pass
+
+                @mapped_property(directory=os.path.join(directory, 'generated'))
+                def generated(self):
+                    computations.append(self.name)
+                    return self.name.encode('ascii') * 3
+
+                @mapped_property
+                def existing(self):
+                    return table
+
+                @mapped_property
+                def anonymous(self):
+                    return b''
+
+            instance = MappedTest(name='a')
+            assert isinstance(instance.generated, memoryview)
+            assert instance.generated.readonly
+            assert instance.generated.tobytes() == b'aaa'
+            assert instance.existing.tobytes() == b'lookup table'
+            assert instance.anonymous.tobytes() == b''
+            # Other objects with the same key map the existing file.
+            assert MappedTest(name='a').generated.tobytes() == b'aaa'
+            assert computations == ['a']
+            # Resetting the property closes the mapping.
+            mapping = instance.existing.obj
+            del instance.existing
+            assert mapping.closed
+            assert instance.existing.tobytes() == b'lookup table'
+            # Mappings are also closed when values are invalidated, evicted or cleared.
+            mapping = instance.existing.obj
+            invalidate_all(MappedTest)
+            assert instance.existing.tobytes() == b'lookup table'
+            assert mapping.closed
+            mapping = instance.existing.obj
+            enable_memory_budget(0)
+            try:
+                instance.existing
+            finally:
+                disable_memory_budget()
+            assert mapping.closed
+            mapping = instance.existing.obj
+            instance.reset(name='b')
+            assert mapping.closed
+        finally:
+            shutil.rmtree(directory)
+
+    def test_shared_property(self):
+        """Test that :class:`.shared_property` publishes values in shared memory."""
+        if not hasattr(os, 'fork'):
+            return self.skipTest("shared memory test requires os.fork()")
+        import multiprocessing
+        computations = []
+
+        class SharedMemoryTest(PropertyManager):
+
+            @key_property
+            def name(self):
+                pass
+
+            @shared_property(version=random.random())
+            def payload(self):
+                computations.append(self.name)
+                return bytearray(self.name.encode('ascii') * 1000)
+
+        owner = SharedMemoryTest(name='x')
+        assert owner.payload.readonly
+        assert owner.payload.tobytes() == b'x' * 1000
+        if property_manager.buffers.shared_memory is None:
+            return self.skipTest("shared memory requires Python 3.8 or later")
+        # Other objects with the same key attach to the same segment.
+        assert SharedMemoryTest(name='x').payload.tobytes() == b'x' * 1000
+        assert computations == ['x']
+        # Child processes attach to the segment on first access.
+        segment_name = get_segment_name(SharedMemoryTest.payload.get_key(owner))
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+
+        def child():
+            # Forget the inherited segment to make sure the child attaches to it.
+            SEGMENTS.pop(segment_name)
+            queue.put((SharedMemoryTest(name='x').payload.tobytes() == b'x' * 1000, computations))
+
+        process = context.Process(target=child)
+        process.start()
+        assert queue.get(timeout=30) == (True, ['x'])
+        process.join()
+        # Resetting the property of the owner removes the segment.
+        del owner.payload
+        assert segment_name not in SEGMENTS
+        # So does invalidating or clearing the value of the owner.
+        assert owner.payload.tobytes() == b'x' * 1000
+        published = SEGMENTS[segment_name]
+        invalidate_all(SharedMemoryTest)
+        assert owner.payload.tobytes() == b'x' * 1000
+        assert SEGMENTS[segment_name] is not published
+        owner.reset(name='x')
+        assert segment_name not in SEGMENTS
+        # Segments that are still being published aren't trusted.
+        segment = property_manager.buffers.shared_memory.SharedMemory(name=segment_name, create=True, size=64)
+        try:
+            assert wait_for_segment(segment, timeout=0.01) is None
+            segment.buf[0] = 1
+            assert wait_for_segment(segment, timeout=0.01) == 0
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def test_pickle_and_copy(self):
+        """Test that pickling and copying excludes cached values that can be recomputed."""
+        original = PicklingTest(name='a', assigned=[1])
+        original.lazy, original.cached, original.persistent
+        assert original.__dict__['lazy'] and original.__dict__['persistent']
+        for clone in (pickle.loads(pickle.dumps(original)), copy.copy(original), copy.deepcopy(original)):
+            assert clone == original
+            assert clone.assigned == [1]
+            assert 'lazy' not in clone.__dict__
+            assert 'cached' not in clone.__dict__
+            assert clone.__dict__['persistent'] == ['persistent']
+            assert clone.lazy == ['lazy']
+        # Shallow copies share values, deep copies don't.
+        assert copy.copy(original).assigned is original.assigned
+        assert copy.deepcopy(original).assigned is not original.assigned
+        # The original object is not modified.
+        assert 'lazy' in original.__dict__
+
+    def test_serialization(self):
+        """Test that :func:`.PropertyManager.to_dict()` and friends convert objects to and from plain data."""
+        class SerializationTest(PropertyManager):
+
+            @key_property
+            def name(self):
+                pass
+
+            @mutable_property
+            def assigned(self):
+                return 1
+
+            @lazy_property
+            def lazy(self):
+                return 2
+
+            @custom_property
+            def computed(self):
+                return 3
+
+            @mutable_property(repr=False)
+            def hidden(self):
+                return 4
+
+        instance = SerializationTest(name='a')
+        assert instance.to_dict(computed=False) == dict(name='a')
+        assert instance.to_dict() == dict(name='a', assigned=1, lazy=2, computed=3, hidden=4)
+        assert instance.to_dict(hidden=False) == dict(name='a', assigned=1, lazy=2, computed=3)
+        # Cached values are restored without calling the getter.
+        clone = SerializationTest.from_dict(dict(name='a', assigned=5, lazy=6, computed=7))
+        assert (clone.name, clone.assigned, clone.lazy, clone.computed) == ('a', 5, 6, 3)
+        self.assertRaises(TypeError, SerializationTest.from_dict, dict(name='a', unknown=1))
+        self.assertRaises(TypeError, SerializationTest.from_dict, dict(assigned=1))
+        # Bulk conversion.
+        objects = [SerializationTest(name='a'), SerializationTest(name='b', assigned=2)]
+        assert from_dicts(SerializationTest, to_dicts(objects)) == objects
+        assert [o.assigned for o in decode_json(SerializationTest, encode_json(objects))] == [1, 2]
+        if msgpack is None:
+            self.assertRaises(ImportError, encode_msgpack, objects)
+        else:
+            assert decode_msgpack(SerializationTest, encode_msgpack(objects)) == objects
+
+    def test_non_evaluating_validation(self):
+        """Test that :attr:`.PropertyManager.missing_properties` doesn't evaluate getters of assigned properties."""
+        evaluations = []
+
+        class ValidationTest(PropertyManager):
+
+            @key_property
+            def name(self):
+                """A key property without a default value."""
+
+            @required_property
+            def expensive(self):
+                evaluations.append('expensive')
+                return 42
+
+        instance = ValidationTest(name='a', expensive=1)
+        assert instance.missing_properties == []
+        assert evaluations == []
+        # Getters that don't do anything are never evaluated (this requires
+        # dis.get_instructions(), otherwise all getters are evaluated).
+        if property_manager.get_instructions is not None:
+            assert ValidationTest.property_schema().defaulted_properties == frozenset(['expensive'])
+        self.assertRaises(TypeError, ValidationTest, expensive=1)
+        # Getters that may provide a default value are evaluated when no value was assigned.
+        assert ValidationTest(name='b').expensive == 42
+        assert evaluations == ['expensive', 'expensive']
+
     def test_key_properties(self):
         """Test that :attr:`.PropertyManager.key_properties` reports only properties defined by subclasses."""
         class KeyPropertiesTest(PropertyManager):
@@ -321,6 +1249,196 @@ class PropertyManagerTestCase(unittest.TestCase):
         assert list(instance.key_properties) == ['one', 'two']
         assert instance.key_values == (('one', 1), ('two', 2))
 
+    def test_event_hooks(self):
+        """Test that :func:`.subscribe()` delivers structured events."""
+        class EventTest(PropertyManager):
+
+            @cached_property
+            def cached(self):
+                return 42
+
+            @mutable_property
+            def mutable(self):
+                return 13
+
+        events = []
+        instance = EventTest()
+        subscribe(events.append)
+        subscribe(log_event)
+        try:
+            assert instance.cached == 42
+            assert instance.cached == 42
+            instance.mutable = 1
+            del instance.mutable
+        finally:
+            unsubscribe(events.append)
+            unsubscribe(log_event)
+        assert instance.mutable == 13
+        assert [(e.name, e.operation, e.value) for e in events] == [
+            ('cached', 'computed', 42),
+            ('cached', 'cached', 42),
+            ('mutable', 'assigned', 1),
+            ('mutable', 'reset', None),
+        ]
+        assert all(e.instance is instance for e in events)
+        assert events[0].property is EventTest.cached
+        assert events[0].duration >= 0
+        assert events[1].duration is None
+
+    def test_statistics(self):
+        """Test that :func:`.enable_statistics()` and :func:`.stats()` count property operations."""
+        class StatisticsTest(PropertyManager):
+
+            @cached_property
+            def cached(self):
+                return 42
+
+            @mutable_property(environment_variable='PROPERTY_MANAGER_STATISTICS_TEST')
+            def mutable(self):
+                return 13
+
+        assert stats() == {}
+        enable_statistics()
+        try:
+            instance = StatisticsTest()
+            for i in range(3):
+                assert instance.cached == 42
+            del instance.cached
+            assert instance.cached == 42
+            instance.mutable = 1
+            del instance.mutable
+            os.environ['PROPERTY_MANAGER_STATISTICS_TEST'] = 'from environment'
+            assert instance.mutable == 'from environment'
+            os.environ.pop('PROPERTY_MANAGER_STATISTICS_TEST')
+            class_name = '%s.%s' % (__name__, 'StatisticsTest')
+            counters = stats()[class_name]
+            assert counters['cached']['hits'] == 2
+            assert counters['cached']['misses'] == 2
+            assert counters['cached']['resets'] == 1
+            assert counters['cached']['total_time'] >= counters['cached']['max_time'] > 0
+            assert counters['mutable']['assignments'] == 1
+            assert counters['mutable']['resets'] == 1
+            assert counters['mutable']['environment'] == 1
+            # Test the exporters.
+            text = format_prometheus()
+            assert '# TYPE property_manager_hits_total counter' in text
+            assert 'property_manager_hits_total{class="%s",property="cached"} 2' % class_name in text
+            metrics = []
+            export_statsd(lambda *args: metrics.append(args))
+            assert ('property_manager.%s.cached.misses' % class_name, 2, 'c') in metrics
+        finally:
+            disable_statistics()
+        assert stats() == {}
+
+    def test_memory_budget(self):
+        """Test that :func:`.enable_memory_budget()` evicts the least recently used cached values."""
+        class EvictionTest(PropertyManager):
+
+            computations = 0
+
+            @cached_property
+            def blob(self):
+                EvictionTest.computations += 1
+                return b'x' * 1000
+
+            @lazy_property
+            def lazy(self):
+                return b'x' * 1000
+
+        manager = enable_memory_budget(2500, sizeof=len)
+        try:
+            first, second, third = EvictionTest(), EvictionTest(), EvictionTest()
+            first.blob, second.blob
+            assert manager.total_size == 2000
+            # Make the first object's value the most recently used one.
+            first.blob
+            # The third value doesn't fit, so the second value is evicted.
+            third.blob
+            assert 'blob' in first.__dict__
+            assert 'blob' not in second.__dict__
+            assert 'blob' in third.__dict__
+            assert manager.evictions == 1
+            # Evicted values are recomputed when needed.
+            assert second.blob == b'x' * 1000
+            assert EvictionTest.computations == 4
+            # Lazy properties are never tracked.
+            first.lazy
+            assert len(manager) == 2
+            # Owners are not kept alive.
+            del first, second, third
+            assert len(manager) == 0
+            assert manager.total_size == 0
+
+            # Values loaded from a shared table are tracked as well.
+            class SharedEvictionTest(PropertyManager):
+
+                computations = 0
+
+                @key_property
+                def name(self):
+                    pass
+
+                @cached_property(scope='key')
+                def blob(self):
+                    SharedEvictionTest.computations += 1
+                    return b'y' * 1000
+
+            first, second = SharedEvictionTest(name='a'), SharedEvictionTest(name='a')
+            assert first.blob is second.blob
+            assert len(manager) == 2
+            assert SharedEvictionTest.computations == 1
+            # Evicted values are loaded from the shared table again.
+            manager.evict()
+            assert len(manager) == 1
+            assert first.blob is second.blob
+            assert len(manager) == 2
+            assert SharedEvictionTest.computations == 1
+        finally:
+            disable_memory_budget()
+
+    def test_property_schema(self):
+        """Test that :func:`.PropertyManager.property_schema()` describes properties without an instance."""
+        class SchemaParent(PropertyManager):
+
+            @key_property
+            def name(self):
+                pass
+
+            @cached_property(environment_variable='PROPERTY_MANAGER_SCHEMA_TEST')
+            def cached(self):
+                return 42
+
+        class SchemaChild(SchemaParent):
+
+            @mutable_property(repr=False)
+            def secret(self):
+                pass
+
+        schema = SchemaChild.property_schema()
+        assert schema is SchemaChild.property_schema()
+        assert schema is not SchemaParent.property_schema()
+        assert schema.owner is SchemaChild
+        assert 'secret' not in SchemaParent.property_schema().names
+        info = dict((p.name, p) for p in schema.properties)
+        assert info['name'].variant == 'key_property'
+        assert info['name'].owner is SchemaParent
+        assert info['name'].key and info['name'].required and not info['name'].writable
+        assert info['cached'].environment_variable == 'PROPERTY_MANAGER_SCHEMA_TEST'
+        assert info['cached'].cached and info['cached'].resettable
+        assert info['secret'].owner is SchemaChild
+        assert info['secret'].repr is False
+        # Plain properties are included but don't have any options.
+        assert info['key_values'].variant == 'property'
+        assert info['key_values'].key is None
+        assert schema.key_properties == ('name',)
+        assert schema.resettable_cached_properties == ('cached',)
+        # Make sure the schema agrees with the reflection based API.
+        instance = SchemaChild(name='example')
+        for options in dict(), dict(key=True), dict(repr=True), dict(repr=False), dict(writable=False):
+            assert [p.name for p in schema.find(**options)] == [
+                n for n in dir(instance) if instance.have_property(n, **options)
+            ]
+
     def test_hashable_objects(self):
         """Test that :attr:`.PropertyManager.__hash__` works properly."""
         class HashableObject(PropertyManager):
@@ -396,7 +1514,9 @@ class PropertyManagerTestCase(unittest.TestCase):
                 self.callbacks.setdefault(event, []).append(callback)
 
         app = FakeApp()
-        setup(app)
+        metadata = setup(app)
+        assert metadata['parallel_read_safe'] is True
+        assert metadata['parallel_write_safe'] is True
         assert append_property_docs in app.callbacks['autodoc-process-docstring']
         lines = ["Some boring description."]
         obj = TypeInspector
@@ -412,6 +1532,56 @@ class PropertyManagerTestCase(unittest.TestCase):
             set the value of the :attr:`type` property by passing a keyword
             argument to the class initializer.
         """)
+        # Make sure the generated documentation is reused.
+        assert render_property_docs(obj) is render_property_docs(obj)
+        more_lines = []
+        append_property_docs(app=app, what=None, name=None, obj=obj, options=None, lines=more_lines)
+        assert more_lines == lines[2:]
+
+    def test_sphinx_incremental_builds(self):
+        """Test that :mod:`property_manager.sphinx` reuses documentation cached in the build environment."""
+        def create_class(**options):
+            class CachedDocumentation(PropertyManager):
+                @custom_property(**options)
+                def example(self):
+                    pass
+            return CachedDocumentation
+
+        class FakeEnvironment(object):
+            pass
+
+        env = FakeEnvironment()
+        cache = get_docs_cache(env)
+        assert get_docs_cache(env) is cache
+        original = create_class(writable=True)
+        lines = render_property_docs(original, cache)
+        assert cache[fingerprint_type(original)] == lines
+        # Make sure an identical class is documented using the cache.
+        identical = create_class(writable=True)
+        assert fingerprint_type(identical) == fingerprint_type(original)
+        assert render_property_docs(identical, cache) is lines
+        # Make sure changed property options invalidate the cache.
+        changed = create_class(writable=True, required=True)
+        assert fingerprint_type(changed) != fingerprint_type(original)
+        assert render_property_docs(changed, cache) != lines
+        # Make sure changed superclasses invalidate the cache.
+        subclass = type('CachedDocumentation', (original,), dict(original.__dict__))
+        assert fingerprint_type(subclass) != fingerprint_type(original)
+        # Make sure caches of parallel processes are merged.
+        other = FakeEnvironment()
+        get_docs_cache(other)['fake'] = ('fake',)
+        merge_property_docs(None, env, [], other)
+        assert cache['fake'] == ('fake',)
+
+    def test_benchmarks(self):
+        """Test that the benchmarks work and regressions are detected."""
+        results = dict(results=benchmark_operations(number=1))
+        assert results['results']['get_cached_hit'] > 0
+        assert benchmark_pickle(number=1, payload=10)['pickle_bytes'] > 0
+        slower = dict(results=dict((k, v * 2) for k, v in results['results'].items()))
+        assert not compare_results(results, results)
+        assert not compare_results(results, slower)
+        assert sorted(compare_results(slower, results)) == sorted(results['results'])
 
     def test_init_sorting(self):
         """Make sure __init__() is sorted before other special methods."""
@@ -419,6 +1589,34 @@ class PropertyManagerTestCase(unittest.TestCase):
         assert inspector.special_methods[0] == '__init__'
 
 
+class PicklingTest(PropertyManager):
+
+    """A :class:`.PropertyManager` subclass that can be pickled (used by :func:`test_pickle_and_copy()`)."""
+
+    @key_property
+    def name(self):
+        """A key property."""
+
+    @mutable_property
+    def assigned(self):
+        """A mutable property."""
+
+    @lazy_property
+    def lazy(self):
+        """A lazy property."""
+        return ['lazy']
+
+    @cached_property
+    def cached(self):
+        """A cached property."""
+        return ['cached']
+
+    @cached_property(persistent=True)
+    def persistent(self):
+        """A cached property whose value is pickled."""
+        return ['persistent']
+
+
 class PropertyInspector(object):
 
     """Introspecting properties with properties (turtles all the way down)."""